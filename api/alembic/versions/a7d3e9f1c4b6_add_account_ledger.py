@@ -0,0 +1,50 @@
+"""add account_ledger running balances
+
+Revision ID: a7d3e9f1c4b6
+Revises: f3a9c7e2b5d8
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9f1c4b6'
+down_revision: Union[str, Sequence[str], None] = 'f3a9c7e2b5d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('account_ledger',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('delta', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('balance', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('account_id', 'date', name='uq_account_ledger_account_date')
+    )
+
+    # Backfill from the existing transactions
+    op.execute(
+        "INSERT INTO account_ledger (account_id, date, delta, balance) "
+        "SELECT account_id, date, delta, SUM(delta) OVER (PARTITION BY account_id ORDER BY date) "
+        "FROM ("
+        "  SELECT account_id, date, SUM(amount) AS delta FROM ("
+        "    SELECT account_id, date, amount FROM incomes WHERE deleted_at IS NULL"
+        "    UNION ALL"
+        "    SELECT account_id, date, -amount FROM expenses WHERE deleted_at IS NULL"
+        "  ) movements GROUP BY account_id, date HAVING SUM(amount) <> 0"
+        ") daily"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('account_ledger')
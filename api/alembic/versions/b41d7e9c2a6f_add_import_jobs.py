@@ -0,0 +1,60 @@
+"""add import_jobs
+
+Revision ID: b41d7e9c2a6f
+Revises: 0dd2bb545706
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41d7e9c2a6f'
+down_revision: Union[str, Sequence[str], None] = '0dd2bb545706'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+import_job_status = sa.Enum('QUEUED', 'RUNNING', 'COMPLETED', 'FAILED', name='importjobstatusenum')
+json_type = sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), 'postgresql')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('import_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('status', import_job_status, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('payload', json_type, nullable=True),
+    sa.Column('total_rows', sa.Integer(), nullable=False),
+    sa.Column('processed_rows', sa.Integer(), nullable=False),
+    sa.Column('inserted', sa.Integer(), nullable=False),
+    sa.Column('duplicates', sa.Integer(), nullable=False),
+    sa.Column('uncategorized', sa.Integer(), nullable=False),
+    sa.Column('errors', json_type, nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('import_jobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_import_jobs_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_import_jobs_user_id'), ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('import_jobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_import_jobs_user_id'))
+        batch_op.drop_index(batch_op.f('ix_import_jobs_status'))
+
+    op.drop_table('import_jobs')
+    import_job_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,43 @@
+"""add investment_positions snapshots
+
+Revision ID: b8e4f2a6d1c9
+Revises: a7d3e9f1c4b6
+Create Date: 2026-10-18 22:00:00.000000
+
+The snapshots come from replaying the logs (FIFO lots), which SQL alone
+cannot do: populate existing data after upgrading with
+    python scripts/maintenance.py rebuild-investment-positions
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4f2a6d1c9'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e9f1c4b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('investment_positions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('investment_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('units', sa.Numeric(precision=18, scale=6), nullable=False),
+    sa.Column('cost_basis', sa.Numeric(precision=18, scale=6), nullable=False),
+    sa.Column('realized_pnl', sa.Numeric(precision=18, scale=6), nullable=False),
+    sa.Column('market_value', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('lots', sa.JSON(), nullable=False),
+    sa.ForeignKeyConstraint(['investment_id'], ['investments.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('investment_id', 'date', name='uq_investment_positions_investment_date')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('investment_positions')
@@ -0,0 +1,37 @@
+"""recompute savings_logs.total_amount running totals
+
+Revision ID: c5d1f7a3e9b2
+Revises: b8e4f2a6d1c9
+Create Date: 2026-10-18 23:00:00.000000
+
+total_amount used to be sent by the client; it is now the running total
+of each saving, maintained incrementally from this state.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d1f7a3e9b2'
+down_revision: Union[str, Sequence[str], None] = 'b8e4f2a6d1c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "UPDATE savings_logs SET total_amount = running.total "
+        "FROM ("
+        "  SELECT id, SUM(amount) OVER (PARTITION BY saving_id ORDER BY date, id) AS total "
+        "  FROM savings_logs WHERE deleted_at IS NULL"
+        ") AS running "
+        "WHERE savings_logs.id = running.id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The client-sent totals are not kept; the recomputed ones stay valid
+    pass
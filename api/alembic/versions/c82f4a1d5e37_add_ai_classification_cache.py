@@ -0,0 +1,47 @@
+"""add ai_classification_cache
+
+Revision ID: c82f4a1d5e37
+Revises: b41d7e9c2a6f
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c82f4a1d5e37'
+down_revision: Union[str, Sequence[str], None] = 'b41d7e9c2a6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ai_classification_cache',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('type', sa.String(length=20), nullable=False),
+    sa.Column('description_key', sa.String(length=500), nullable=False),
+    sa.Column('category_version', sa.String(length=64), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=True),
+    sa.Column('suggested_new_category', sa.String(length=100), nullable=True),
+    sa.Column('hits', sa.Integer(), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('type', 'description_key', 'category_version', name='uq_ai_cache_key')
+    )
+    with op.batch_alter_table('ai_classification_cache', schema=None) as batch_op:
+        batch_op.create_index('idx_ai_cache_last_used', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('ai_classification_cache', schema=None) as batch_op:
+        batch_op.drop_index('idx_ai_cache_last_used')
+
+    op.drop_table('ai_classification_cache')
@@ -0,0 +1,45 @@
+"""add daily_summary rollup
+
+Revision ID: d4a7e1b9c3f2
+Revises: c82f4a1d5e37
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7e1b9c3f2'
+down_revision: Union[str, Sequence[str], None] = 'c82f4a1d5e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('daily_summary',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('type', sa.String(length=20), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('date', 'type', 'category_id', name='uq_daily_summary_key')
+    )
+
+    # Backfill from the existing transactions
+    for type_, table in (('expense', 'expenses'), ('income', 'incomes'), ('investment', 'investments')):
+        op.execute(
+            f"INSERT INTO daily_summary (date, type, category_id, total, count) "
+            f"SELECT date, '{type_}', category_id, SUM(amount), COUNT(id) FROM {table} "
+            f"WHERE deleted_at IS NULL GROUP BY date, category_id"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_summary')
@@ -0,0 +1,56 @@
+"""add keyset pagination indexes
+
+Revision ID: e6b2f8c4d1a9
+Revises: d4a7e1b9c3f2
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b2f8c4d1a9'
+down_revision: Union[str, Sequence[str], None] = 'd4a7e1b9c3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    'expenses': {
+        'idx_expenses_date_id': ['date', 'id'],
+        'idx_expenses_account_date_id': ['account_id', 'date', 'id'],
+        'idx_expenses_category_date_id': ['category_id', 'date', 'id'],
+        'idx_expenses_card_date_id': ['card_id', 'date', 'id'],
+    },
+    'incomes': {
+        'idx_incomes_date_id': ['date', 'id'],
+        'idx_incomes_account_date_id': ['account_id', 'date', 'id'],
+        'idx_incomes_category_date_id': ['category_id', 'date', 'id'],
+    },
+    'investments': {
+        'idx_investments_date_id': ['date', 'id'],
+        'idx_investments_account_date_id': ['account_id', 'date', 'id'],
+        'idx_investments_category_date_id': ['category_id', 'date', 'id'],
+    },
+    'savings_logs': {
+        'idx_savings_logs_date_id': ['date', 'id'],
+        'idx_savings_logs_saving_date_id': ['saving_id', 'date', 'id'],
+    },
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, indexes in INDEXES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for index_name, columns in indexes.items():
+                batch_op.create_index(index_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, indexes in INDEXES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for index_name in indexes:
+                batch_op.drop_index(index_name)
@@ -0,0 +1,43 @@
+"""add fuzzy dedup indexes
+
+Revision ID: f3a9c7e2b5d8
+Revises: e6b2f8c4d1a9
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c7e2b5d8'
+down_revision: Union[str, Sequence[str], None] = 'e6b2f8c4d1a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    'expenses': ('idx_expenses_account_amount_date', ['account_id', 'amount', 'date']),
+    'incomes': ('idx_incomes_account_amount_date', ['account_id', 'amount', 'date']),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, (index_name, columns) in INDEXES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(index_name, columns, unique=False)
+
+    with op.batch_alter_table('import_jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('possible_duplicates', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('import_jobs', schema=None) as batch_op:
+        batch_op.drop_column('possible_duplicates')
+
+    for table, (index_name, _) in INDEXES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(index_name)
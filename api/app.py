@@ -1,37 +1,116 @@
-from flask import Flask, request
+from contextlib import ExitStack
+
+from flask import Flask, request, g
 from flask_babel import Babel
 from dotenv import load_dotenv
 from werkzeug.exceptions import HTTPException
+from werkzeug.middleware.proxy_fix import ProxyFix
 from flask_cors import CORS
 from sqlalchemy.exc import TimeoutError as SQLAlchemyTimeoutError
-from flask_jwt_extended import JWTManager, verify_jwt_in_request
+from flask_jwt_extended import JWTManager, get_jwt_identity, verify_jwt_in_request
 
-from db.database import init_db, remove_db_session
-from routers import register_blueprints
-from config import DevelopmentConfig
+from db.database import get_db, init_db, remove_db_session
+from routers import disabled_router_groups, register_blueprints
+from config import DevelopmentConfig, get_config
 from services.logs.logger_service import setup_logger
+from services.auth.principal_service import get_principal
+from services.core.query_budget_service import install_query_budget_listener, query_budget
+from services.core.rate_limit_service import limiter
+from services.core.metrics_service import (
+    TimedJSONProvider,
+    end_request,
+    metrics_registry,
+    server_timing_header,
+    start_request,
+)
 
 load_dotenv()
 logger = setup_logger("main")
 
 
 def _is_public_path(app: Flask, path: str) -> bool:
+    # /system/metrics is not listed: it exposes per-endpoint traffic
     public_prefixes = (
         f"{app.config['PREFIX']}/auth",
-        f"{app.config['PREFIX']}/system",
+        f"{app.config['PREFIX']}/system/ready",
     )
     return path.startswith(public_prefixes)
 
 
+def _register_metrics(app: Flask) -> None:
+    """Time every request (SQL, JSON, total) into Server-Timing and the metrics registry."""
+    app.json = TimedJSONProvider(app)
+
+    @app.before_request
+    def start_metrics():
+        start_request()
+
+    @app.after_request
+    def record_metrics(response):
+        metrics = end_request()
+        if metrics is None:
+            return response
+        elapsed = metrics.elapsed()
+        response.headers["Server-Timing"] = server_timing_header(metrics, elapsed)
+        # Unmatched URLs share one label to keep the series count bounded
+        metrics_registry.record(request.endpoint or "unmatched", request.method,
+                                response.status_code, metrics, elapsed)
+        return response
+
+
+def _register_query_budget(app: Flask) -> None:
+    """Log requests that exceed the configured statement / repeated-shape budget."""
+    max_statements = app.config.get("QUERY_BUDGET_STATEMENTS") or None
+    max_repeats = app.config.get("QUERY_BUDGET_REPEATS") or None
+    install_query_budget_listener()
+
+    @app.before_request
+    def open_query_budget():
+        g.query_budget_scope = ExitStack()
+        g.query_budget = g.query_budget_scope.enter_context(
+            query_budget(max_statements, max_repeats, on_exceed="warn", label=request.endpoint or request.path)
+        )
+
+    @app.teardown_request
+    def close_query_budget(_exception=None):
+        scope = g.pop("query_budget_scope", None)
+        if scope is not None:
+            scope.close()
+
+
+def _start_import_jobs() -> None:
+    """Resume queued and orphaned import jobs in this process and keep sweeping for new ones."""
+    from services.imports.import_job_service import import_job_runner
+    import_job_runner.start()
+
+
 def create_app(config_class=DevelopmentConfig) -> Flask:
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    hops = app.config.get("PROXY_FIX_HOPS", 0)
+    if hops:
+        # remote_addr is the client, not nginx: per-IP rate limits depend on it
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops)
+
     JWTManager(app)
+    limiter.init_app(app)
 
     if app.config.get("INIT_DB_ON_STARTUP", False):
         init_db()
 
+    if app.config.get("METRICS_ENABLED", True):
+        _register_metrics(app)
+
+    disabled_groups = disabled_router_groups()
+
+    # A process that does not serve imports does not run their jobs either
+    if app.config.get("IMPORT_JOBS_ENABLED", True) and "imports" not in disabled_groups:
+        _start_import_jobs()
+
+    if app.config.get("QUERY_BUDGET_STATEMENTS") or app.config.get("QUERY_BUDGET_REPEATS"):
+        _register_query_budget(app)
+
     @app.before_request
     def global_auth():
         if _is_public_path(app, request.path):
@@ -39,6 +118,11 @@ def create_app(config_class=DevelopmentConfig) -> Flask:
         if request.method == "OPTIONS":
             return
         verify_jwt_in_request()
+        # Cached: role checks below this point cost no DB round trip
+        principal = get_principal(next(get_db()), get_jwt_identity())
+        if principal is None or not principal.active:
+            return {"msg": "User is inactive or no longer exists"}, 401
+        g.principal = principal
 
     @app.teardown_appcontext
     def shutdown_session(_exception=None):
@@ -55,7 +139,7 @@ def create_app(config_class=DevelopmentConfig) -> Flask:
         return request.args.get('lang') or request.accept_languages.best_match(app.config['LANGUAGES'].keys())
 
     Babel(app, locale_selector=get_locale)
-    register_blueprints(app, url_prefix=app.config['PREFIX'])
+    register_blueprints(app, url_prefix=app.config['PREFIX'], disabled_groups=disabled_groups)
 
     @app.errorhandler(Exception)
     def handle_exception(e):
@@ -69,7 +153,7 @@ def create_app(config_class=DevelopmentConfig) -> Flask:
     return app
 
 
-app = create_app()
+app = create_app(get_config())
 
 
 if __name__ == "__main__":
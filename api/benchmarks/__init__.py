@@ -0,0 +1 @@
+"""Reproducible performance benchmarks for the API hot paths."""
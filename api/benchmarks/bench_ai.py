@@ -0,0 +1,143 @@
+"""
+Benchmark: TransactionAIService.classify against a stub LLM server.
+
+A local HTTP server answers the OpenAI-style chat completion requests with a
+classification for every transaction id found in the prompt, after an
+optional simulated latency. This measures what the service controls
+(chunking, parallel slots, prediction cache) without a real model. Each
+transaction count is timed twice: with an empty cache and with a warm one.
+
+Usage (from api/):
+    python -m benchmarks.bench_ai --transactions 100 1000 --latency-ms 200
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+from benchmarks.data_generator import (
+    create_bench_engine,
+    generate_expense_payloads,
+    new_session,
+    reset_schema,
+    seed_reference_data,
+)
+from services.ai import transaction_ai_service
+from services.ai.transaction_ai_service import TransactionAIService
+
+_TRANSACTIONS = re.compile(r"Transactions: (\[.*?\])\n", re.DOTALL)
+_CATEGORIES = re.compile(r"Available categories: (\[.*?\])\n", re.DOTALL)
+
+
+def _stub_handler(latency: float):
+
+    class StubLLMHandler(BaseHTTPRequestHandler):
+        calls = 0
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            prompt = body["messages"][-1]["content"]
+            transactions = json.loads(_TRANSACTIONS.search(prompt).group(1))
+            categories = json.loads(_CATEGORIES.search(prompt).group(1))
+            type(self).calls += 1
+            if latency:
+                time.sleep(latency)
+
+            content = json.dumps({"classifications": [
+                {
+                    "id": tx["id"],
+                    "category": categories[i % len(categories)]["name"] if categories else None,
+                    "suggested_new_category": None,
+                }
+                for i, tx in enumerate(transactions)
+            ]})
+            answer = json.dumps({"choices": [{"finish_reason": "stop", "message": {"content": content}}]})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(answer.encode("utf-8"))
+
+        def log_message(self, *args):
+            pass
+
+    return StubLLMHandler
+
+
+@contextmanager
+def stub_llm_server(latency: float = 0.0):
+    """Serve the stub on a free local port and point the AI service at it."""
+    handler = _stub_handler(latency)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    previous_url = transaction_ai_service.AI_SERVICE_URL
+    transaction_ai_service.AI_SERVICE_URL = f"http://127.0.0.1:{server.server_port}/v1/chat/completions"
+    try:
+        yield handler
+    finally:
+        transaction_ai_service.AI_SERVICE_URL = previous_url
+        server.shutdown()
+        server.server_close()
+
+
+def run(transaction_counts: List[int], latency_ms: float = 0.0,
+        database_url: Optional[str] = None, seed: int = 42) -> List[dict]:
+    engine = create_bench_engine(database_url)
+    results = []
+    try:
+        with stub_llm_server(latency_ms / 1000) as handler:
+            for count in transaction_counts:
+                reset_schema(engine)
+                db = new_session(engine)
+                try:
+                    seed_reference_data(db, rules=0, seed=seed)
+                    transactions = [
+                        {"id": i, "type": "expense", "description": payload["description"], "amount": payload["amount"]}
+                        for i, payload in enumerate(
+                            generate_expense_payloads(count, start=date(2024, 1, 1), days=365, seed=seed)
+                        )
+                    ]
+                    result = {"benchmark": "ai_classify", "transactions": count, "latency_ms": latency_ms}
+                    for phase in ("cold", "warm"):
+                        handler.calls = 0
+                        start = time.perf_counter()
+                        predictions = TransactionAIService(db).classify(transactions, rules=[])
+                        result[f"{phase}_seconds"] = round(time.perf_counter() - start, 4)
+                        result[f"{phase}_llm_calls"] = handler.calls
+                    result["classified"] = sum(1 for p in predictions if p["category"])
+                    results.append(result)
+                finally:
+                    db.close()
+    finally:
+        engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="Simulated LLM latency per request")
+    parser.add_argument("--database-url", default=None, help="Disposable database (default: temp SQLite file)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.transactions, args.latency_ms, args.database_url, args.seed)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'txs':>6} {'cold s':>8} {'calls':>6} {'warm s':>8} {'calls':>6} {'classified':>11}")
+    for r in results:
+        print(f"{r['transactions']:>6} {r['cold_seconds']:>8} {r['cold_llm_calls']:>6} "
+              f"{r['warm_seconds']:>8} {r['warm_llm_calls']:>6} {r['classified']:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark: rule-based categorization, sequential loop vs compiled rule engine.
+
+Compares the previous per-transaction loop of CategorizationService.categorize_batch
+(one rule fetch per row, then re.search over every raw pattern in priority
+order) against the current single-pass engine (Aho-Corasick for literal rules,
+one combined alternation for regex rules). Rules are synthetic and served from
+memory, so only matching cost is measured.
+
+Usage (from api/):
+    python -m benchmarks.bench_categorization --rules 50 200 500 --rows 5000
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import List
+
+from models import CategoryRule, TransactionEnum
+from services.category_rules.categorization_service import CategorizationService
+from services.category_rules.rule_engine import rule_set_cache
+
+MERCHANT_WORDS = [
+    "mercadona", "carrefour", "lidl", "aldi", "amazon", "repsol", "cepsa", "iberdrola",
+    "endesa", "movistar", "vodafone", "netflix", "spotify", "renfe", "iberia", "zara",
+    "primark", "decathlon", "ikea", "leroy", "farmacia", "parking", "gimnasio", "uber",
+]
+CITIES = ["madrid", "barcelona", "valencia", "sevilla", "bilbao", "malaga"]
+
+
+class _InMemoryRuleRepository:
+    """Stands in for CategoryRuleRepository so no database is involved."""
+
+    def __init__(self, rules: List[CategoryRule]):
+        self.rules = rules
+
+    def get_active_by_type(self, transaction_type):
+        return [r for r in self.rules if r.type == transaction_type]
+
+
+def build_rules(count: int, regex_ratio: float, seed: int) -> List[CategoryRule]:
+    rng = random.Random(seed)
+    rules = []
+    for i in range(count):
+        word = f"{rng.choice(MERCHANT_WORDS)}{i}"
+        if rng.random() < regex_ratio:
+            pattern = rf"{word}\s+(?:{rng.choice(CITIES)}|\d{{3,}})"
+        else:
+            pattern = word
+        rules.append(CategoryRule(
+            id=i + 1,
+            name=f"rule {i}",
+            pattern=pattern,
+            type=TransactionEnum.EXPENSE,
+            priority=count - i,
+            is_active=True,
+            ignore_in_analysis=False,
+            category_id=rng.randint(1, 40),
+        ))
+    return rules
+
+
+def build_transactions(rules: List[CategoryRule], rows: int, hit_ratio: float, seed: int) -> List[dict]:
+    rng = random.Random(seed + 1)
+    transactions = []
+    for _ in range(rows):
+        if rng.random() < hit_ratio:
+            keyword = rng.choice(rules).pattern.split("\\")[0]
+            description = f"COMPRA TARJ {keyword.upper()} {rng.choice(CITIES).upper()} {rng.randint(100, 9999)}"
+        else:
+            description = f"TRANSFERENCIA {rng.choice(CITIES).upper()} REF {rng.randint(10**6, 10**7)}"
+        transactions.append({"description": description, "type": "expense"})
+    return transactions
+
+
+def legacy_categorize_batch(repository: _InMemoryRuleRepository, transactions: List[dict]) -> List[dict]:
+    """Previous behavior: rules re-fetched per row, raw patterns searched one by one."""
+    result = []
+    for transaction in transactions:
+        category_id, ignore = None, False
+        for rule in repository.get_active_by_type(TransactionEnum(transaction["type"])):
+            if rule.matches(transaction["description"]):
+                category_id, ignore = rule.category_id, bool(rule.ignore_in_analysis)
+                break
+        result.append({**transaction, "category_id": category_id, "ignore_in_analysis": ignore})
+    return result
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    value = fn(*args)
+    return value, time.perf_counter() - start
+
+
+def run(rule_counts: List[int], rows: int, regex_ratio: float, hit_ratio: float, seed: int) -> List[dict]:
+    results = []
+    for count in rule_counts:
+        rules = build_rules(count, regex_ratio, seed)
+        transactions = build_transactions(rules, rows, hit_ratio, seed)
+        repository = _InMemoryRuleRepository(rules)
+
+        legacy, legacy_seconds = _timed(legacy_categorize_batch, repository, [dict(t) for t in transactions])
+
+        rule_set_cache.invalidate()
+        service = CategorizationService(db=None)
+        service.rule_repository = repository
+        engine, engine_seconds = _timed(service.categorize_batch, [dict(t) for t in transactions])
+
+        mismatches = sum(
+            1 for old, new in zip(legacy, engine) if old["category_id"] != new["category_id"]
+        )
+        results.append({
+            "benchmark": "categorize_batch",
+            "rules": count,
+            "rows": rows,
+            "legacy_seconds": round(legacy_seconds, 4),
+            "engine_seconds": round(engine_seconds, 4),
+            "speedup": round(legacy_seconds / engine_seconds, 2) if engine_seconds else None,
+            "mismatches": mismatches,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rules", type=int, nargs="+", default=[10, 50, 200, 500])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--regex-ratio", type=float, default=0.1)
+    parser.add_argument("--hit-ratio", type=float, default=0.7)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.rules, args.rows, args.regex_ratio, args.hit_ratio, args.seed)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'rules':>6} {'rows':>7} {'legacy s':>10} {'engine s':>10} {'speedup':>8} {'mismatch':>9}")
+    for r in results:
+        print(f"{r['rules']:>6} {r['rows']:>7} {r['legacy_seconds']:>10} {r['engine_seconds']:>10} "
+              f"{r['speedup']:>8} {r['mismatches']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: ImportService.import_transactions_atomic at increasing batch sizes.
+
+Every size runs on a freshly created schema (reference data + rules only) so
+the dedup lookups and inserts of one size do not affect the next. Half the
+rows come uncategorized to exercise the rule-based categorization step.
+
+Usage (from api/):
+    python -m benchmarks.bench_import --sizes 1000 10000 100000
+    python -m benchmarks.bench_import --database-url postgresql+psycopg2://.../economy_bench
+"""
+
+import argparse
+import json
+import time
+from datetime import date
+from typing import List, Optional
+
+from benchmarks.data_generator import (
+    create_bench_engine,
+    generate_expense_payloads,
+    new_session,
+    reset_schema,
+    seed_reference_data,
+)
+from schemas.imports.import_schema import BulkImportRequest
+from services.category_rules.rule_engine import rule_set_cache
+from services.core.query_budget_service import query_budget
+from services.imports.import_service import ImportService
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+def run(sizes: List[int], database_url: Optional[str] = None, rules: int = 100, seed: int = 42) -> List[dict]:
+    engine = create_bench_engine(database_url)
+    results = []
+    try:
+        for rows in sizes:
+            reset_schema(engine)
+            db = new_session(engine)
+            try:
+                seed_reference_data(db, rules=rules, seed=seed)
+                rule_set_cache.invalidate()
+                payloads = generate_expense_payloads(rows, start=date(2024, 1, 1), days=365, seed=seed)
+                for i, payload in enumerate(payloads):
+                    if i % 2:
+                        payload["category_id"] = None
+
+                start = time.perf_counter()
+                request = BulkImportRequest(expenses=payloads, auto_categorize=True)
+                validated = time.perf_counter()
+                with query_budget(on_exceed="warn", label="bench_import") as budget:
+                    result = ImportService(db).import_transactions_atomic(request)
+                finished = time.perf_counter()
+            finally:
+                db.close()
+
+            results.append({
+                "benchmark": "import_transactions_atomic",
+                "rows": rows,
+                "rules": rules,
+                "validate_seconds": round(validated - start, 4),
+                "import_seconds": round(finished - validated, 4),
+                "rows_per_second": round(rows / (finished - start)) if finished > start else None,
+                "statements": budget.count,
+                "inserted": result["inserted"],
+                "duplicates": result["duplicates"],
+            })
+    finally:
+        engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--database-url", default=None, help="Disposable database (default: temp SQLite file)")
+    parser.add_argument("--rules", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.database_url, args.rules, args.seed)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'rows':>8} {'validate s':>11} {'import s':>10} {'rows/s':>9} {'stmts':>7} {'inserted':>9}")
+    for r in results:
+        print(f"{r['rows']:>8} {r['validate_seconds']:>11} {r['import_seconds']:>10} "
+              f"{r['rows_per_second']:>9} {r['statements']:>7} {r['inserted']:>9}")
+
+
+if __name__ == "__main__":
+    main()
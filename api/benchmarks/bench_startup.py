@@ -0,0 +1,112 @@
+"""
+Benchmark: cold start of the app and of the CLI scripts.
+
+Each target runs in a fresh interpreter with `python -X importtime`; the
+report keeps the best wall time of --repeat runs, the cumulative import
+time of the target module and the slowest packages below it, so a change
+that pulls a heavy dependency into startup shows up by name.
+
+Targets:
+- wsgi: what a gunicorn worker does on boot (ProductionConfig, no DB init)
+- wsgi-core: the same with DISABLED_ROUTER_GROUPS=ai,imports
+- maintenance: scripts/maintenance.py --help
+
+Usage (from api/):
+    python -m benchmarks.bench_startup --repeat 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# target -> (interpreter arguments, extra environment)
+TARGETS = {
+    "wsgi": (["-c", "import wsgi"], {}),
+    "wsgi-core": (["-c", "import wsgi"], {"DISABLED_ROUTER_GROUPS": "ai,imports"}),
+    "maintenance": (["scripts/maintenance.py", "--help"], {}),
+}
+TOP_PACKAGES = 8
+
+
+def _environment() -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update({
+        "PYTHONPATH": ".",
+        "APP_CONFIG": "production",
+        "DB_ENGINE": env.get("DB_ENGINE", "sqlite"),
+        "DATABASE_PATH": env.get("DATABASE_PATH", os.path.join(tempfile.gettempdir(), "economy_startup.db")),
+        "JWT_SECRET_KEY": env.get("JWT_SECRET_KEY", "bench-startup"),
+    })
+    return env
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) of every `import time:` line."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        modules.append((module.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def _top_packages(modules: List[Tuple[str, int, int]]) -> List[dict]:
+    by_package: Dict[str, int] = defaultdict(int)
+    for module, self_us, _ in modules:
+        by_package[module.split(".")[0]] += self_us
+    ranked = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:TOP_PACKAGES]
+    return [{"package": package, "ms": round(us / 1000, 1)} for package, us in ranked]
+
+
+def run(repeat: int = 5) -> List[dict]:
+    env = _environment()
+    results = []
+    for target, (args, extra_env) in TARGETS.items():
+        best_wall, best_modules = None, []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            completed = subprocess.run(
+                [sys.executable, "-X", "importtime", *args],
+                env={**env, **extra_env}, capture_output=True, text=True, check=True,
+            )
+            wall = time.perf_counter() - start
+            if best_wall is None or wall < best_wall:
+                best_wall, best_modules = wall, parse_importtime(completed.stderr)
+
+        results.append({
+            "benchmark": "startup",
+            "target": target,
+            "wall_seconds": round(best_wall, 4),
+            "import_seconds": round(sum(self_us for _, self_us, _ in best_modules) / 1e6, 4),
+            "modules": len(best_modules),
+            "top_packages": _top_packages(best_modules),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for r in results:
+        packages = ", ".join(f"{p['package']} {p['ms']}ms" for p in r["top_packages"])
+        print(f"{r['target']:<12} wall {r['wall_seconds']:.3f}s  imports {r['import_seconds']:.3f}s "
+              f"({r['modules']} modules)  {packages}")
+
+
+if __name__ == "__main__":
+    main()
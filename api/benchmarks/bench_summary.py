@@ -0,0 +1,107 @@
+"""
+Benchmark: SummaryService.get_summary over a week, a month and a year.
+
+Loads N years of synthetic history, rebuilds the daily_summary rollup and
+times every window twice: against the raw transaction tables and against
+the rollup. Each measurement is the best of --repeat runs.
+
+Usage (from api/):
+    python -m benchmarks.bench_summary --years 3 --per-day 20
+"""
+
+import argparse
+import json
+import time
+from datetime import date, timedelta
+from typing import List, Optional
+
+from benchmarks.data_generator import (
+    create_bench_engine,
+    load_transactions,
+    new_session,
+    reset_schema,
+    seed_reference_data,
+)
+from services.core.query_budget_service import query_budget
+from services.summaries.daily_summary_service import DailySummaryService
+from services.summaries.summary_service import SummaryService
+
+WINDOWS = {"week": 7, "month": 30, "year": 365}
+BENCH_END_DATE = date(2025, 12, 31)
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(years: int = 3, per_day: int = 20, database_url: Optional[str] = None,
+        repeat: int = 5, seed: int = 42) -> List[dict]:
+    engine = create_bench_engine(database_url)
+    db = new_session(engine)
+    try:
+        reset_schema(engine)
+        seed_reference_data(db, rules=0, seed=seed)
+        loaded = time.perf_counter()
+        rows = load_transactions(db, years=years, per_day=per_day, end=BENCH_END_DATE, seed=seed)
+        loaded = time.perf_counter() - loaded
+
+        rebuilt = time.perf_counter()
+        DailySummaryService(db).rebuild()
+        db.commit()
+        rebuilt = time.perf_counter() - rebuilt
+
+        results = []
+        for window, days in WINDOWS.items():
+            start_date = BENCH_END_DATE - timedelta(days=days - 1)
+            result = {
+                "benchmark": "get_summary",
+                "window": window,
+                "years": years,
+                "rows": rows,
+                "load_seconds": round(loaded, 4),
+                "rollup_rebuild_seconds": round(rebuilt, 4),
+            }
+            for mode, use_rollup in (("live", False), ("rollup", True)):
+                service = SummaryService(db, use_rollup=use_rollup)
+                with query_budget(label=f"bench_summary {mode}") as budget:
+                    service.get_summary(start_date, BENCH_END_DATE)
+                result[f"{mode}_seconds"] = round(
+                    _best_of(repeat, lambda: service.get_summary(start_date, BENCH_END_DATE)), 4
+                )
+                result[f"{mode}_statements"] = budget.count
+            results.append(result)
+        return results
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--per-day", type=int, default=20, help="Expenses per day")
+    parser.add_argument("--database-url", default=None, help="Disposable database (default: temp SQLite file)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.years, args.per_day, args.database_url, args.repeat, args.seed)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'window':>7} {'rows':>8} {'live s':>8} {'rollup s':>9} {'stmts':>6}")
+    for r in results:
+        print(f"{r['window']:>7} {r['rows']:>8} {r['live_seconds']:>8} {r['rollup_seconds']:>9} "
+              f"{r['live_statements']:>6}")
+
+
+if __name__ == "__main__":
+    main()
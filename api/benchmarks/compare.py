@@ -0,0 +1,69 @@
+"""
+Compare two benchmark reports written by benchmarks.run.
+
+Results are matched on their benchmark name and size parameters; every
+*_seconds metric is printed for both runs with the relative change
+(negative means faster).
+
+Usage (from api/):
+    python -m benchmarks.compare before.json after.json
+"""
+
+import argparse
+import json
+from typing import Dict, List, Tuple
+
+# Fields identifying a result; everything else is a measurement
+KEY_FIELDS = ("benchmark", "target", "rows", "rules", "window", "years", "transactions", "latency_ms")
+
+
+def result_key(result: dict) -> Tuple:
+    return tuple((field, result[field]) for field in KEY_FIELDS if field in result)
+
+
+def compare(before: dict, after: dict) -> List[dict]:
+    previous: Dict[Tuple, dict] = {result_key(r): r for r in before["results"]}
+    deltas = []
+    for result in after["results"]:
+        old = previous.get(result_key(result))
+        if old is None:
+            continue
+        for metric, value in result.items():
+            if not metric.endswith("_seconds") or not isinstance(old.get(metric), (int, float)):
+                continue
+            base = old[metric]
+            deltas.append({
+                "key": ", ".join(f"{k}={v}" for k, v in result_key(result)),
+                "metric": metric,
+                "before": base,
+                "after": value,
+                "change": round((value - base) / base * 100, 1) if base else None,
+            })
+    return deltas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--json", action="store_true", help="Print the deltas as JSON")
+    args = parser.parse_args()
+
+    with open(args.before, encoding="utf-8") as fh:
+        before = json.load(fh)
+    with open(args.after, encoding="utf-8") as fh:
+        after = json.load(fh)
+
+    deltas = compare(before, after)
+    if args.json:
+        print(json.dumps(deltas, indent=2))
+        return
+
+    print(f"{before.get('commit')} ({before.get('dialect')}) -> {after.get('commit')} ({after.get('dialect')})")
+    for d in deltas:
+        change = "n/a" if d["change"] is None else f"{d['change']:+.1f}%"
+        print(f"{d['key']:<60} {d['metric']:<24} {d['before']:>10} {d['after']:>10} {change:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Synthetic data for the benchmarks.
+
+Builds a throwaway database (SQLite file by default, any SQLAlchemy URL
+otherwise) with banks, accounts, sources, a user, categories per type,
+category rules and N years of transactions. Everything is derived from a
+seed so two runs on different commits work on identical data.
+
+The target database is dropped and recreated: never point --database-url
+at a database whose content matters.
+"""
+
+import os
+import random
+import tempfile
+from datetime import date, timedelta
+from typing import Iterator, List, Optional
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from models import (
+    Account,
+    Bank,
+    Base,
+    CategoryRule,
+    ExpensesCategory,
+    IncomesCategory,
+    InvestmentsCategory,
+    Source,
+    TransactionEnum,
+    User,
+)
+from models.core.enums import CurrencyEnum, SourceTypeEnum, UserRoleEnum
+from services.core.dedup_service import generate_dedup_hash
+
+MERCHANTS = [
+    "mercadona", "carrefour", "lidl", "aldi", "amazon", "repsol", "cepsa", "iberdrola",
+    "endesa", "movistar", "vodafone", "netflix", "spotify", "renfe", "iberia", "zara",
+    "primark", "decathlon", "ikea", "leroy merlin", "farmacia", "parking", "gimnasio", "uber",
+]
+CITIES = ["madrid", "barcelona", "valencia", "sevilla", "bilbao", "malaga"]
+
+# JSONB-only table that SQLite cannot create
+_SQLITE_UNSUPPORTED_TABLES = {"import_profiles"}
+
+EXPENSE_CATEGORIES = 20
+INCOME_CATEGORIES = 5
+INVESTMENT_CATEGORIES = 5
+ACCOUNTS = 3
+
+
+def default_database_url() -> str:
+    return f"sqlite:///{os.path.join(tempfile.gettempdir(), 'economy_bench.db')}"
+
+
+def create_bench_engine(database_url: Optional[str] = None) -> Engine:
+    return create_engine(database_url or default_database_url())
+
+
+def reset_schema(engine: Engine) -> None:
+    """Drop and recreate every table (minus the JSONB-only ones on SQLite)."""
+    tables = [
+        table for name, table in Base.metadata.tables.items()
+        if engine.dialect.name != "sqlite" or name not in _SQLITE_UNSUPPORTED_TABLES
+    ]
+    Base.metadata.drop_all(engine, tables=tables)
+    Base.metadata.create_all(engine, tables=tables)
+
+
+def new_session(engine: Engine) -> Session:
+    return sessionmaker(bind=engine, autoflush=False)()
+
+
+def seed_reference_data(db: Session, rules: int = 100, seed: int = 42) -> None:
+    """Bank, accounts, sources, one user, categories per type and category rules."""
+    rng = random.Random(seed)
+    db.add(Bank(id=1, name="Bench bank", active=True))
+    for account_id in range(1, ACCOUNTS + 1):
+        db.add(Account(
+            id=account_id, name=f"Account {account_id}", iban=f"ES00BENCH{account_id:04d}",
+            currency=CurrencyEnum.EUR, active=True, balance=0, bank_id=1,
+        ))
+    db.add(Source(id=1, name="Bench expenses", active=True, type=SourceTypeEnum.EXPENSE))
+    db.add(Source(id=2, name="Bench incomes", active=True, type=SourceTypeEnum.INCOME))
+    db.add(User(id=1, name="Bench", surname1="User", dni="00000000T", password="x",
+                active=True, role=UserRoleEnum.ADMIN))
+    for model, count in (
+        (ExpensesCategory, EXPENSE_CATEGORIES),
+        (IncomesCategory, INCOME_CATEGORIES),
+        (InvestmentsCategory, INVESTMENT_CATEGORIES),
+    ):
+        for category_id in range(1, count + 1):
+            db.add(model(id=category_id, name=f"{model.__tablename__} {category_id}", active=True))
+
+    for i in range(rules):
+        merchant = MERCHANTS[i % len(MERCHANTS)]
+        # Mostly plain keywords, like the rules users create from the UI
+        pattern = merchant if i < len(MERCHANTS) else rf"{merchant}\s+{rng.choice(CITIES)}\s*{i}"
+        db.add(CategoryRule(
+            name=f"rule {i}", pattern=pattern, type=TransactionEnum.EXPENSE,
+            priority=rules - i, is_active=True, ignore_in_analysis=False,
+            category_id=1 + i % EXPENSE_CATEGORIES,
+        ))
+    db.commit()
+
+
+def description(rng: random.Random) -> str:
+    return f"COMPRA TARJ {rng.choice(MERCHANTS).upper()} {rng.choice(CITIES).upper()} {rng.randint(100, 9999)}"
+
+
+def generate_expense_payloads(rows: int, start: date, days: int, seed: int = 42,
+                              categorized: bool = True) -> List[dict]:
+    """ExpenseImportCreate-shaped dicts spread over days starting at start."""
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"expense {i}",
+            "description": f"{description(rng)} #{i}",
+            "amount": round(rng.uniform(1, 300), 2),
+            "date": (start + timedelta(days=rng.randrange(days))).isoformat(),
+            "currency": "EUR",
+            "user_id": 1,
+            "source_id": 1,
+            "category_id": 1 + i % EXPENSE_CATEGORIES if categorized else None,
+            "account_id": 1 + i % ACCOUNTS,
+        }
+        for i in range(rows)
+    ]
+
+
+def iter_transaction_rows(years: int, per_day: int, end: date, seed: int = 42) -> Iterator[tuple]:
+    """(model, row dict) for every transaction of the period, ready for a Core INSERT."""
+    from models import Expense, Income, Investment
+
+    rng = random.Random(seed)
+    start = end - timedelta(days=365 * years)
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        for n in range(per_day):
+            text = f"{description(rng)} {day.isoformat()}-{n}"
+            amount = round(rng.uniform(1, 300), 2)
+            account_id = 1 + n % ACCOUNTS
+            yield Expense, {
+                "name": text[:40], "description": text, "amount": amount, "date": day,
+                "currency": CurrencyEnum.EUR, "user_id": 1, "source_id": 1,
+                "category_id": rng.randint(1, EXPENSE_CATEGORIES), "account_id": account_id,
+                "ignore_in_analysis": False, "is_personal": False,
+                "dedup_hash": generate_dedup_hash(account_id, day, amount, text),
+            }
+        if day.day == 1:
+            for model, categories in ((Income, INCOME_CATEGORIES), (Investment, INVESTMENT_CATEGORIES)):
+                text = f"{model.__tablename__} {day.isoformat()}"
+                amount = round(rng.uniform(500, 3000), 2)
+                row = {
+                    "description": text, "amount": amount, "date": day, "currency": CurrencyEnum.EUR,
+                    "category_id": rng.randint(1, categories), "account_id": 1,
+                    "dedup_hash": generate_dedup_hash(1, day, amount, text),
+                }
+                if model is Income:
+                    row.update(source_id=2, ignore_in_analysis=False)
+                yield model, row
+
+
+def load_transactions(db: Session, years: int, per_day: int, end: date, seed: int = 42,
+                      batch_size: int = 5000) -> int:
+    """Insert N years of history with multi-row INSERTs; returns the number of rows."""
+    pending = {}
+    total = 0
+    for model, row in iter_transaction_rows(years, per_day, end, seed):
+        batch = pending.setdefault(model, [])
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db.execute(insert(model), batch)
+            total += len(batch)
+            pending[model] = []
+    for model, batch in pending.items():
+        if batch:
+            db.execute(insert(model), batch)
+            total += len(batch)
+    db.commit()
+    return total
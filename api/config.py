@@ -27,6 +27,14 @@ class Config:
             f"DB_ENGINE inválido: {DB_ENGINE}. Debe ser 'sqlite' o 'postgres'"
         )
 
+    # Connection pool of one process. Postgres must allow
+    # workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections; gunicorn.conf.py
+    # sizes the pool from its thread count when DB_POOL_SIZE is not set.
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     DEBUG = False
@@ -39,6 +47,20 @@ class Config:
     INIT_DB_ON_STARTUP = False
     SCHEMA_INIT_STRATEGY = os.getenv("SCHEMA_INIT_STRATEGY", "create_all")
     SEED_DB_ON_STARTUP = os.getenv("SEED_DB_ON_STARTUP", "false").lower() == "true"
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    # Run queued import jobs in this process (see import_job_service)
+    IMPORT_JOBS_ENABLED = os.getenv("IMPORT_JOBS_ENABLED", "true").lower() == "true"
+    # Warn when one request exceeds these (0 = off); see query_budget_service
+    QUERY_BUDGET_STATEMENTS = int(os.getenv("QUERY_BUDGET_STATEMENTS", "0"))
+    QUERY_BUDGET_REPEATS = int(os.getenv("QUERY_BUDGET_REPEATS", "0"))
+    # flask-limiter; memory:// counts per process, use a shared store with several workers
+    RATELIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
+    RATELIMIT_HEADERS_ENABLED = True
+    LOGIN_RATE_LIMIT_IP = os.getenv("LOGIN_RATE_LIMIT_IP", "20 per minute")
+    LOGIN_RATE_LIMIT_EMAIL = os.getenv("LOGIN_RATE_LIMIT_EMAIL", "5 per minute;20 per hour")
+    # Reverse proxies in front of the app (nginx); their X-Forwarded-For /
+    # X-Forwarded-Proto are trusted for that many hops. 0 when served directly.
+    PROXY_FIX_HOPS = int(os.getenv("PROXY_FIX_HOPS", "1"))
 
 
 class DevelopmentConfig(Config):
@@ -54,10 +76,20 @@ class DevelopmentConfig(Config):
     }
     INIT_DB_ON_STARTUP = True
     SEED_DB_ON_STARTUP = True
+    QUERY_BUDGET_STATEMENTS = int(os.getenv("QUERY_BUDGET_STATEMENTS", "50"))
+    QUERY_BUDGET_REPEATS = int(os.getenv("QUERY_BUDGET_REPEATS", "10"))
 
 
 class TestingConfig(Config):
     TESTING = True
+    PREFIX = "/api"
+    CORS = {
+        "origins": ["http://localhost:4200"],
+        "methods": ["GET", "POST", "PUT", "PATCH", "DELETE"],
+        "allow_headers": ["Content-Type", "Authorization"]
+    }
+    RATELIMIT_ENABLED = False
+    IMPORT_JOBS_ENABLED = False
     JWT_SECRET_KEY = 'testing-jwt-secret'    # ✅ fixed value, no env dependency
 
 
@@ -77,3 +109,22 @@ class ProductionConfig(Config):
     def validate(cls):
         if not cls.JWT_SECRET_KEY:
             raise ValueError("JWT_SECRET_KEY must be set in production environment")
+
+
+CONFIGS = {
+    "development": DevelopmentConfig,
+    "testing": TestingConfig,
+    "production": ProductionConfig,
+}
+
+
+def get_config(name: str | None = None):
+    """Config class selected by name or the APP_CONFIG variable (development by default)."""
+    name = name or os.getenv("APP_CONFIG", "development")
+    try:
+        config_class = CONFIGS[name]
+    except KeyError:
+        raise ValueError(f"APP_CONFIG inválido: {name}. Debe ser uno de {', '.join(CONFIGS)}")
+    if hasattr(config_class, "validate"):
+        config_class.validate()
+    return config_class
@@ -1,8 +1,9 @@
 import os
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.orm import scoped_session, sessionmaker
 from contextlib import contextmanager
-from models import Base, User, Account, Bank
+# Every model must be registered on Base before create_all / mapper setup
+from models import Base
 from config import Config
 from .users_seed import seed_admin
 
@@ -10,17 +11,22 @@ DATABASE_URL = Config.DATABASE_URL
 
 # Setup logging
 from services.logs.logger_service import setup_logger
+from services.core.metrics_service import install_query_listeners
 logger = setup_logger("database")
 
-logger.info(f"Database URL: {DATABASE_URL}")
+logger.info("Database URL: %s", make_url(DATABASE_URL).render_as_string(hide_password=True))
 logger.info(f"Database Engine: {Config.DB_ENGINE}")
 
+# Sized per process: each gunicorn worker imports this module after the
+# fork and gets its own pool (see gunicorn.conf.py)
 engine = create_engine(
     DATABASE_URL,
     echo=Config.DEBUG,
-    pool_size=20,
-    max_overflow=10,
-    pool_timeout=60
+    pool_size=Config.DB_POOL_SIZE,
+    max_overflow=Config.DB_MAX_OVERFLOW,
+    pool_timeout=Config.DB_POOL_TIMEOUT,
+    pool_recycle=Config.DB_POOL_RECYCLE,
+    pool_pre_ping=True
 )
 
 # ✅ Enable foreign key constraints only for SQLite
@@ -31,6 +37,8 @@ if Config.DB_ENGINE == "sqlite":
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
 
+# Per-request SQL count/time for Server-Timing and /system/metrics
+install_query_listeners(engine)
 
 SessionFactory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 SessionLocal = scoped_session(SessionFactory)
@@ -0,0 +1,61 @@
+"""
+Gunicorn settings for the production image.
+
+    gunicorn --config gunicorn.conf.py wsgi:app
+
+gthread workers: requests mostly wait on Postgres and the AI service, so a
+few threads per process keep the cores busy while bcrypt and JSON work run
+in parallel across processes. Defaults are sized from the CPU count and can
+be overridden with the environment variables below.
+
+Every worker imports the app after the fork (no preload), so each one
+builds its own SQLAlchemy engine; the pool per worker defaults to one
+connection per request thread plus the background import workers. Postgres
+needs max_connections >= WEB_CONCURRENCY x (DB_POOL_SIZE + DB_MAX_OVERFLOW).
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '5001')}")
+
+worker_class = "gthread"
+workers = int(os.getenv("WEB_CONCURRENCY", str(multiprocessing.cpu_count() + 1)))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+
+# Read by config.py when each worker imports the app
+os.environ.setdefault("DB_POOL_SIZE", str(threads + int(os.getenv("IMPORT_JOB_WORKERS", "2"))))
+os.environ.setdefault("DB_MAX_OVERFLOW", "2")
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+
+# Worker recycling is off by default: every recycle interrupts the import
+# jobs running in that worker (see worker_exit). Set it to cap slow memory growth.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = 100 if max_requests else 0
+
+preload_app = False
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # With preload_app the engine would be inherited from the master: drop
+    # its pooled connections so no socket is shared between processes.
+    import sys
+
+    database = sys.modules.get("db.database")
+    if database is not None:
+        database.engine.dispose(close=False)
+
+
+def worker_exit(server, worker):
+    # Hand running import jobs back to the queue (at their next chunk
+    # boundary) before graceful_timeout expires, instead of leaving them
+    # stuck in RUNNING until they go stale.
+    import sys
+
+    jobs = sys.modules.get("services.imports.import_job_service")
+    if jobs is not None:
+        jobs.import_job_runner.stop(wait=True)
@@ -6,6 +6,7 @@ from .core.enums import (
     ActionEnum,
     UserRoleEnum,
     TransactionEnum,
+    ImportJobStatusEnum,
 )
 
 
@@ -14,7 +15,7 @@ from .core.enums import (
 from .users import User
 
 # Finance
-from .finance import Bank, Account, Source, Place, AccountUser
+from .finance import Bank, Account, Source, Place, AccountUser, AccountLedger
 
 # Incomes
 from .incomes import Income, IncomesCategory
@@ -26,7 +27,7 @@ from .expenses import Expense, ExpensesCategory
 from .savings import Saving, SavingLog
 
 # Investments
-from .investments import Investment, InvestmentLog, InvestmentsCategory
+from .investments import Investment, InvestmentLog, InvestmentsCategory, InvestmentPosition
 
 # Households
 from .households import Household, HouseholdMember
@@ -36,7 +37,11 @@ from .category_rules import CategoryRule
 
 from .cards import Card
 
-from .imports import ImportOrigin, ImportProfile
+from .imports import ImportOrigin, ImportProfile, ImportJob
+
+from .ai import AIClassificationCache
+
+from .summaries import DailySummary
 
 __all__ = [
     'Base',
@@ -47,10 +52,12 @@ __all__ = [
     'ActionEnum',
     'UserRoleEnum',
     'TransactionEnum',
+    'ImportJobStatusEnum',
     'User',
     'Bank',
     'Account',
     'AccountUser',
+    'AccountLedger',
     'Source',
     'Place',
     'Income',
@@ -62,10 +69,14 @@ __all__ = [
     'Investment',
     'InvestmentLog',
     'InvestmentsCategory',
+    'InvestmentPosition',
     'Household',
     'HouseholdMember',
     'CategoryRule',
     'Card',
     'ImportOrigin',
     'ImportProfile',
+    'ImportJob',
+    'AIClassificationCache',
+    'DailySummary',
 ]
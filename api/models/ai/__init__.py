@@ -0,0 +1,3 @@
+from .ai_classification_cache_model import AIClassificationCache
+
+__all__ = ['AIClassificationCache']
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint, Index
+from ..core.base import Base, TimestampMixin
+
+
+class AIClassificationCache(TimestampMixin, Base):
+    """
+    Memo of LLM category predictions per normalized transaction description.
+
+    category_version fingerprints the category list of the type at prediction
+    time: once categories change, old entries no longer match and are purged.
+    """
+    __tablename__ = "ai_classification_cache"
+    __table_args__ = (
+        UniqueConstraint("type", "description_key", "category_version", name="uq_ai_cache_key"),
+        Index("idx_ai_cache_last_used", "last_used_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    type = Column(String(20), nullable=False)
+    description_key = Column(String(500), nullable=False)
+    category_version = Column(String(64), nullable=False)
+
+    category_id = Column(Integer, nullable=True)
+    suggested_new_category = Column(String(100), nullable=True)
+
+    hits = Column(Integer, nullable=False, default=0)
+    last_used_at = Column(DateTime, nullable=False)
@@ -56,6 +56,13 @@ class TransactionEnum(str, enum.Enum):
     INCOME = "income"
     INVESTMENT = "investment"
 
+class ImportJobStatusEnum(str, enum.Enum):
+    """Lifecycle of a background import job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
 class CardTypeEnum(str, enum.Enum):
     CREDIT = "credit"
     DEBIT = "debit"
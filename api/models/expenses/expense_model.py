@@ -7,7 +7,8 @@ from sqlalchemy import (
     Date,
     ForeignKey,
     Enum as SQLEnum,
-    UniqueConstraint
+    UniqueConstraint,
+    Index
 )
 from sqlalchemy.orm import relationship
 
@@ -19,6 +20,13 @@ class Expense(TimestampMixin, Base):
     __tablename__ = 'expenses'
     __table_args__ = (
         UniqueConstraint('account_id', 'dedup_hash', name='uq_expenses_account_dedup_hash'),
+        # Keyset pagination: (date DESC, id DESC), optionally per filter column
+        Index('idx_expenses_date_id', 'date', 'id'),
+        Index('idx_expenses_account_date_id', 'account_id', 'date', 'id'),
+        Index('idx_expenses_category_date_id', 'category_id', 'date', 'id'),
+        Index('idx_expenses_card_date_id', 'card_id', 'date', 'id'),
+        # Fuzzy import dedup: same account and amount within a few days
+        Index('idx_expenses_account_amount_date', 'account_id', 'amount', 'date'),
     )
 
     id = Column(Integer, primary_key=True, nullable=False, autoincrement=True)
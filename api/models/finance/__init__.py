@@ -3,5 +3,6 @@ from .account_model import Account
 from .source_model import Source
 from .place_model import Place
 from .account_user_model import AccountUser
+from .account_ledger_model import AccountLedger
 
-__all__ = ['Bank', 'Account', 'Source', 'Place', 'AccountUser']
+__all__ = ['Bank', 'Account', 'Source', 'Place', 'AccountUser', 'AccountLedger']
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, Numeric, Date, ForeignKey, UniqueConstraint
+from ..core.base import Base
+
+
+class AccountLedger(Base):
+    """
+    Running balance per (account_id, date).
+
+    delta is the net of the day (incomes minus expenses) and balance the sum
+    of every delta up to and including that date, so the balance at any day
+    is one index lookup on (account_id, date). Maintained incrementally by
+    the expense/income write paths and the importer; rebuild with:
+    python scripts/maintenance.py rebuild-account-ledger [--account ID]
+    """
+    __tablename__ = "account_ledger"
+    __table_args__ = (
+        UniqueConstraint("account_id", "date", name="uq_account_ledger_account_date"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, nullable=False)
+    delta = Column(Numeric(14, 2), nullable=False, default=0)
+    balance = Column(Numeric(14, 2), nullable=False, default=0)
@@ -1,4 +1,5 @@
 from .import_origin_model import ImportOrigin
 from .import_profile_model import ImportProfile
+from .import_job_model import ImportJob
 
-__all__ = ['ImportOrigin', 'ImportProfile']
+__all__ = ['ImportOrigin', 'ImportProfile', 'ImportJob']
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
+from ..core.base import Base, TimestampMixin
+from ..core.enums import ImportJobStatusEnum
+
+
+class ImportJob(TimestampMixin, Base):
+    """
+    Background import request, doubling as the queue table of the local worker pool.
+
+    A worker claims a job by switching it from queued to running in a single
+    UPDATE, so several processes can share the table without a broker.
+    """
+    __tablename__ = "import_jobs"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(20), nullable=False, default="bulk")
+    status = Column(SQLEnum(ImportJobStatusEnum), nullable=False, default=ImportJobStatusEnum.QUEUED, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+
+    # BulkImportRequest as JSON; dropped once the job finishes
+    payload = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True)
+
+    total_rows = Column(Integer, nullable=False, default=0)
+    processed_rows = Column(Integer, nullable=False, default=0)
+    inserted = Column(Integer, nullable=False, default=0)
+    duplicates = Column(Integer, nullable=False, default=0)
+    uncategorized = Column(Integer, nullable=False, default=0)
+    possible_duplicates = Column(Integer, nullable=False, default=0)
+    errors = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
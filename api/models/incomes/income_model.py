@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Date, Boolean, ForeignKey, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Numeric, Date, Boolean, ForeignKey, Enum as SQLEnum, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 
 from ..core.base import Base, TimestampMixin
@@ -9,6 +9,12 @@ class Income(TimestampMixin, Base):
     __tablename__ = 'incomes'
     __table_args__ = (
         UniqueConstraint('account_id', 'dedup_hash', name='uq_incomes_account_dedup_hash'),
+        # Keyset pagination: (date DESC, id DESC), optionally per filter column
+        Index('idx_incomes_date_id', 'date', 'id'),
+        Index('idx_incomes_account_date_id', 'account_id', 'date', 'id'),
+        Index('idx_incomes_category_date_id', 'category_id', 'date', 'id'),
+        # Fuzzy import dedup: same account and amount within a few days
+        Index('idx_incomes_account_amount_date', 'account_id', 'amount', 'date'),
     )
 
     id = Column(Integer, primary_key=True, nullable=False, autoincrement=True)
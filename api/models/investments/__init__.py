@@ -1,5 +1,6 @@
 from .investment_model import Investment
 from .investment_log_model import InvestmentLog
 from .investment_category_model import InvestmentsCategory
+from .investment_position_model import InvestmentPosition
 
-__all__ = ['Investment', 'InvestmentLog', 'InvestmentsCategory']
+__all__ = ['Investment', 'InvestmentLog', 'InvestmentsCategory', 'InvestmentPosition']
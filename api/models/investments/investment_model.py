@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Enum as SQLEnum, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 
 from ..core.base import Base, TimestampMixin
@@ -9,6 +9,10 @@ class Investment(TimestampMixin, Base):
     __tablename__ = 'investments'
     __table_args__ = (
         UniqueConstraint('account_id', 'dedup_hash', name='uq_investments_account_dedup_hash'),
+        # Keyset pagination: (date DESC, id DESC), optionally per filter column
+        Index('idx_investments_date_id', 'date', 'id'),
+        Index('idx_investments_account_date_id', 'account_id', 'date', 'id'),
+        Index('idx_investments_category_date_id', 'category_id', 'date', 'id'),
     )
 
     id = Column(Integer, primary_key=True, nullable=False, autoincrement=True)
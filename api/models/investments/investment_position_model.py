@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, Numeric, Date, ForeignKey, JSON, UniqueConstraint
+from ..core.base import Base
+
+
+class InvestmentPosition(Base):
+    """
+    Position of an investment at the end of each day with investment logs.
+
+    Snapshot cache over investments_logs: units held, cost basis of those
+    units, realized P&L so far and the last marked value. lots keeps the
+    open FIFO lots ([units, price] as strings) so the replay of later logs
+    can resume from any snapshot. Maintained by the investment log write
+    paths; rebuild with:
+    python scripts/maintenance.py rebuild-investment-positions [--investment ID]
+    """
+    __tablename__ = "investment_positions"
+    __table_args__ = (
+        UniqueConstraint("investment_id", "date", name="uq_investment_positions_investment_date"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    investment_id = Column(Integer, ForeignKey("investments.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, nullable=False)
+    units = Column(Numeric(18, 6), nullable=False, default=0)
+    cost_basis = Column(Numeric(18, 6), nullable=False, default=0)
+    realized_pnl = Column(Numeric(18, 6), nullable=False, default=0)
+    market_value = Column(Numeric(14, 2), nullable=False, default=0)
+    lots = Column(JSON, nullable=False, default=list)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from ..core.base import Base, TimestampMixin
@@ -6,6 +6,11 @@ from ..core.base import Base, TimestampMixin
 
 class SavingLog(TimestampMixin, Base):
     __tablename__ = "savings_logs"
+    __table_args__ = (
+        # Keyset pagination: (date DESC, id DESC), optionally per saving
+        Index('idx_savings_logs_date_id', 'date', 'id'),
+        Index('idx_savings_logs_saving_date_id', 'saving_id', 'date', 'id'),
+    )
     id = Column(Integer, primary_key=True, nullable=False, autoincrement=True)
     date = Column(Date, nullable=False)
     amount = Column(Numeric(12, 2), nullable=False)
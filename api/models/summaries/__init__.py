@@ -1 +1,3 @@
-__all__ = []
+from .daily_summary_model import DailySummary
+
+__all__ = ['DailySummary']
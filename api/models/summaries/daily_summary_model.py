@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Numeric, Date, UniqueConstraint
+from ..core.base import Base
+
+
+class DailySummary(Base):
+    """
+    Pre-aggregated totals per (date, type, category_id).
+
+    Maintained incrementally by the expense/income/investment write paths and
+    the importer, so summaries scan one row per day and category instead of
+    every transaction. Rebuild with: python scripts/maintenance.py rebuild-daily-summary
+    """
+    __tablename__ = "daily_summary"
+    __table_args__ = (
+        UniqueConstraint("date", "type", "category_id", name="uq_daily_summary_key"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    date = Column(Date, nullable=False)
+    type = Column(String(20), nullable=False)  # expense | income | investment
+    category_id = Column(Integer, nullable=False)
+    total = Column(Numeric(14, 2), nullable=False, default=0)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,72 @@
+"""Repository for AIClassificationCache entries."""
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from sqlalchemy import delete, func, select, update
+
+from repositories.core.base_repository import BaseRepository, IN_CLAUSE_CHUNK_SIZE
+from models.ai import AIClassificationCache
+
+
+class AIClassificationCacheRepository(BaseRepository[AIClassificationCache]):
+    """Lookups and eviction for the AI prediction cache. Does not commit."""
+
+    def __init__(self, db):
+        super().__init__(db, AIClassificationCache)
+
+    def get_many(
+        self,
+        type_: str,
+        category_version: str,
+        description_keys: Iterable[str],
+        fresh_after: datetime
+    ) -> Dict[str, AIClassificationCache]:
+        """Return non-expired entries by description_key (chunked IN)."""
+        keys = list(dict.fromkeys(description_keys))
+        found: Dict[str, AIClassificationCache] = {}
+        for start in range(0, len(keys), IN_CLAUSE_CHUNK_SIZE):
+            stmt = select(AIClassificationCache).where(
+                AIClassificationCache.type == type_,
+                AIClassificationCache.category_version == category_version,
+                AIClassificationCache.description_key.in_(keys[start:start + IN_CLAUSE_CHUNK_SIZE]),
+                AIClassificationCache.created_at >= fresh_after,
+            )
+            for entry in self.db.execute(stmt).scalars().all():
+                found[entry.description_key] = entry
+        return found
+
+    def touch(self, ids: List[int], used_at: datetime) -> None:
+        """Record cache hits (feeds the least-recently-used eviction)."""
+        for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+            stmt = (
+                update(AIClassificationCache)
+                .where(AIClassificationCache.id.in_(ids[start:start + IN_CLAUSE_CHUNK_SIZE]))
+                .values(hits=AIClassificationCache.hits + 1, last_used_at=used_at)
+            )
+            self.db.execute(stmt)
+
+    def delete_other_versions(self, type_: str, category_version: str) -> int:
+        """Drop entries computed against a previous category list of the type."""
+        stmt = delete(AIClassificationCache).where(
+            AIClassificationCache.type == type_,
+            AIClassificationCache.category_version != category_version,
+        )
+        return self.db.execute(stmt).rowcount
+
+    def delete_expired(self, created_before: datetime) -> int:
+        stmt = delete(AIClassificationCache).where(AIClassificationCache.created_at < created_before)
+        return self.db.execute(stmt).rowcount
+
+    def evict_least_recently_used(self, max_entries: int) -> int:
+        """Keep at most max_entries rows, dropping the least recently used."""
+        total = self.db.execute(select(func.count()).select_from(AIClassificationCache)).scalar_one()
+        if total <= max_entries:
+            return 0
+        oldest = (
+            select(AIClassificationCache.id)
+            .order_by(AIClassificationCache.last_used_at, AIClassificationCache.id)
+            .limit(total - max_entries)
+            .scalar_subquery()
+        )
+        stmt = delete(AIClassificationCache).where(AIClassificationCache.id.in_(oldest))
+        return self.db.execute(stmt).rowcount
@@ -1,11 +1,18 @@
-from datetime import datetime
-from typing import TypeVar, Type, List, Optional
-from sqlalchemy import select, func
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, TypeVar, Type, List, Optional, Iterable, Sequence, Set, Tuple
+from sqlalchemy import select, func, insert, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from repositories.core.interfaces import ICRUDRepository
 
 T = TypeVar('T')
 
+# Keeps IN (...) lists well below driver/engine bind parameter limits
+IN_CLAUSE_CHUNK_SIZE = 500
+
 
 class BaseRepository(ICRUDRepository[T]):
 
@@ -35,6 +42,56 @@ class BaseRepository(ICRUDRepository[T]):
         stmt = self._base_query().offset((page - 1) * per_page).limit(per_page)
         return self.db.execute(stmt).scalars().all()
 
+    def get_page(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[Tuple[date, int]] = None,
+        limit: int = 50
+    ) -> List[T]:
+        """
+        Keyset page ordered by (date DESC, id DESC).
+
+        filters maps column names to equality values; date_from / date_to
+        bound the date column. after is the (date, id) of the previous page's
+        last row. Fetches limit + 1 rows so callers can tell whether another
+        page exists. Raises ValueError for filters the model does not have.
+        """
+        stmt = self._apply_filters(self._list_query(), filters)
+        if after is not None:
+            stmt = stmt.where(tuple_(self.model.date, self.model.id) < tuple_(*after))
+
+        stmt = stmt.order_by(self.model.date.desc(), self.model.id.desc()).limit(limit + 1)
+        return self.db.execute(stmt).scalars().all()
+
+    def iter_filtered(self, filters: Optional[Dict[str, Any]] = None, batch_size: int = 1000) -> Iterator[T]:
+        """
+        Stream every row matching filters, ordered by (date, id).
+
+        Rows are fetched batch_size at a time (server-side cursor where the
+        driver supports it), so memory does not grow with the result size.
+        The query runs on call, so bad filters raise before the first row.
+        """
+        stmt = self._apply_filters(self._base_query(), filters).order_by(self.model.date, self.model.id)
+        result = self.db.execute(stmt.execution_options(yield_per=batch_size))
+        return (obj for partition in result.scalars().partitions() for obj in partition)
+
+    def _list_query(self):
+        """Base statement of list reads; override to add eager loading."""
+        return self._base_query()
+
+    def _apply_filters(self, stmt, filters: Optional[Dict[str, Any]]):
+        """Apply list filters (see get_page); raises ValueError for unknown columns."""
+        for key, value in (filters or {}).items():
+            if key == 'date_from':
+                stmt = stmt.where(self.model.date >= value)
+            elif key == 'date_to':
+                stmt = stmt.where(self.model.date <= value)
+            elif hasattr(self.model, key):
+                stmt = stmt.where(getattr(self.model, key) == value)
+            else:
+                raise ValueError(f"UNSUPPORTED_FILTER: {key}")
+        return stmt
+
     def get_all_unpaginated(self) -> List[T]:
         stmt = self._base_query()
         return self.db.execute(stmt).scalars().all()
@@ -84,6 +141,111 @@ class BaseRepository(ICRUDRepository[T]):
         self.db.commit()
         return True
 
+    # ======================
+    # BULK
+    # ======================
+
+    def get_existing_ids(self, model: Type, ids: Iterable[int]) -> Set[int]:
+        """
+        Return which of the given primary keys exist in model's table.
+
+        Meant for validating foreign keys of a whole batch: one SELECT per
+        chunk of IN_CLAUSE_CHUNK_SIZE distinct ids instead of one per row.
+        """
+        distinct_ids = list(dict.fromkeys(i for i in ids if i is not None))
+        existing: Set[int] = set()
+        for start in range(0, len(distinct_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = distinct_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+            stmt = select(model.id).where(model.id.in_(chunk))
+            existing.update(self.db.execute(stmt).scalars().all())
+        return existing
+
+    def get_existing_dedup_hashes(self, account_id: int, dedup_hashes: Iterable[str]) -> Set[str]:
+        """
+        Return which of the given dedup hashes already exist for an account.
+
+        Soft-deleted rows are included, like the (account_id, dedup_hash)
+        unique constraint. One SELECT per chunk of IN_CLAUSE_CHUNK_SIZE hashes.
+        """
+        hashes = list(dict.fromkeys(dedup_hashes))
+        existing: Set[str] = set()
+        for start in range(0, len(hashes), IN_CLAUSE_CHUNK_SIZE):
+            chunk = hashes[start:start + IN_CLAUSE_CHUNK_SIZE]
+            stmt = select(self.model.dedup_hash).where(
+                self.model.account_id == account_id,
+                self.model.dedup_hash.in_(chunk)
+            )
+            existing.update(self.db.execute(stmt).scalars().all())
+        return existing
+
+    def get_fuzzy_candidates(
+        self,
+        account_id: int,
+        amounts: Iterable[Decimal],
+        start_date: date,
+        end_date: date
+    ) -> List[Row]:
+        """
+        Return (id, date, amount, description) of an account's transactions
+        with one of the given amounts between two dates (inclusive).
+
+        Soft-deleted rows are skipped. One SELECT per chunk of
+        IN_CLAUSE_CHUNK_SIZE amounts, served by the (account_id, amount, date) index.
+        """
+        amounts = list(dict.fromkeys(amounts))
+        candidates: List[Row] = []
+        for start in range(0, len(amounts), IN_CLAUSE_CHUNK_SIZE):
+            chunk = amounts[start:start + IN_CLAUSE_CHUNK_SIZE]
+            stmt = select(
+                self.model.id, self.model.date, self.model.amount, self.model.description
+            ).where(
+                self.model.account_id == account_id,
+                self.model.amount.in_(chunk),
+                self.model.date.between(start_date, end_date),
+                self.model.deleted_at.is_(None)
+            )
+            candidates.extend(self.db.execute(stmt).all())
+        return candidates
+
+    def bulk_insert_ignore_conflicts(
+        self,
+        rows: List[dict],
+        conflict_columns: Sequence[str] = ("account_id", "dedup_hash"),
+        returning: Sequence[str] = ("id",)
+    ) -> List[Row]:
+        """
+        Insert rows with multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING.
+
+        Rows hitting the unique constraint on conflict_columns are skipped and
+        absent from the result. Does not commit: the caller owns the transaction.
+        """
+        if not rows:
+            return []
+
+        returning_columns = [getattr(self.model, name) for name in returning]
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = (
+                dialect_insert(self.model)
+                .on_conflict_do_nothing(index_elements=list(conflict_columns))
+                .returning(*returning_columns)
+            )
+            # SQLAlchemy batches this into multi-row VALUES ("insertmanyvalues")
+            return list(self.db.execute(stmt, rows).all())
+
+        # Portable fallback: one savepoint per row
+        inserted: List[Row] = []
+        stmt = insert(self.model).returning(*returning_columns)
+        for row in rows:
+            try:
+                with self.db.begin_nested():
+                    inserted.append(self.db.execute(stmt, row).one())
+            except IntegrityError:
+                continue
+        return inserted
+
     # ======================
     # SEARCH
     # ======================
@@ -12,8 +12,11 @@ class ExpenseRepository(BaseRepository[Expense]):
     def __init__(self, db: Session):
         super().__init__(db, Expense)
 
+    def _list_query(self):
+        return self._base_query().options(selectinload(Expense.user))
+
     def get_all(self, page: int = 1, per_page: int = 50):
-        stmt = self._base_query().options(selectinload(Expense.user)).offset((page - 1) * per_page).limit(per_page)
+        stmt = self._list_query().offset((page - 1) * per_page).limit(per_page)
         return self.db.execute(stmt).scalars().all()
 
     def get_by_user(self, user_id: int) -> List[Expense]:
@@ -0,0 +1,156 @@
+"""Repository for the account_ledger running balances."""
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select, union_all, update
+
+from repositories.core.base_repository import BaseRepository
+from models import Account, AccountLedger, Expense, Income
+
+# (account_id, date) -> signed amount (incomes positive, expenses negative)
+LedgerDeltas = Dict[Tuple[int, date], Decimal]
+
+
+class AccountLedgerRepository(BaseRepository[AccountLedger]):
+    """Incremental updates, balance lookups and rebuilds of account_ledger. Does not commit."""
+
+    def __init__(self, db):
+        super().__init__(db, AccountLedger)
+
+    def apply_deltas(self, deltas: LedgerDeltas) -> None:
+        """
+        Add day deltas and shift the running balance of every later day.
+
+        Per account: lock its row, load the ledger from the earliest changed
+        date on and rewrite the balances in one pass. Writes at recent dates
+        touch a handful of rows; a backdated write rewrites the balance of
+        every later day with activity, in one executemany UPDATE.
+        """
+        by_account: Dict[int, Dict[date, Decimal]] = defaultdict(dict)
+        for (account_id, day), amount in deltas.items():
+            by_account[account_id][day] = by_account[account_id].get(day, Decimal("0")) + amount
+
+        # Fixed lock order so concurrent writers cannot deadlock
+        for account_id in sorted(by_account):
+            day_deltas = {day: amount for day, amount in by_account[account_id].items() if amount}
+            if day_deltas:
+                self._apply_account(account_id, day_deltas)
+
+    def _apply_account(self, account_id: int, day_deltas: Dict[date, Decimal]) -> None:
+        if self.db.get_bind().dialect.name != "sqlite":
+            # Serializes ledger writers of one account (SQLite already has a single writer)
+            self.db.execute(select(Account.id).where(Account.id == account_id).with_for_update())
+
+        # Rows from the earliest changed day on, plus the last one before it
+        # for the opening balance (single query)
+        first_day = min(day_deltas)
+        previous_day = (
+            select(func.max(AccountLedger.date))
+            .where(AccountLedger.account_id == account_id, AccountLedger.date < first_day)
+            .scalar_subquery()
+        )
+        loaded = self.db.execute(
+            select(AccountLedger.id, AccountLedger.date, AccountLedger.delta, AccountLedger.balance)
+            .where(
+                AccountLedger.account_id == account_id,
+                AccountLedger.date >= func.coalesce(previous_day, first_day),
+            )
+        )
+
+        balance = Decimal("0")
+        rows = {}
+        for row_id, day, delta, row_balance in loaded:
+            if day < first_day:
+                balance = Decimal(row_balance)
+            else:
+                rows[day] = (row_id, Decimal(delta), Decimal(row_balance))
+
+        # At most one DELETE, one UPDATE and one INSERT per account, each an
+        # executemany at most, however many days the batch touches
+        deleted, updated, inserted = [], [], []
+        for day in sorted(rows.keys() | day_deltas.keys()):
+            amount = day_deltas.get(day, Decimal("0"))
+            if day not in rows:
+                balance += amount
+                inserted.append({"account_id": account_id, "date": day, "delta": amount, "balance": balance})
+                continue
+            row_id, old_delta, old_balance = rows[day]
+            delta = old_delta + amount
+            if delta == 0:
+                # Nothing left on that day: the previous balance carries over
+                deleted.append(row_id)
+                continue
+            balance += delta
+            if (delta, balance) != (old_delta, old_balance):
+                updated.append({"id": row_id, "delta": delta, "balance": balance})
+
+        if deleted:
+            self.db.execute(
+                delete(AccountLedger)
+                .where(AccountLedger.id.in_(deleted))
+                .execution_options(synchronize_session=False)
+            )
+        if updated:
+            # ORM bulk UPDATE by primary key
+            self.db.execute(update(AccountLedger), updated)
+        if inserted:
+            self.db.execute(insert(AccountLedger), inserted)
+
+    def balance_at(self, account_id: int, on: date, inclusive: bool = True) -> Optional[Decimal]:
+        """Running balance at the end of a day (None before the first movement)."""
+        condition = AccountLedger.date <= on if inclusive else AccountLedger.date < on
+        return self.db.execute(
+            select(AccountLedger.balance)
+            .where(AccountLedger.account_id == account_id, condition)
+            .order_by(AccountLedger.date.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+
+    def get_range(self, account_id: int, start_date: date, end_date: date) -> List[AccountLedger]:
+        stmt = (
+            select(AccountLedger)
+            .where(
+                AccountLedger.account_id == account_id,
+                AccountLedger.date >= start_date,
+                AccountLedger.date <= end_date,
+            )
+            .order_by(AccountLedger.date)
+        )
+        return list(self.db.execute(stmt).scalars().all())
+
+    def rebuild(self, account_id: Optional[int] = None) -> int:
+        """
+        Recompute the ledger of one account (every account when None) from the
+        transaction tables with a single INSERT ... SELECT and a running SUM
+        window. Returns the number of rows written.
+        """
+        def live(model, amount):
+            stmt = select(model.account_id, model.date, amount.label("amount")).where(model.deleted_at.is_(None))
+            if account_id is not None:
+                stmt = stmt.where(model.account_id == account_id)
+            return stmt
+
+        movements = union_all(live(Income, Income.amount), live(Expense, -Expense.amount)).subquery()
+        daily = (
+            select(movements.c.account_id, movements.c.date, func.sum(movements.c.amount).label("delta"))
+            .group_by(movements.c.account_id, movements.c.date)
+            .having(func.sum(movements.c.amount) != 0)
+            .subquery()
+        )
+        running = select(
+            daily.c.account_id,
+            daily.c.date,
+            daily.c.delta,
+            func.sum(daily.c.delta).over(partition_by=daily.c.account_id, order_by=daily.c.date),
+        )
+
+        stmt = delete(AccountLedger)
+        if account_id is not None:
+            stmt = stmt.where(AccountLedger.account_id == account_id)
+        self.db.execute(stmt)
+        result = self.db.execute(
+            insert(AccountLedger).from_select(["account_id", "date", "delta", "balance"], running)
+        )
+        return max(result.rowcount, 0)
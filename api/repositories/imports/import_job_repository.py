@@ -0,0 +1,66 @@
+"""Repository for ImportJob, also used as the worker queue."""
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy import select, update
+
+from repositories.core.base_repository import BaseRepository
+from models.imports import ImportJob
+from models.core.enums import ImportJobStatusEnum
+
+
+def utc_now() -> datetime:
+    """
+    Clock of the job queue: naive UTC, like the DateTime columns store it.
+
+    claim, update_progress and the stale cutoff all use it. The model's
+    onupdate=func.now() is the database session's local time, which is
+    hours off on a server not running in UTC.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ImportJobRepository(BaseRepository[ImportJob]):
+    """Repository for ImportJob with queue operations. Does not commit."""
+
+    def __init__(self, db):
+        super().__init__(db, ImportJob)
+
+    def claim(self, job_id: int) -> bool:
+        """Atomically move a queued job to running; False if another worker got it."""
+        now = utc_now()
+        stmt = (
+            update(ImportJob)
+            .where(ImportJob.id == job_id, ImportJob.status == ImportJobStatusEnum.QUEUED)
+            .values(
+                status=ImportJobStatusEnum.RUNNING,
+                started_at=now,
+                updated_at=now,
+                attempts=ImportJob.attempts + 1,
+            )
+        )
+        return self.db.execute(stmt).rowcount == 1
+
+    def update_progress(self, job_id: int, **values) -> None:
+        stmt = update(ImportJob).where(ImportJob.id == job_id).values(updated_at=utc_now(), **values)
+        self.db.execute(stmt)
+
+    def get_queued_ids(self) -> List[int]:
+        stmt = (
+            select(ImportJob.id)
+            .where(ImportJob.status == ImportJobStatusEnum.QUEUED, ImportJob.deleted_at.is_(None))
+            .order_by(ImportJob.id)
+        )
+        return list(self.db.execute(stmt).scalars().all())
+
+    def requeue_stale(self, updated_before: datetime) -> int:
+        """
+        Put back running jobs whose worker stopped reporting (e.g. process
+        restart). updated_before is on the utc_now() clock.
+        """
+        stmt = (
+            update(ImportJob)
+            .where(ImportJob.status == ImportJobStatusEnum.RUNNING, ImportJob.updated_at < updated_before)
+            .values(status=ImportJobStatusEnum.QUEUED)
+        )
+        return self.db.execute(stmt).rowcount
@@ -0,0 +1,86 @@
+"""Repository for the investment_positions snapshots."""
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, func, select
+
+from repositories.core.base_repository import BaseRepository
+from models import Investment, InvestmentLog, InvestmentPosition
+
+
+class InvestmentPositionRepository(BaseRepository[InvestmentPosition]):
+    """Snapshot reads/writes and the log reads the replay needs. Does not commit."""
+
+    def __init__(self, db):
+        super().__init__(db, InvestmentPosition)
+
+    def get_before(self, investment_id: int, day: date) -> Optional[InvestmentPosition]:
+        """Last snapshot strictly before day (the state a replay from day resumes from)."""
+        stmt = (
+            select(InvestmentPosition)
+            .where(InvestmentPosition.investment_id == investment_id, InvestmentPosition.date < day)
+            .order_by(InvestmentPosition.date.desc())
+            .limit(1)
+        )
+        return self.db.execute(stmt).scalar_one_or_none()
+
+    def get_logs_from(self, investment_id: int, day: Optional[date] = None) -> List[InvestmentLog]:
+        """Live logs of an investment from day on (all when None), in replay order."""
+        stmt = select(InvestmentLog).where(
+            InvestmentLog.investment_id == investment_id,
+            InvestmentLog.deleted_at.is_(None),
+        )
+        if day is not None:
+            stmt = stmt.where(InvestmentLog.date >= day)
+        return list(self.db.execute(stmt.order_by(InvestmentLog.date, InvestmentLog.id)).scalars().all())
+
+    def delete_from(self, investment_id: Optional[int], day: Optional[date] = None) -> None:
+        """Drop snapshots of an investment (every investment when None) from day on."""
+        stmt = delete(InvestmentPosition)
+        if investment_id is not None:
+            stmt = stmt.where(InvestmentPosition.investment_id == investment_id)
+        if day is not None:
+            stmt = stmt.where(InvestmentPosition.date >= day)
+        self.db.execute(stmt)
+
+    def add_all(self, positions: List[InvestmentPosition]) -> None:
+        self.db.add_all(positions)
+        self.db.flush()
+
+    def get_latest(self, as_of: Optional[date] = None) -> List[Tuple[InvestmentPosition, Investment]]:
+        """Latest snapshot (on or before as_of) of every live investment, in one query."""
+        latest = select(InvestmentPosition.investment_id, func.max(InvestmentPosition.date).label("date"))
+        if as_of is not None:
+            latest = latest.where(InvestmentPosition.date <= as_of)
+        latest = latest.group_by(InvestmentPosition.investment_id).subquery()
+
+        stmt = (
+            select(InvestmentPosition, Investment)
+            .join(latest, (InvestmentPosition.investment_id == latest.c.investment_id)
+                  & (InvestmentPosition.date == latest.c.date))
+            .join(Investment, Investment.id == InvestmentPosition.investment_id)
+            .where(Investment.deleted_at.is_(None))
+            .order_by(Investment.id)
+        )
+        return [tuple(row) for row in self.db.execute(stmt).all()]
+
+    def get_range(self, investment_id: int, start_date: date, end_date: date) -> List[InvestmentPosition]:
+        stmt = (
+            select(InvestmentPosition)
+            .where(
+                InvestmentPosition.investment_id == investment_id,
+                InvestmentPosition.date >= start_date,
+                InvestmentPosition.date <= end_date,
+            )
+            .order_by(InvestmentPosition.date)
+        )
+        return list(self.db.execute(stmt).scalars().all())
+
+    def get_investment_ids_with_logs(self) -> List[int]:
+        stmt = (
+            select(InvestmentLog.investment_id)
+            .where(InvestmentLog.deleted_at.is_(None))
+            .distinct()
+            .order_by(InvestmentLog.investment_id)
+        )
+        return list(self.db.execute(stmt).scalars().all())
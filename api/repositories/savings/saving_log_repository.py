@@ -1,10 +1,137 @@
 """Repository for SavingLog entity following segregated interfaces."""
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+
+from sqlalchemy import Date, cast, func, select, tuple_, update
+
 from repositories.core.base_repository import BaseRepository
-from models import SavingLog
+from models import Saving, SavingLog
+
+PROGRESS_INTERVALS = ("month", "week")
 
 
 class SavingLogRepository(BaseRepository[SavingLog]):
-    """Repository for SavingLog with custom queries."""
+    """
+    Repository for SavingLog with custom queries.
+
+    total_amount is the running sum of amount per saving, in (date, id)
+    order. The total_* methods keep it up to date and do not commit.
+    """
 
     def __init__(self, db):
         super().__init__(db, SavingLog)
+
+    @staticmethod
+    def _after(day: date, log_id: Optional[int]):
+        """Logs strictly after (day, log_id); log_id None means after the whole day (a new log)."""
+        if log_id is None:
+            return SavingLog.date > day
+        return tuple_(SavingLog.date, SavingLog.id) > tuple_(day, log_id)
+
+    def total_before(self, saving_id: int, day: date, log_id: Optional[int] = None) -> Decimal:
+        """
+        total_amount of the last live log of a saving before (day, log_id).
+
+        The log itself never counts: when it moves to a later date its stored
+        row (old date, stale total) sorts before the new position.
+        """
+        conditions = [SavingLog.saving_id == saving_id, SavingLog.deleted_at.is_(None)]
+        if log_id is None:
+            conditions.append(SavingLog.date <= day)
+        else:
+            conditions += [tuple_(SavingLog.date, SavingLog.id) < tuple_(day, log_id), SavingLog.id != log_id]
+        stmt = (
+            select(SavingLog.total_amount)
+            .where(*conditions)
+            .order_by(SavingLog.date.desc(), SavingLog.id.desc())
+            .limit(1)
+        )
+        return Decimal(self.db.execute(stmt).scalar_one_or_none() or 0)
+
+    def shift_totals(self, saving_id: int, day: date, log_id: Optional[int], delta: Decimal) -> None:
+        """Add delta to total_amount of every live log of a saving after (day, log_id)."""
+        if not delta:
+            return
+        self.db.execute(
+            update(SavingLog)
+            .where(SavingLog.saving_id == saving_id, SavingLog.deleted_at.is_(None), self._after(day, log_id))
+            .values(total_amount=func.coalesce(SavingLog.total_amount, 0) + delta)
+            .execution_options(synchronize_session=False)
+        )
+
+    def recompute_totals(self, saving_id: Optional[int] = None) -> int:
+        """
+        Rewrite total_amount from the amounts (one saving, all when None) in
+        one windowed UPDATE. Returns the number of rows that had drifted.
+        """
+        running = (
+            select(
+                SavingLog.id,
+                func.round(
+                    func.sum(SavingLog.amount).over(
+                        partition_by=SavingLog.saving_id, order_by=(SavingLog.date, SavingLog.id)
+                    ),
+                    2,
+                ).label("total"),
+            )
+            .where(SavingLog.deleted_at.is_(None))
+        )
+        if saving_id is not None:
+            running = running.where(SavingLog.saving_id == saving_id)
+        running = running.subquery()
+
+        result = self.db.execute(
+            update(SavingLog)
+            .where(SavingLog.id == running.c.id, SavingLog.total_amount.is_distinct_from(running.c.total))
+            .values(total_amount=running.c.total)
+            .execution_options(synchronize_session=False)
+        )
+        return max(result.rowcount, 0)
+
+    def _bucket(self, interval: str):
+        """First day of the month / ISO week (Monday) of the log date."""
+        if interval not in PROGRESS_INTERVALS:
+            raise ValueError(f"Invalid interval: {interval}")
+        if self.db.get_bind().dialect.name == "sqlite":
+            if interval == "month":
+                return func.date(SavingLog.date, "start of month", type_=Date)
+            return func.date(SavingLog.date, "weekday 0", "-6 days", type_=Date)
+        return cast(func.date_trunc(interval, SavingLog.date), Date)
+
+    def get_progress(
+        self,
+        interval: str,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        saving_id: Optional[int] = None,
+    ) -> List[tuple]:
+        """
+        (saving id, description, currency, amount, bucket, deposited, total)
+        per live saving and bucket with logs, ordered by saving and bucket.
+        amount is always positive, so the bucket's MAX(total_amount) is the
+        running total at its end.
+        """
+        bucket = self._bucket(interval).label("bucket")
+        stmt = (
+            select(
+                Saving.id,
+                Saving.description,
+                Saving.currency,
+                Saving.amount,
+                bucket,
+                func.sum(SavingLog.amount),
+                func.max(SavingLog.total_amount),
+            )
+            .join(Saving, Saving.id == SavingLog.saving_id)
+            .where(SavingLog.deleted_at.is_(None), Saving.deleted_at.is_(None))
+            .group_by(Saving.id, Saving.description, Saving.currency, Saving.amount, bucket)
+            .order_by(Saving.id, bucket)
+        )
+        if date_from is not None:
+            stmt = stmt.where(SavingLog.date >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(SavingLog.date <= date_to)
+        if saving_id is not None:
+            stmt = stmt.where(SavingLog.saving_id == saving_id)
+        return list(self.db.execute(stmt).all())
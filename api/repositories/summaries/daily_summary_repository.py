@@ -0,0 +1,109 @@
+"""Repository for the daily_summary rollup table."""
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, func, insert, literal, select, true, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from repositories.core.base_repository import BaseRepository
+from models import DailySummary, Expense, Income, Investment
+
+# (date, type, category_id) -> (total delta, count delta)
+SummaryDeltas = Dict[Tuple[date, str, int], Tuple[Decimal, int]]
+
+SUMMARY_SOURCES = (
+    ("expense", Expense),
+    ("income", Income),
+    ("investment", Investment),
+)
+
+
+class DailySummaryRepository(BaseRepository[DailySummary]):
+    """Incremental upserts, range reads and rebuilds of daily_summary. Does not commit."""
+
+    def __init__(self, db):
+        super().__init__(db, DailySummary)
+
+    def apply_deltas(self, deltas: SummaryDeltas) -> None:
+        """Add total/count deltas to their rows, creating missing rows (one upsert statement)."""
+        rows = [
+            {"date": key[0], "type": key[1], "category_id": key[2], "total": total, "count": count}
+            for key, (total, count) in deltas.items()
+            if total or count
+        ]
+        if not rows:
+            return
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = dialect_insert(DailySummary)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["date", "type", "category_id"],
+                set_={
+                    "total": DailySummary.total + stmt.excluded.total,
+                    "count": DailySummary.count + stmt.excluded.count,
+                }
+            )
+            self.db.execute(stmt, rows)
+            return
+
+        # Portable fallback: update, insert when the row does not exist yet
+        for row in rows:
+            result = self.db.execute(
+                update(DailySummary)
+                .where(
+                    DailySummary.date == row["date"],
+                    DailySummary.type == row["type"],
+                    DailySummary.category_id == row["category_id"],
+                )
+                .values(total=DailySummary.total + row["total"], count=DailySummary.count + row["count"])
+            )
+            if result.rowcount == 0:
+                self.db.execute(insert(DailySummary), row)
+
+    def get_range(self, start_date: date, end_date: date) -> List[DailySummary]:
+        stmt = select(DailySummary).where(
+            DailySummary.date >= start_date,
+            DailySummary.date <= end_date,
+            DailySummary.count > 0,
+        )
+        return list(self.db.execute(stmt).scalars().all())
+
+    def rebuild(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> int:
+        """
+        Recompute rows of a date range (everything when no bounds) from the
+        transaction tables with one INSERT ... SELECT per table.
+        Returns the number of rows written.
+        """
+        def in_range(column):
+            conditions = []
+            if start_date is not None:
+                conditions.append(column >= start_date)
+            if end_date is not None:
+                conditions.append(column <= end_date)
+            return and_(*conditions) if conditions else true()
+
+        self.db.execute(delete(DailySummary).where(in_range(DailySummary.date)))
+
+        written = 0
+        for type_, model in SUMMARY_SOURCES:
+            aggregated = (
+                select(
+                    model.date,
+                    literal(type_),
+                    model.category_id,
+                    func.sum(model.amount),
+                    func.count(model.id),
+                )
+                .where(model.deleted_at.is_(None), in_range(model.date))
+                .group_by(model.date, model.category_id)
+            )
+            result = self.db.execute(
+                insert(DailySummary).from_select(
+                    ["date", "type", "category_id", "total", "count"], aggregated
+                )
+            )
+            written += max(result.rowcount, 0)
+        return written
@@ -1,12 +1,13 @@
 """Summary repository for aggregation queries."""
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import Dict, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
-from models import Expense, Income, Investment
+from sqlalchemy import Select, func, and_, literal, select, union_all
+from models import DailySummary
 from models.expenses.expense_category_model import ExpensesCategory
 from models.incomes.income_category_model import IncomesCategory
 from models.investments.investment_category_model import InvestmentsCategory
+from repositories.summaries.daily_summary_repository import SUMMARY_SOURCES
 
 
 class SummaryRepository:
@@ -15,206 +16,133 @@ class SummaryRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_totals_by_category(
+    def get_summary(
         self,
         start_date: date,
-        end_date: date,
-        category_type: str = None  # 'expense' | 'income' | 'investment'
-    ) -> List[Tuple]:
-        """
-        Get total amounts aggregated by category.
-        
-        Returns list of tuples: (category_id, category_name, type, total)
+        end_date: date
+    ) -> Tuple[List[Tuple], Dict[date, Dict[str, float]], Tuple[float, float, int]]:
         """
-        results = []
+        Aggregate the transaction tables for a date range in one round trip.
 
-        # Expenses aggregation
-        if category_type is None or category_type == 'expense':
-            expenses = self.db.query(
-                Expense.category_id,
-                ExpensesCategory.name.label('category_name'),
-                func.sum(Expense.amount).label('total')
-            ).join(ExpensesCategory).filter(
-                and_(
-                    Expense.date >= start_date,
-                    Expense.date <= end_date,
-                    Expense.deleted_at.is_(None)
-                )
-            ).group_by(Expense.category_id, ExpensesCategory.name).all()
-            
-            results.extend([
-                (cat_id, cat_name, 'expense', float(total))
-                for cat_id, cat_name, total in expenses
-            ])
-
-        # Incomes aggregation
-        if category_type is None or category_type == 'income':
-            incomes = self.db.query(
-                Income.category_id,
-                IncomesCategory.name.label('category_name'),
-                func.sum(Income.amount).label('total')
-            ).join(IncomesCategory).filter(
-                and_(
-                    Income.date >= start_date,
-                    Income.date <= end_date,
-                    Income.deleted_at.is_(None)
-                )
-            ).group_by(Income.category_id, IncomesCategory.name).all()
-            
-            results.extend([
-                (cat_id, cat_name, 'income', float(total))
-                for cat_id, cat_name, total in incomes
-            ])
+        The three tables are read once through a UNION ALL grouped by
+        (date, type, category_id); category totals, daily totals and the
+        income/expense figures are folded from that result.
 
-        # Investments aggregation
-        if category_type is None or category_type == 'investment':
-            investments = self.db.query(
-                Investment.category_id,
-                InvestmentsCategory.name.label('category_name'),
-                func.sum(Investment.amount).label('total')
-            ).join(InvestmentsCategory).filter(
+        Returns (totals_by_category, totals_over_time, income_vs_expense):
+        - totals_by_category: list of (category_id, category_name, type, total)
+        - totals_over_time: {date: {'expense', 'income', 'investment', 'net'}}
+        - income_vs_expense: (total_income, total_expense, transaction_count)
+        """
+        transactions = union_all(*(
+            select(
+                model.date.label('date'),
+                literal(type_).label('type'),
+                model.category_id.label('category_id'),
+                model.amount.label('amount'),
+            ).where(
                 and_(
-                    Investment.date >= start_date,
-                    Investment.date <= end_date,
-                    Investment.deleted_at.is_(None)
+                    model.date >= start_date,
+                    model.date <= end_date,
+                    model.deleted_at.is_(None)
                 )
-            ).group_by(Investment.category_id, InvestmentsCategory.name).all()
-            
-            results.extend([
-                (cat_id, cat_name, 'investment', float(total))
-                for cat_id, cat_name, total in investments
-            ])
-
-        return results
-
-    def get_totals_over_time(
+            )
+            for type_, model in SUMMARY_SOURCES
+        )).subquery('transactions')
+
+        grouped = select(
+            transactions.c.date,
+            transactions.c.type,
+            transactions.c.category_id,
+            func.sum(transactions.c.amount).label('total'),
+            func.count().label('count')
+        ).group_by(
+            transactions.c.date, transactions.c.type, transactions.c.category_id
+        ).subquery('grouped')
+
+        rows = self.db.execute(
+            self._with_category_names(grouped.c).select_from(grouped)
+        ).all()
+        return self._roll_up(rows, start_date, end_date)
+
+    def get_summary_from_rollup(
         self,
         start_date: date,
         end_date: date
-    ) -> Dict[date, Dict[str, float]]:
+    ) -> Tuple[List[Tuple], Dict[date, Dict[str, float]], Tuple[float, float, int]]:
+        """Same result as get_summary, read from the daily_summary rollup."""
+        query = self._with_category_names(DailySummary).where(
+            and_(
+                DailySummary.date >= start_date,
+                DailySummary.date <= end_date,
+                DailySummary.count > 0
+            )
+        )
+        rows = self.db.execute(query).all()
+        return self._roll_up(rows, start_date, end_date)
+
+    @staticmethod
+    def _with_category_names(source) -> Select:
         """
-        Get daily totals aggregated by transaction type.
-        
-        Returns dict: {date: {'expense': total, 'income': total, 'investment': total, 'net': net}}
+        Select (date, type, category_id, category_name, total, count) from a
+        grouped source, resolving the name in the category table of each type.
         """
+        category_name = func.coalesce(
+            ExpensesCategory.name, IncomesCategory.name, InvestmentsCategory.name
+        ).label('category_name')
+        return select(
+            source.date,
+            source.type,
+            source.category_id,
+            category_name,
+            source.total,
+            source.count
+        ).outerjoin(
+            ExpensesCategory,
+            and_(source.type == 'expense', ExpensesCategory.id == source.category_id)
+        ).outerjoin(
+            IncomesCategory,
+            and_(source.type == 'income', IncomesCategory.id == source.category_id)
+        ).outerjoin(
+            InvestmentsCategory,
+            and_(source.type == 'investment', InvestmentsCategory.id == source.category_id)
+        )
+
+    @staticmethod
+    def _roll_up(
+        rows,
+        start_date: date,
+        end_date: date
+    ) -> Tuple[List[Tuple], Dict[date, Dict[str, float]], Tuple[float, float, int]]:
+        """Fold (date, type, category_id, category_name, total, count) rows into the summary blocks."""
         daily_totals = {}
-        
-        # Initialize all dates in range
         current = start_date
         while current <= end_date:
             daily_totals[current] = {'expense': 0.0, 'income': 0.0, 'investment': 0.0}
             current += timedelta(days=1)
 
-        # Expenses by date
-        expenses = self.db.query(
-            func.cast(Expense.date, date).label('date'),
-            func.sum(Expense.amount).label('total')
-        ).filter(
-            and_(
-                Expense.date >= start_date,
-                Expense.date <= end_date,
-                Expense.deleted_at.is_(None)
-            )
-        ).group_by(func.cast(Expense.date, date)).all()
-        
-        for exp_date, total in expenses:
-            daily_totals[exp_date]['expense'] = float(total)
-
-        # Incomes by date
-        incomes = self.db.query(
-            func.cast(Income.date, date).label('date'),
-            func.sum(Income.amount).label('total')
-        ).filter(
-            and_(
-                Income.date >= start_date,
-                Income.date <= end_date,
-                Income.deleted_at.is_(None)
-            )
-        ).group_by(func.cast(Income.date, date)).all()
-        
-        for inc_date, total in incomes:
-            daily_totals[inc_date]['income'] = float(total)
-
-        # Investments by date
-        investments = self.db.query(
-            func.cast(Investment.date, date).label('date'),
-            func.sum(Investment.amount).label('total')
-        ).filter(
-            and_(
-                Investment.date >= start_date,
-                Investment.date <= end_date,
-                Investment.deleted_at.is_(None)
-            )
-        ).group_by(func.cast(Investment.date, date)).all()
-        
-        for inv_date, total in investments:
-            daily_totals[inv_date]['investment'] = float(total)
-
-        # Calculate net
-        for date_key in daily_totals:
-            daily_totals[date_key]['net'] = (
-                daily_totals[date_key]['income'] - daily_totals[date_key]['expense']
-            )
-
-        return daily_totals
-
-    def get_income_vs_expense(
-        self,
-        start_date: date,
-        end_date: date
-    ) -> Tuple[float, float, int]:
-        """
-        Get income vs expense totals.
-        
-        Returns tuple: (total_income, total_expense, transaction_count)
-        """
-        # Total income
-        total_income = self.db.query(
-            func.coalesce(func.sum(Income.amount), 0)
-        ).filter(
-            and_(
-                Income.date >= start_date,
-                Income.date <= end_date,
-                Income.deleted_at.is_(None)
-            )
-        ).scalar() or 0.0
-
-        # Total expense
-        total_expense = self.db.query(
-            func.coalesce(func.sum(Expense.amount), 0)
-        ).filter(
-            and_(
-                Expense.date >= start_date,
-                Expense.date <= end_date,
-                Expense.deleted_at.is_(None)
-            )
-        ).scalar() or 0.0
-
-        # Transaction count
-        expense_count = self.db.query(func.count(Expense.id)).filter(
-            and_(
-                Expense.date >= start_date,
-                Expense.date <= end_date,
-                Expense.deleted_at.is_(None)
-            )
-        ).scalar() or 0
-
-        income_count = self.db.query(func.count(Income.id)).filter(
-            and_(
-                Income.date >= start_date,
-                Income.date <= end_date,
-                Income.deleted_at.is_(None)
-            )
-        ).scalar() or 0
-
-        investment_count = self.db.query(func.count(Investment.id)).filter(
-            and_(
-                Investment.date >= start_date,
-                Investment.date <= end_date,
-                Investment.deleted_at.is_(None)
-            )
-        ).scalar() or 0
-
-        total_count = expense_count + income_count + investment_count
-
-        return float(total_income), float(total_expense), total_count
+        by_category = {}
+        total_count = 0
+        for row_date, tx_type, cat_id, cat_name, total, count in rows:
+            total = float(total or 0)
+            daily_totals[row_date][tx_type] += total
+            total_count += count or 0
+            # Same as the live join: rows whose category no longer exists are left out
+            if cat_name is not None:
+                key = (tx_type, cat_id)
+                if key in by_category:
+                    by_category[key][3] += total
+                else:
+                    by_category[key] = [cat_id, cat_name, tx_type, total]
+
+        for daily in daily_totals.values():
+            daily['net'] = daily['income'] - daily['expense']
+
+        type_order = {'expense': 0, 'income': 1, 'investment': 2}
+        totals_by_category = [
+            tuple(values)
+            for _, values in sorted(by_category.items(), key=lambda item: (type_order[item[0][0]], item[0][1]))
+        ]
+        total_income = sum(daily['income'] for daily in daily_totals.values())
+        total_expense = sum(daily['expense'] for daily in daily_totals.values())
+
+        return totals_by_category, daily_totals, (total_income, total_expense, total_count)
@@ -23,3 +23,8 @@ class UserRepository(BaseRepository[User]):
         """Find user by email."""
         stmt = self._base_query().where(User.email == email)
         return self.db.execute(stmt).scalar_one_or_none()
+
+    def get_with_account_ids(self, user_id: int):
+        """Find user by id with its account memberships loaded (for principals)."""
+        stmt = self._base_query().options(selectinload(User.account_users)).where(User.id == user_id)
+        return self.db.execute(stmt).scalar_one_or_none()
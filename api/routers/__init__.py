@@ -1,3 +1,13 @@
+"""
+Blueprint registry.
+
+The core routers are always registered. The optional groups ("ai",
+"imports") are imported by register_blueprints only when enabled, so a
+process started with DISABLED_ROUTER_GROUPS=ai,imports never loads
+services.ai or services.imports.
+"""
+import os
+
 from .users.user_router import router as user_router
 from .expenses.expense_router import router as expense_router
 from .expenses.expense_category_router import router as expense_category_router
@@ -13,24 +23,43 @@ from .investments.investment_category_router import router as investment_categor
 from .finance.bank_router import router as bank_router
 from .savings.saving_log_router import router as saving_log_router
 from .investments.investment_log_router import router as investment_log_router
-from .ai.transactions_ai_router import router as transactions_ai_router
 from .core.system_router import router as core_router
 from .auth.auth_router import router as auth_router
-from .imports.import_router import router as import_router
 from .category_rules.category_rules_router import router as category_rules_router
 from .summaries.summary_router import router as summary_router
 from .cards.card_router import router as card_router
-from .imports.import_origin_router import router as import_origin_router
-from .imports.import_profile_router import router as import_profile_router
 
-def register_blueprints(app, url_prefix=""):
+OPTIONAL_ROUTER_GROUPS = ("ai", "imports")
+
+
+def disabled_router_groups(value=None):
+    """Groups listed in DISABLED_ROUTER_GROUPS (or value), e.g. "ai,imports"."""
+    if value is None:
+        value = os.getenv("DISABLED_ROUTER_GROUPS", "")
+    groups = {group.strip() for group in value.split(",") if group.strip()}
+    unknown = groups - set(OPTIONAL_ROUTER_GROUPS)
+    if unknown:
+        raise ValueError(f"Invalid DISABLED_ROUTER_GROUPS: {', '.join(sorted(unknown))}")
+    return groups
+
+
+def register_blueprints(app, url_prefix="", disabled_groups=frozenset()):
     blueprints = [
         user_router, expense_router, expense_category_router,
         household_router, household_member_router, income_category_router,
         income_router, source_router, saving_router, account_router, investment_router,
         investment_category_router, bank_router, saving_log_router, investment_log_router,
-        transactions_ai_router, core_router, auth_router, import_router, category_rules_router,
-        summary_router, card_router, import_origin_router, import_profile_router
+        core_router, auth_router, category_rules_router,
+        summary_router, card_router
     ]
+    if "ai" not in disabled_groups:
+        from .ai.transactions_ai_router import router as transactions_ai_router
+        blueprints.append(transactions_ai_router)
+    if "imports" not in disabled_groups:
+        from .imports.import_router import router as import_router
+        from .imports.import_origin_router import router as import_origin_router
+        from .imports.import_profile_router import router as import_profile_router
+        blueprints += [import_router, import_origin_router, import_profile_router]
+
     for bp in blueprints:
         app.register_blueprint(bp, url_prefix=url_prefix)
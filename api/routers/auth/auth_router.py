@@ -7,7 +7,9 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from schemas.auth.auth_schema import LoginRequest, RegisterRequest
 from services.auth.auth_service import AuthService
+from services.core.rate_limit_service import limiter, login_email_key, login_email_limit, login_ip_limit
 from services.core.response_service import Response
+from services.core.security_service import PasswordHashingBusyError
 from db.database import get_db
 
 router = Blueprint("auth", __name__)
@@ -27,12 +29,14 @@ def register():
     try:
         service = AuthService(db)
         user = service.register(data)
-        return Response.ok_data(
-            user.model_dump(),
+        return Response.ok_models(
+            user,
             _("USER_REGISTERED"),
             201,
             name
         )
+    except PasswordHashingBusyError as e:
+        return Response.error(_("SERVICE_BUSY"), str(e), 503, name)
     except ValueError as e:
         return Response.error(_("REGISTRATION_ERROR"), str(e), 409, name)
     except Exception as e:
@@ -40,6 +44,8 @@ def register():
 
 
 @router.post("/auth/login")
+@limiter.limit(login_ip_limit)
+@limiter.limit(login_email_limit, key_func=login_email_key)
 def login():
     """Authenticate user and return JWT tokens. Public endpoint."""
     db: Session = next(get_db())
@@ -61,12 +67,15 @@ def login():
                 name
             )
 
-        return Response.ok_data(
-            result.model_dump(),
+        return Response.ok_models(
+            result,
             _("LOGIN_SUCCESS"),
             200,
             name
         )
+    except PasswordHashingBusyError as e:
+        # Too many logins hashing at once: shed load instead of queueing
+        return Response.error(_("SERVICE_BUSY"), str(e), 503, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
@@ -82,8 +91,8 @@ def refresh():
         service = AuthService(db)
         result = service.refresh(current_user_id)
 
-        return Response.ok_data(
-            result.model_dump(),
+        return Response.ok_models(
+            result,
             _("TOKEN_REFRESHED"),
             200,
             name
@@ -108,8 +117,8 @@ def me():
         if not user:
             return Response.error(_("USER_NOT_FOUND"), _("USER_NOT_FOUND"), 404, name)
 
-        return Response.ok_data(
-            user.model_dump(),
+        return Response.ok_models(
+            user,
             _("USER_FOUND"),
             200,
             name
@@ -43,7 +43,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("CARD_CREATED"), 201, NAME)
+        return Response.ok_models(result, _("CARD_CREATED"), 201, NAME)
     except Exception as e:
         logger = setup_logger(NAME or "default_error_card")
         logger.exception("Unhandled error in create %s: %s", NAME, str(e))
@@ -59,7 +59,7 @@ def get_by_id(card_id: int):
     if not result:
         return Response.error(_("CARD_NOT_FOUND"), _("NONE"), 404, NAME)
 
-    return Response.ok_data(result.model_dump(), _("CARD_FOUND"), 200, NAME)
+    return Response.ok_models(result, _("CARD_FOUND"), 200, NAME)
 
 
 @router.get("/cards")
@@ -74,7 +74,7 @@ def list_all():
 
     results = service.search(**filters) if filters else service.get_all()
 
-    return Response.ok_data([r.model_dump() for r in results], _("CARD_LIST"), 200, NAME)
+    return Response.ok_models(results, _("CARD_LIST"), 200, NAME)
 
 
 @router.patch("/cards/<int:card_id>")
@@ -92,7 +92,7 @@ def update(card_id: int):
         if not result:
             return Response.error(_("CARD_NOT_FOUND"), _("NONE"), 404, NAME)
 
-        return Response.ok_data(result.model_dump(), _("CARD_UPDATED"), 200, NAME)
+        return Response.ok_models(result, _("CARD_UPDATED"), 200, NAME)
 
     except Exception as e:
         logger = setup_logger(NAME or "default_error_card")
@@ -43,7 +43,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("CATEGORY_RULE_CREATED"), 201, name)
+        return Response.ok_models(result, _("CATEGORY_RULE_CREATED"), 201, name)
     except ValueError as e:
         return Response.error(_("INVALID_DATA"), str(e), 400, name)
     except Exception as e:
@@ -59,7 +59,7 @@ def get_by_id(id):
         result = service.get_by_id(id)
         if not result:
             return Response.error(_("CATEGORY_RULE_NOT_FOUND"), _("NONE"), 404, name)
-        return Response.ok_data(result.model_dump(), _("CATEGORY_RULE_FOUND"), 200, name)
+        return Response.ok_models(result, _("CATEGORY_RULE_FOUND"), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
@@ -71,7 +71,7 @@ def list_all():
     try:
         service: IReadService = _get_read_service(db)
         results = service.get_all()
-        return Response.ok_data([r.model_dump() for r in results], _("CATEGORY_RULE_LIST"), 200, name)
+        return Response.ok_models(results, _("CATEGORY_RULE_LIST"), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
@@ -83,7 +83,7 @@ def get_active_by_type(transaction_type: str):
     try:
         service = CategoryRuleService(db)
         results = service.get_active_by_type(transaction_type)
-        return Response.ok_data([r.model_dump() for r in results], _("CATEGORY_RULE_LIST"), 200, name)
+        return Response.ok_models(results, _("CATEGORY_RULE_LIST"), 200, name)
     except ValueError as e:
         return Response.error(_("INVALID_DATA"), str(e), 400, name)
     except Exception as e:
@@ -103,7 +103,7 @@ def update(id):
         result = service.update(id, data)
         if not result:
             return Response.error(_("CATEGORY_RULE_NOT_FOUND"), _("NONE"), 404, name)
-        return Response.ok_data(result.model_dump(), _("CATEGORY_RULE_UPDATED"), 200, name)
+        return Response.ok_models(result, _("CATEGORY_RULE_UPDATED"), 200, name)
     except ValueError as e:
         return Response.error(_("INVALID_DATA"), str(e), 400, name)
     except Exception as e:
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from db.database import get_db
 from services.core.response_service import Response
+from services.core.metrics_service import metrics_registry
 from flask_babel import _
 
 router = Blueprint("core", __name__)
@@ -48,3 +49,32 @@ def get_db_info():
             500,
             name
         )
+
+
+@router.get("/system/metrics")
+def get_metrics():
+    """
+    Per-endpoint latency histograms and SQL counters of this process.
+
+    Prometheus text format; empty when METRICS_ENABLED is false. Requires
+    a JWT like every non-public route, so the scraper needs a token.
+    """
+    return metrics_registry.render(), 200, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
+
+@router.get("/system/ready")
+def get_readiness():
+    """
+    Readiness probe: 200 once this worker can reach the database, 503 otherwise.
+
+    Public and cheap (SELECT 1 on a pooled connection), meant for load
+    balancers and container orchestrators.
+    """
+    db: Session = next(get_db())
+
+    try:
+        db.execute(text("SELECT 1"))
+        return Response.ok_data({"status": "ready"}, _("READY"), 200, name)
+    except Exception as e:
+        db.rollback()
+        return Response.error(_("DATABASE_ERROR"), str(e), 503, name)
@@ -40,7 +40,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("EXPENSE_CATEGORY_CREATED"), 201, name)
+        return Response.ok_models(result, _("EXPENSE_CATEGORY_CREATED"), 201, name)
     except ValueError as e:
         return Response.error(_("INVALID_DATA"), str(e), 400, name)
     except Exception as e:
@@ -55,7 +55,7 @@ def get_by_id(id):
         result = service.get_by_id(id)
         if not result:
             return Response.error(_("EXPENSE_CATEGORY_NOT_FOUND"), _("NONE"), 404, name)
-        return Response.ok_data(result.model_dump(), _("EXPENSE_CATEGORY_FOUND"), 200, name)
+        return Response.ok_models(result, _("EXPENSE_CATEGORY_FOUND"), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
@@ -66,7 +66,7 @@ def list_all():
     try:
         service: IReadService = _get_read_service(db)
         results = service.get_all()
-        return Response.ok_data([r.model_dump() for r in results], _("EXPENSE_CATEGORY_LIST"), 200, name)
+        return Response.ok_models(results, _("EXPENSE_CATEGORY_LIST"), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
@@ -83,7 +83,7 @@ def update(id):
         result = service.update(id, data)
         if not result:
             return Response.error(_("EXPENSE_CATEGORY_NOT_FOUND"), _("NONE"), 404, name)
-        return Response.ok_data(result.model_dump(), _("EXPENSE_CATEGORY_UPDATED"), 200, name)
+        return Response.ok_models(result, _("EXPENSE_CATEGORY_UPDATED"), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
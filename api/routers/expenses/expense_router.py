@@ -5,12 +5,15 @@ from flask_babel import _
 
 from schemas.expenses.expense_schema import ExpenseBase, ExpenseCreate, ExpenseUpdate
 from schemas.core.export_schema import export_schema
+from schemas.core.pagination_schema import ExportQuery, ListQuery
 
 from services.expenses.expense_service import ExpenseService
-from services.core.interfaces import ICreateService, IReadService, IUpdateService, IDeleteService
+from services.core.interfaces import ICreateService, IReadService, IPageService, IExportService, IUpdateService, IDeleteService
 from services.core.response_service import Response
+from services.core.export_service import EXPORT_MIMETYPES
+from services.core.fk_validation_service import ForeignKeyValidationError
 
-from db.database import get_db
+from db.database import get_db, SessionFactory
 
 
 router = Blueprint('expenses', __name__)
@@ -27,6 +30,16 @@ def _get_read_service(db: Session) -> IReadService:
     return ExpenseService(db)
 
 
+def _get_page_service(db: Session) -> IPageService:
+    """Dependency: Inject only page service for list endpoints."""
+    return ExpenseService(db)
+
+
+def _get_export_service(db: Session) -> IExportService:
+    """Dependency: Inject only export service for export endpoints."""
+    return ExpenseService(db)
+
+
 def _get_update_service(db: Session) -> IUpdateService:
     """Dependency: Inject only update service for PATCH endpoints."""
     return ExpenseService(db)
@@ -57,8 +70,8 @@ def create_expense():
         # ✅ Depend only on create interface
         service: ICreateService = _get_create_service(db)
         result = service.create(expense_data)
-        return Response.ok_data(
-            result.model_dump(),
+        return Response.ok_models(
+            result,
             _("EXPENSE_CREATED"),
             201,
             name
@@ -92,12 +105,14 @@ def create_expenses_bulk():
     try:
         service = ExpenseService(db)
         result = service.create_batch_atomic(expenses_data)
-        return Response.ok_data(
-            [item.model_dump() for item in result],
+        return Response.ok_models(
+            result,
             _("EXPENSE_CREATED"),
             201,
             name
         )
+    except ForeignKeyValidationError as e:
+        return Response.error(_("FK_ERROR"), e.errors, 400, name)
     except ValueError as e:
         return Response.error(_("FK_ERROR"), str(e), 400, name)
     except Exception as e:
@@ -117,25 +132,64 @@ def get_expense(expense_id):
     if not result:
         return Response.error(_("EXPENSE_NOT_FOUND"), _("NONE"), 404, name)
 
-    return Response.ok_data(result.model_dump(), _("EXPENSE_FOUND"), 200, name)
+    return Response.ok_models(result, _("EXPENSE_FOUND"), 200, name)
 
 
 @router.get("/expenses")
 def list_expenses():
-    """Get all expenses."""
+    """
+    List expenses, newest first, one page at a time.
+
+    Query params: cursor, limit, date_from, date_to, account_id,
+    category_id, card_id, ignore_in_analysis. The response carries the
+    next_cursor to request the following page (null on the last one).
+    """
     db: Session = next(get_db())
 
-    service: IReadService = _get_read_service(db)
-    results = service.get_all()
+    try:
+        query = ListQuery.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return Response.error(_("VALIDATION_ERROR"), e.errors(), 400, name)
+
+    try:
+        service: IPageService = _get_page_service(db)
+        page = service.get_page(query)
+    except ValueError as e:
+        return Response.error(_("VALIDATION_ERROR"), str(e), 400, name)
 
-    return Response.ok_data(
-        [exp.model_dump() for exp in results],
+    return Response.ok_models_page(
+        page.items,
+        page.next_cursor,
         _("EXPENSE_LIST"),
         200,
         name
     )
 
 
+@router.get("/expenses/export")
+def export_expenses():
+    """
+    Stream every expense matching the list filters, oldest first.
+
+    Query params: format (ndjson | csv) plus the filters of GET /expenses.
+    """
+    try:
+        query = ExportQuery.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return Response.error(_("VALIDATION_ERROR"), e.errors(), 400, name)
+
+    # Own session: the request-scoped one is removed before the body is streamed
+    db: Session = SessionFactory()
+    try:
+        service: IExportService = _get_export_service(db)
+        chunks = service.export(query)
+    except ValueError as e:
+        db.close()
+        return Response.error(_("VALIDATION_ERROR"), str(e), 400, name)
+
+    return Response.stream(chunks, EXPORT_MIMETYPES[query.format], f"expenses.{query.format}", name, on_close=db.close)
+
+
 @router.patch("/expenses/<int:expense_id>")
 def update_expense(expense_id):
     """Update an expense."""
@@ -154,7 +208,7 @@ def update_expense(expense_id):
         if not result:
             return Response.error(_("EXPENSE_NOT_FOUND"), _("NONE"), 404, name)
 
-        return Response.ok_data(result.model_dump(), _("EXPENSE_UPDATED"), 200, name)
+        return Response.ok_models(result, _("EXPENSE_UPDATED"), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
@@ -190,8 +244,8 @@ def get_user_expenses(user_id):
         if not results:
             return Response.error(_("EXPENSE_NOT_FOUND"), _("NONE"), 404, name)
 
-        return Response.ok_data(
-            [r.model_dump() for r in results],
+        return Response.ok_models(
+            results,
             _("EXPENSE_FOUND"),
             200,
             name
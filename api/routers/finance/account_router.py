@@ -1,4 +1,6 @@
 """Router for Account endpoints following ISP - Dependency Inversion Principle."""
+from datetime import date
+
 from flask import Blueprint, request
 from sqlalchemy.orm import Session
 from pydantic import ValidationError
@@ -10,6 +12,7 @@ from schemas.finance.account_schema import AccountBase, AccountCreate, AccountUp
 from schemas.core.export_schema import export_schema
 
 from services.finance.account_service import AccountService
+from services.finance.account_ledger_service import AccountLedgerService
 from services.core.response_service import Response
 from services.core.interfaces import IReadService, ICreateService, IUpdateService, IDeleteService
 from services.logs.logger_service import setup_logger
@@ -55,7 +58,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("ACCOUNT_CREATED"), 201, NAME)
+        return Response.ok_models(result, _("ACCOUNT_CREATED"), 201, NAME)
     except ValueError as e:
         return Response.error(_("INVALID_DATA"), str(e), 400, NAME)
     except Exception as e:
@@ -81,7 +84,7 @@ def get_by_id(id_account):
         if not result:
             return Response.error(_("ACCOUNT_NOT_FOUND"), _("NONE"), 404, NAME)
           # 👇 DEBUG AQUÍ
-        return Response.ok_data(result.model_dump(), _("ACCOUNT_FOUND"), 200, NAME)
+        return Response.ok_models(result, _("ACCOUNT_FOUND"), 200, NAME)
     except Exception as e:
         logger = setup_logger(NAME or "default_error_source")
         logger.exception("Unhandled error in create %s: %s", NAME, str(e))
@@ -97,8 +100,8 @@ def list_all():
         service: IReadService = _get_read_service(db)
         results = service.get_all()
 
-        return Response.ok_data(
-            [r.model_dump() for r in results],
+        return Response.ok_models(
+            results,
             _("ACCOUNT_LIST"),
             200,
             NAME
@@ -126,7 +129,7 @@ def update(id_account):
         if not result:
             return Response.error(_("ACCOUNT_NOT_FOUND"), _("NONE"), 404, NAME)
 
-        return Response.ok_data(result.model_dump(), _("ACCOUNT_UPDATED"), 200, NAME)
+        return Response.ok_models(result, _("ACCOUNT_UPDATED"), 200, NAME)
     except Exception as e:
         logger = setup_logger(NAME or "default_error_source")
         logger.exception("Unhandled error in create %s: %s", NAME, str(e))
@@ -152,6 +155,66 @@ def delete(id_account):
         return Response.error(_("INTERNAL_ERROR"), _("UNEXPECTED_ERROR"), 500, NAME)
 
 
+@router.get("/accounts/<int:id_account>/balance")
+def get_balance(id_account):
+    """
+    Balance of an account at the end of a day, from the running ledger.
+
+    Query Parameters:
+    - date: YYYY-MM-DD (default: today)
+    """
+    db: Session = next(get_db())
+
+    try:
+        on = date.fromisoformat(request.args["date"]) if request.args.get("date") else date.today()
+    except ValueError as e:
+        return Response.error(_("VALIDATION_ERROR"), f"Invalid date format. Use YYYY-MM-DD: {str(e)}", 400, NAME)
+
+    try:
+        if not _get_read_service(db).get_by_id(id_account):
+            return Response.error(_("ACCOUNT_NOT_FOUND"), _("NONE"), 404, NAME)
+        result = AccountLedgerService(db).get_balance(id_account, on)
+        return Response.ok_models(result, _("ACCOUNT_FOUND"), 200, NAME)
+    except Exception as e:
+        logger = setup_logger(NAME or "default_error_source")
+        logger.exception("Unhandled error in balance %s: %s", NAME, str(e))
+        return Response.error(_("INTERNAL_ERROR"), _("UNEXPECTED_ERROR"), 500, NAME)
+
+
+@router.get("/accounts/<int:id_account>/balance/history")
+def get_balance_history(id_account):
+    """
+    Running balance of an account over a date range.
+
+    Query Parameters:
+    - start_date: YYYY-MM-DD (required)
+    - end_date: YYYY-MM-DD (required)
+    """
+    db: Session = next(get_db())
+
+    start_date_str = request.args.get("start_date")
+    end_date_str = request.args.get("end_date")
+    if not start_date_str or not end_date_str:
+        return Response.error(_("VALIDATION_ERROR"), "start_date and end_date are required", 400, NAME)
+    try:
+        start_date = date.fromisoformat(start_date_str)
+        end_date = date.fromisoformat(end_date_str)
+    except ValueError as e:
+        return Response.error(_("VALIDATION_ERROR"), f"Invalid date format. Use YYYY-MM-DD: {str(e)}", 400, NAME)
+
+    try:
+        if not _get_read_service(db).get_by_id(id_account):
+            return Response.error(_("ACCOUNT_NOT_FOUND"), _("NONE"), 404, NAME)
+        result = AccountLedgerService(db).get_history(id_account, start_date, end_date)
+        return Response.ok_models(result, _("ACCOUNT_FOUND"), 200, NAME)
+    except ValueError as e:
+        return Response.error(_("VALIDATION_ERROR"), str(e), 400, NAME)
+    except Exception as e:
+        logger = setup_logger(NAME or "default_error_source")
+        logger.exception("Unhandled error in balance history %s: %s", NAME, str(e))
+        return Response.error(_("INTERNAL_ERROR"), _("UNEXPECTED_ERROR"), 500, NAME)
+
+
 @router.get("/meta/account")
 def get_meta():
     return export_schema(AccountCreate)
@@ -55,7 +55,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("BANK_CREATED"), 201, NAME)
+        return Response.ok_models(result, _("BANK_CREATED"), 201, NAME)
     except ValueError as e:
         return Response.error(_("INVALID_DATA"), str(e), 400, NAME)
     except Exception as e:
@@ -76,7 +76,7 @@ def get_by_id(id):
         if not result:
             return Response.error(_("BANK_NOT_FOUND"), _("NONE"), 404, NAME)
 
-        return Response.ok_data(result.model_dump(), _("BANK_FOUND"), 200, NAME)
+        return Response.ok_models(result, _("BANK_FOUND"), 200, NAME)
     except Exception as e:
         logger = setup_logger(NAME or "default_error_source")
         logger.exception("Unhandled error in get %s by ID %s", NAME, str(e))
@@ -92,8 +92,8 @@ def list_all():
         service: IReadService = _get_read_service(db)
         results = service.get_all()
 
-        return Response.ok_data(
-            [r.model_dump() for r in results],
+        return Response.ok_models(
+            results,
             _("BANK_LIST"),
             200,
             NAME
@@ -121,7 +121,7 @@ def update(bank_id: int):
         if not result:
             return Response.error(_("BANK_NOT_FOUND"), _("NONE"), 404, NAME)
 
-        return Response.ok_data(result.model_dump(), _("BANK_UPDATED"), 200, NAME)
+        return Response.ok_models(result, _("BANK_UPDATED"), 200, NAME)
     except Exception as e:
         logger = setup_logger(NAME or "default_error_source")
         logger.exception("Unhandled error in update %s: %s", NAME, str(e))
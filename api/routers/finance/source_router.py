@@ -45,7 +45,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("SOURCE_CREATED"), 201, NAME)
+        return Response.ok_models(result, _("SOURCE_CREATED"), 201, NAME)
     except Exception as e:
         logger = setup_logger(NAME or "default_error_source")
         logger.exception("Unhandled error in create %s: %s", NAME, str(e))
@@ -59,7 +59,7 @@ def get_by_id(source_id: int):
     result = service.get_by_id(source_id)
     if not result:
         return Response.error(_("SOURCE_NOT_FOUND"), _("NONE"), 404, NAME)
-    return Response.ok_data(result.model_dump(), _("SOURCE_FOUND"), 200, NAME)
+    return Response.ok_models(result, _("SOURCE_FOUND"), 200, NAME)
 
 
 @router.get("/sources")
@@ -67,7 +67,7 @@ def list_all():
     db: Session = next(get_db())
     service: IReadService = _get_read_service(db)
     results = service.get_all()
-    return Response.ok_data([r.model_dump() for r in results], _("SOURCE_LIST"), 200, NAME)
+    return Response.ok_models(results, _("SOURCE_LIST"), 200, NAME)
 
 
 @router.get("/sources/suggest")
@@ -85,7 +85,7 @@ def suggest_source():
         suggested = source_service.suggest_source(category_id, transaction_type)
         if not suggested:
             return Response.error(_("SOURCE_NOT_FOUND"), _("NONE"), 404, NAME)
-        return Response.ok_data(suggested.model_dump(), _("SOURCE_SUGGESTED"), 200, NAME)
+        return Response.ok_models(suggested, _("SOURCE_SUGGESTED"), 200, NAME)
     except Exception as e:
         logger = setup_logger(NAME or "default_error_source")
         logger.exception("Unhandled error in update %s: %s", NAME, str(e))
@@ -104,7 +104,7 @@ def update(source_id: int):
         result = service.update(source_id, data)
         if not result:
             return Response.error(_("SOURCE_NOT_FOUND"), _("NONE"), 404, NAME)
-        return Response.ok_data(result.model_dump(), _("SOURCE_UPDATED"), 200, NAME)
+        return Response.ok_models(result, _("SOURCE_UPDATED"), 200, NAME)
     except Exception as e:
         logger = setup_logger(NAME or "default_error_source")
         logger.exception("Unhandled error in update %s: %s", NAME, str(e))
@@ -43,7 +43,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("HOUSEHOLD_CREATED"), 201, name)
+        return Response.ok_models(result, _("HOUSEHOLD_CREATED"), 201, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
@@ -55,7 +55,7 @@ def get_by_id(id):
     result = service.get_by_id(id)
     if not result:
         return Response.error(_("HOUSEHOLD_NOT_FOUND"), _("NONE"), 404, name)
-    return Response.ok_data(result.model_dump(), _("HOUSEHOLD_FOUND"), 200, name)
+    return Response.ok_models(result, _("HOUSEHOLD_FOUND"), 200, name)
 
 
 @router.get("/households")
@@ -63,7 +63,7 @@ def list_all():
     db: Session = next(get_db())
     service: IReadService = _get_read_service(db)
     results = service.get_all()
-    return Response.ok_data([r.model_dump() for r in results], _("HOUSEHOLD_LIST"), 200, name)
+    return Response.ok_models(results, _("HOUSEHOLD_LIST"), 200, name)
 
 
 @router.patch("/households/<int:id>")
@@ -78,7 +78,7 @@ def update(id):
         result = service.update(id, data)
         if not result:
             return Response.error(_("HOUSEHOLD_NOT_FOUND"), _("NONE"), 404, name)
-        return Response.ok_data(result.model_dump(), _("HOUSEHOLD_UPDATED"), 200, name)
+        return Response.ok_models(result, _("HOUSEHOLD_UPDATED"), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
@@ -64,7 +64,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("IMPORT_PROFILE_CREATED"), 201, NAME)
+        return Response.ok_models(result, _("IMPORT_PROFILE_CREATED"), 201, NAME)
     except Exception as e:
         return handle_exception(e, "create")
 
@@ -77,7 +77,7 @@ def get_by_id(origin_id: int):
     if not result:
         return Response.error(_("IMPORT_PROFILE_NOT_FOUND"), _("NONE"), 404, NAME)
 
-    return Response.ok_data(result.model_dump(), _("IMPORT_PROFILE_FOUND"), 200, NAME)
+    return Response.ok_models(result, _("IMPORT_PROFILE_FOUND"), 200, NAME)
 
 
 @router.get("/import-origins")
@@ -85,8 +85,8 @@ def list_all():
     db: Session = next(get_db())
     service: IReadService = _get_read_service(db)
     results = service.get_all()
-    return Response.ok_data(
-        [r.model_dump() for r in results],
+    return Response.ok_models(
+        results,
         _("IMPORT_PROFILE_LIST"),
         200,
         NAME
@@ -108,7 +108,7 @@ def update(origin_id: int):
         if not result:
             return Response.error(_("IMPORT_PROFILE_NOT_FOUND"), _("NONE"), 404, NAME)
 
-        return Response.ok_data(result.model_dump(), _("IMPORT_PROFILE_UPDATED"), 200, NAME)
+        return Response.ok_models(result, _("IMPORT_PROFILE_UPDATED"), 200, NAME)
 
     except Exception as e:
         return handle_exception(e, "update")
@@ -50,7 +50,7 @@ def create():
 
     try:
         result = get_service(db).create(data)
-        return Response.ok_data(result.model_dump(), _("IMPORT_PROFILE_CREATED"), 201, NAME)
+        return Response.ok_models(result, _("IMPORT_PROFILE_CREATED"), 201, NAME)
     except Exception as e:
         return handle_exception(e, "create")
 
@@ -63,7 +63,7 @@ def get_by_id(profile_id: int):
     if not result:
         return Response.error(_("IMPORT_PROFILE_NOT_FOUND"), _("NONE"), 404, NAME)
 
-    return Response.ok_data(result.model_dump(), _("IMPORT_PROFILE_FOUND"), 200, NAME)
+    return Response.ok_models(result, _("IMPORT_PROFILE_FOUND"), 200, NAME)
 
 
 @router.get("/import-profiles")
@@ -71,8 +71,8 @@ def list_all():
     db: Session = next(get_db())
 
     results = get_service(db).get_all()
-    return Response.ok_data(
-        [r.model_dump() for r in results],
+    return Response.ok_models(
+        results,
         _("IMPORT_PROFILE_LIST"),
         200,
         NAME
@@ -93,7 +93,7 @@ def update(profile_id: int):
         if not result:
             return Response.error(_("IMPORT_PROFILE_NOT_FOUND"), _("NONE"), 404, NAME)
 
-        return Response.ok_data(result.model_dump(), _("IMPORT_PROFILE_UPDATED"), 200, NAME)
+        return Response.ok_models(result, _("IMPORT_PROFILE_UPDATED"), 200, NAME)
 
     except Exception as e:
         return handle_exception(e, "update")
@@ -1,12 +1,18 @@
-from flask import Blueprint, request
+from flask import Blueprint, g, request
+from flask_jwt_extended import get_jwt_identity
 from sqlalchemy.orm import Session
 from pydantic import ValidationError
 from flask_babel import _
 
-from schemas.imports.import_schema import BulkImportRequest
-from services.imports.import_service import ImportService
+from models.core.enums import UserRoleEnum
+from schemas.imports.import_schema import BulkImportRequest, StatementUploadRequest
 from db.database import get_db
 from services.core.response_service import Response
+from services.core.fk_validation_service import ForeignKeyValidationError
+from repositories.imports.import_profile_repository import ImportProfileRepository
+from services.imports.import_service import ImportService
+from services.imports.import_job_service import ImportJobService
+from services.imports.statement_reader import StatementFormatError
 
 
 router = Blueprint("imports", __name__)
@@ -18,7 +24,8 @@ def import_transactions_bulk():
     """
     Import multiple expenses and incomes atomically.
 
-    If any item fails format or fk validation, none are persisted.
+    If any item fails format or fk validation, none are persisted. Items
+    left without a category are skipped and counted under "uncategorized".
     """
     db: Session = next(get_db())
 
@@ -36,8 +43,112 @@ def import_transactions_bulk():
             201,
             name
         )
+    except ForeignKeyValidationError as e:
+        return Response.error(_("FK_ERROR"), e.errors, 400, name)
+    except ValueError as e:
+        return Response.error(_("FK_ERROR"), str(e), 400, name)
+    except Exception as e:
+        db.rollback()
+        return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
+
+
+@router.post("/imports/transactions/upload")
+def import_transactions_upload():
+    """
+    Import a CSV/XLSX bank statement uploaded as multipart/form-data.
+
+    The file is streamed server-side with the column aliases of the selected
+    import profile and imported chunk by chunk; the response lists the
+    counts of every chunk.
+    """
+    db: Session = next(get_db())
+
+    upload = request.files.get("file")
+    if upload is None or not upload.filename:
+        return Response.error(_("VALIDATION_ERROR"), "A statement file is required", 400, name)
+
+    try:
+        data = StatementUploadRequest.model_validate(request.form.to_dict())
+    except ValidationError as e:
+        return Response.error(_("VALIDATION_ERROR"), e.errors(), 400, name)
+
+    profile = ImportProfileRepository(db).get_by_id(data.profile_id)
+    if profile is None or not profile.active:
+        return Response.error(_("IMPORT_PROFILE_NOT_FOUND"), _("NONE"), 404, name)
+
+    try:
+        service = ImportService(db)
+        result = service.import_statement(
+            stream=upload.stream,
+            filename=upload.filename,
+            profile=profile,
+            account_id=data.account_id,
+            user_id=data.user_id or int(get_jwt_identity()),
+            expense_source_id=data.expense_source_id,
+            income_source_id=data.income_source_id,
+            card_id=data.card_id,
+            currency=data.currency,
+            auto_categorize=data.auto_categorize,
+            chunk_size=data.chunk_size,
+            encoding=data.encoding,
+            fuzzy_dedup=data.fuzzy_dedup,
+        )
+        return Response.ok_data(
+            result,
+            _("TRANSACTIONS_IMPORTED", default="Transactions imported successfully"),
+            201,
+            name
+        )
+    except StatementFormatError as e:
+        return Response.error(_("IMPORT_FORMAT_ERROR"), str(e), 400, name)
+    except ForeignKeyValidationError as e:
+        return Response.error(_("FK_ERROR"), e.errors, 400, name)
     except ValueError as e:
         return Response.error(_("FK_ERROR"), str(e), 400, name)
     except Exception as e:
         db.rollback()
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
+
+
+@router.post("/imports/jobs")
+def create_import_job():
+    """
+    Queue a bulk import (same body as /imports/transactions/bulk).
+
+    Returns 202 with the job right away; poll GET /imports/jobs/<id>.
+    """
+    db: Session = next(get_db())
+
+    try:
+        data = BulkImportRequest.model_validate(request.json)
+    except ValidationError as e:
+        return Response.error(_("VALIDATION_ERROR"), e.errors(), 400, name)
+
+    try:
+        job = ImportJobService(db).enqueue(data, user_id=int(get_jwt_identity()))
+        return Response.ok_models(
+            job,
+            _("IMPORT_JOB_QUEUED", default="Import job queued"),
+            202,
+            name
+        )
+    except Exception as e:
+        db.rollback()
+        return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
+
+
+@router.get("/imports/jobs/<int:job_id>")
+def get_import_job(job_id: int):
+    """
+    Status, processed rows, duplicates and errors of an import job.
+
+    Users see their own jobs, administrators every job.
+    """
+    db: Session = next(get_db())
+
+    job = ImportJobService(db).get(job_id)
+    # Other users' jobs are reported as missing, not forbidden
+    principal = g.principal
+    if job is None or (job.user_id != principal.id and not principal.has_role(UserRoleEnum.ADMIN)):
+        return Response.error(_("IMPORT_JOB_NOT_FOUND"), _("NONE"), 404, name)
+    return Response.ok_models(job, _("IMPORT_JOB_FOUND", default="Import job found"), 200, name)
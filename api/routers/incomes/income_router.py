@@ -6,11 +6,14 @@ from flask_babel import _
 
 from schemas.incomes.income_schema import IncomeBase, IncomeCreate, IncomeUpdate
 from schemas.core.export_schema import export_schema
+from schemas.core.pagination_schema import ExportQuery, ListQuery
 
 from services.incomes.income_service import IncomeService
-from services.core.interfaces import IReadService, ICreateService, IUpdateService, IDeleteService
-from db.database import get_db
+from services.core.interfaces import IReadService, IPageService, IExportService, ICreateService, IUpdateService, IDeleteService
+from db.database import get_db, SessionFactory
 from services.core.response_service import Response
+from services.core.export_service import EXPORT_MIMETYPES
+from services.core.fk_validation_service import ForeignKeyValidationError
 
 
 router = Blueprint("incomes", __name__)
@@ -25,6 +28,14 @@ def _get_read_service(db: Session) -> IReadService:
     return IncomeService(db)
 
 
+def _get_page_service(db: Session) -> IPageService:
+    return IncomeService(db)
+
+
+def _get_export_service(db: Session) -> IExportService:
+    return IncomeService(db)
+
+
 def _get_update_service(db: Session) -> IUpdateService:
     return IncomeService(db)
 
@@ -43,7 +54,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("INCOME_CREATED"), 201, name)
+        return Response.ok_models(result, _("INCOME_CREATED"), 201, name)
     except ValueError as e:
         if str(e) == "DUPLICATE_TRANSACTION":
             return Response.error(_("DUPLICATE_TRANSACTION"), str(e), 409, name)
@@ -65,7 +76,9 @@ def create_bulk():
     try:
         service = IncomeService(db)
         result = service.create_batch_atomic(data)
-        return Response.ok_data([r.model_dump() for r in result], _("INCOME_CREATED"), 201, name)
+        return Response.ok_models(result, _("INCOME_CREATED"), 201, name)
+    except ForeignKeyValidationError as e:
+        return Response.error(_("FK_ERROR"), e.errors, 400, name)
     except ValueError as e:
         return Response.error(_("FK_ERROR"), str(e), 400, name)
     except Exception as e:
@@ -80,15 +93,39 @@ def get_by_id(id):
     result = service.get_by_id(id)
     if not result:
         return Response.error(_("INCOME_NOT_FOUND"), _("NONE"), 404, name)
-    return Response.ok_data(result.model_dump(), _("INCOME_FOUND"), 200, name)
+    return Response.ok_models(result, _("INCOME_FOUND"), 200, name)
 
 
 @router.get("/incomes")
 def list_all():
     db: Session = next(get_db())
-    service: IReadService = _get_read_service(db)
-    results = service.get_all()
-    return Response.ok_data([r.model_dump() for r in results], _("INCOME_LIST"), 200, name)
+    try:
+        query = ListQuery.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return Response.error(_("VALIDATION_ERROR"), e.errors(), 400, name)
+    try:
+        service: IPageService = _get_page_service(db)
+        page = service.get_page(query)
+    except ValueError as e:
+        return Response.error(_("VALIDATION_ERROR"), str(e), 400, name)
+    return Response.ok_models_page(page.items, page.next_cursor, _("INCOME_LIST"), 200, name)
+
+
+@router.get("/incomes/export")
+def export_all():
+    try:
+        query = ExportQuery.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return Response.error(_("VALIDATION_ERROR"), e.errors(), 400, name)
+    # Own session: the request-scoped one is removed before the body is streamed
+    db: Session = SessionFactory()
+    try:
+        service: IExportService = _get_export_service(db)
+        chunks = service.export(query)
+    except ValueError as e:
+        db.close()
+        return Response.error(_("VALIDATION_ERROR"), str(e), 400, name)
+    return Response.stream(chunks, EXPORT_MIMETYPES[query.format], f"incomes.{query.format}", name, on_close=db.close)
 
 
 @router.patch("/incomes/<int:id>")
@@ -103,7 +140,7 @@ def update(id):
         result = service.update(id, data)
         if not result:
             return Response.error(_("INCOME_NOT_FOUND"), _("NONE"), 404, name)
-        return Response.ok_data(result.model_dump(), _("INCOME_UPDATED"), 200, name)
+        return Response.ok_models(result, _("INCOME_UPDATED"), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
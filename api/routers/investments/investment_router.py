@@ -1,4 +1,6 @@
 """Router for Investment endpoints following ISP."""
+from datetime import date
+
 from flask import Blueprint, request
 from sqlalchemy.orm import Session
 from pydantic import ValidationError
@@ -6,11 +8,14 @@ from flask_babel import _
 
 from schemas.investments.investment_schema import InvestmentBase, InvestmentCreate, InvestmentUpdate
 from schemas.core.export_schema import export_schema
+from schemas.core.pagination_schema import ExportQuery, ListQuery
 
 from services.investments.investment_service import InvestmentService
-from services.core.interfaces import IReadService, ICreateService, IUpdateService, IDeleteService
-from db.database import get_db
+from services.investments.investment_position_service import InvestmentPositionService
+from services.core.interfaces import IReadService, IPageService, IExportService, ICreateService, IUpdateService, IDeleteService
+from db.database import get_db, SessionFactory
 from services.core.response_service import Response
+from services.core.export_service import EXPORT_MIMETYPES
 
 
 router = Blueprint("investments", __name__)
@@ -25,6 +30,14 @@ def _get_read_service(db: Session) -> IReadService:
     return InvestmentService(db)
 
 
+def _get_page_service(db: Session) -> IPageService:
+    return InvestmentService(db)
+
+
+def _get_export_service(db: Session) -> IExportService:
+    return InvestmentService(db)
+
+
 def _get_update_service(db: Session) -> IUpdateService:
     return InvestmentService(db)
 
@@ -43,7 +56,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("INVESTMENT_CREATED"), 201, name)
+        return Response.ok_models(result, _("INVESTMENT_CREATED"), 201, name)
     except ValueError as e:
         if str(e) == "DUPLICATE_TRANSACTION":
             return Response.error(_("DUPLICATE_TRANSACTION"), str(e), 409, name)
@@ -59,15 +72,90 @@ def get_by_id(id):
     result = service.get_by_id(id)
     if not result:
         return Response.error(_("INVESTMENT_NOT_FOUND"), _("NONE"), 404, name)
-    return Response.ok_data(result.model_dump(), _("INVESTMENT_FOUND"), 200, name)
+    return Response.ok_models(result, _("INVESTMENT_FOUND"), 200, name)
 
 
 @router.get("/investments")
 def list_all():
     db: Session = next(get_db())
-    service: IReadService = _get_read_service(db)
-    results = service.get_all()
-    return Response.ok_data([r.model_dump() for r in results], _("INVESTMENT_LIST"), 200, name)
+    try:
+        query = ListQuery.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return Response.error(_("VALIDATION_ERROR"), e.errors(), 400, name)
+    try:
+        service: IPageService = _get_page_service(db)
+        page = service.get_page(query)
+    except ValueError as e:
+        return Response.error(_("VALIDATION_ERROR"), str(e), 400, name)
+    return Response.ok_models_page(page.items, page.next_cursor, _("INVESTMENT_LIST"), 200, name)
+
+
+@router.get("/investments/export")
+def export_all():
+    try:
+        query = ExportQuery.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return Response.error(_("VALIDATION_ERROR"), e.errors(), 400, name)
+    # Own session: the request-scoped one is removed before the body is streamed
+    db: Session = SessionFactory()
+    try:
+        service: IExportService = _get_export_service(db)
+        chunks = service.export(query)
+    except ValueError as e:
+        db.close()
+        return Response.error(_("VALIDATION_ERROR"), str(e), 400, name)
+    return Response.stream(chunks, EXPORT_MIMETYPES[query.format], f"investments.{query.format}", name, on_close=db.close)
+
+
+@router.get("/investments/portfolio")
+def get_portfolio():
+    """
+    Latest position of every investment and totals per currency.
+
+    Query Parameters:
+    - as_of: YYYY-MM-DD (optional, default: latest snapshot)
+    """
+    db: Session = next(get_db())
+    try:
+        as_of = date.fromisoformat(request.args["as_of"]) if request.args.get("as_of") else None
+    except ValueError as e:
+        return Response.error(_("VALIDATION_ERROR"), f"Invalid date format. Use YYYY-MM-DD: {str(e)}", 400, name)
+    try:
+        result = InvestmentPositionService(db).get_portfolio(as_of)
+        return Response.ok_models(result, _("INVESTMENT_LIST"), 200, name)
+    except Exception as e:
+        return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
+
+
+@router.get("/investments/<int:id>/valuation")
+def get_valuation(id):
+    """
+    Valuation time series of one investment.
+
+    Query Parameters:
+    - start_date: YYYY-MM-DD (required)
+    - end_date: YYYY-MM-DD (required)
+    """
+    db: Session = next(get_db())
+    start_date_str = request.args.get("start_date")
+    end_date_str = request.args.get("end_date")
+    if not start_date_str or not end_date_str:
+        return Response.error(_("VALIDATION_ERROR"), "start_date and end_date are required", 400, name)
+    try:
+        start_date = date.fromisoformat(start_date_str)
+        end_date = date.fromisoformat(end_date_str)
+    except ValueError as e:
+        return Response.error(_("VALIDATION_ERROR"), f"Invalid date format. Use YYYY-MM-DD: {str(e)}", 400, name)
+
+    if not _get_read_service(db).get_by_id(id):
+        return Response.error(_("INVESTMENT_NOT_FOUND"), _("NONE"), 404, name)
+    try:
+        result = InvestmentPositionService(db).get_valuation(id, start_date, end_date)
+        return Response.ok_models(result, _("INVESTMENT_FOUND"), 200, name)
+    except ValueError as e:
+        return Response.error(_("VALIDATION_ERROR"), str(e), 400, name)
+    except Exception as e:
+        return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
 
 @router.patch("/investments/<int:id>")
@@ -82,7 +170,7 @@ def update(id):
         result = service.update(id, data)
         if not result:
             return Response.error(_("INVESTMENT_NOT_FOUND"), _("NONE"), 404, name)
-        return Response.ok_data(result.model_dump(), _("INVESTMENT_UPDATED"), 200, name)
+        return Response.ok_models(result, _("INVESTMENT_UPDATED"), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
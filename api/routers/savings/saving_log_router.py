@@ -6,9 +6,10 @@ from flask_babel import _
 
 from schemas.savings.saving_log_schema import SavingLogBase, SavingLogCreate, SavingLogUpdate
 from schemas.core.export_schema import export_schema
+from schemas.core.pagination_schema import ListQuery
 
 from services.savings.saving_log_service import SavingLogService
-from services.core.interfaces import IReadService, ICreateService, IUpdateService, IDeleteService
+from services.core.interfaces import IReadService, IPageService, ICreateService, IUpdateService, IDeleteService
 from db.database import get_db
 from services.core.response_service import Response
 
@@ -25,6 +26,10 @@ def _get_read_service(db: Session) -> IReadService:
     return SavingLogService(db)
 
 
+def _get_page_service(db: Session) -> IPageService:
+    return SavingLogService(db)
+
+
 def _get_update_service(db: Session) -> IUpdateService:
     return SavingLogService(db)
 
@@ -43,7 +48,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("SAVING_LOG_CREATED"), 201, name)
+        return Response.ok_models(result, _("SAVING_LOG_CREATED"), 201, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
@@ -55,15 +60,22 @@ def get_by_id(id):
     result = service.get_by_id(id)
     if not result:
         return Response.error(_("SAVING_LOG_NOT_FOUND"), _("NONE"), 404, name)
-    return Response.ok_data(result.model_dump(), _("SAVING_LOG_FOUND"), 200, name)
+    return Response.ok_models(result, _("SAVING_LOG_FOUND"), 200, name)
 
 
 @router.get("/saving_logs")
 def list_all():
     db: Session = next(get_db())
-    service: IReadService = _get_read_service(db)
-    results = service.get_all()
-    return Response.ok_data([r.model_dump() for r in results], _("SAVING_LOG_LIST"), 200, name)
+    try:
+        query = ListQuery.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return Response.error(_("VALIDATION_ERROR"), e.errors(), 400, name)
+    try:
+        service: IPageService = _get_page_service(db)
+        page = service.get_page(query)
+    except ValueError as e:
+        return Response.error(_("VALIDATION_ERROR"), str(e), 400, name)
+    return Response.ok_models_page(page.items, page.next_cursor, _("SAVING_LOG_LIST"), 200, name)
 
 
 @router.patch("/saving_logs/<int:id>")
@@ -78,7 +90,7 @@ def update(id):
         result = service.update(id, data)
         if not result:
             return Response.error(_("SAVING_LOG_NOT_FOUND"), _("NONE"), 404, name)
-        return Response.ok_data(result.model_dump(), _("SAVING_LOG_UPDATED"), 200, name)
+        return Response.ok_models(result, _("SAVING_LOG_UPDATED"), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
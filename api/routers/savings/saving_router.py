@@ -5,9 +5,11 @@ from pydantic import ValidationError
 from flask_babel import _
 
 from schemas.savings.saving_schema import SavingBase, SavingCreate, SavingUpdate
+from schemas.savings.saving_progress_schema import SavingProgressQuery
 from schemas.core.export_schema import export_schema
 
 from services.savings.saving_service import SavingService
+from services.savings.saving_analytics_service import SavingAnalyticsService
 from services.core.interfaces import IReadService, ICreateService, IUpdateService, IDeleteService
 from services.core.response_service import Response
 
@@ -44,7 +46,7 @@ def create():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(data)
-        return Response.ok_data(result.model_dump(), _("SAVING_CREATED"), 201, NAME)
+        return Response.ok_models(result, _("SAVING_CREATED"), 201, NAME)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, NAME)
 
@@ -56,7 +58,7 @@ def get_by_id(saving_id):
     result = service.get_by_id(saving_id)
     if not result:
         return Response.error(_("SAVING_NOT_FOUND"), _("NONE"), 404, NAME)
-    return Response.ok_data(result.model_dump(), _("SAVING_FOUND"), 200, NAME)
+    return Response.ok_models(result, _("SAVING_FOUND"), 200, NAME)
 
 
 @router.get("/savings")
@@ -64,7 +66,29 @@ def list_all():
     db: Session = next(get_db())
     service: IReadService = _get_read_service(db)
     results = service.get_all()
-    return Response.ok_data([r.model_dump() for r in results], _("SAVING_LIST"), 200, NAME)
+    return Response.ok_models(results, _("SAVING_LIST"), 200, NAME)
+
+
+@router.get("/savings/progress")
+def get_progress():
+    """
+    Progress of every saving (running total per bucket).
+
+    Query Parameters:
+    - interval: month|week (optional, default: month)
+    - date_from / date_to: YYYY-MM-DD (optional)
+    - saving_id: only this saving (optional)
+    """
+    db: Session = next(get_db())
+    try:
+        query = SavingProgressQuery.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return Response.error(_("VALIDATION_ERROR"), e.errors(), 400, NAME)
+    try:
+        result = SavingAnalyticsService(db).get_progress(query)
+        return Response.ok_models(result, _("SAVING_LIST"), 200, NAME)
+    except Exception as e:
+        return Response.error(_("DATABASE_ERROR"), str(e), 500, NAME)
 
 
 @router.patch("/savings/<int:saving_id>")
@@ -79,7 +103,7 @@ def update(saving_id):
         result = service.update(saving_id, data)
         if not result:
             return Response.error(_("SAVING_NOT_FOUND"), _("NONE"), 404, NAME)
-        return Response.ok_data(result.model_dump(), _("SAVING_UPDATED"), 200, NAME)
+        return Response.ok_models(result, _("SAVING_UPDATED"), 200, NAME)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, NAME)
 
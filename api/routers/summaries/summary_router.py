@@ -91,7 +91,7 @@ def get_summary():
 
             result = service.get_summary(start_date, end_date)
 
-        return Response.ok_data(result.model_dump(), "SUMMARY_FOUND", 200, name)
+        return Response.ok_models(result, "SUMMARY_FOUND", 200, name)
 
     except ValueError as e:
         return Response.error("VALIDATION_ERROR", str(e), 400, name)
@@ -109,7 +109,7 @@ def get_week_summary():
     try:
         service = SummaryService(db)
         result = service.get_week_summary()
-        return Response.ok_data(result.model_dump(), "SUMMARY_FOUND", 200, name)
+        return Response.ok_models(result, "SUMMARY_FOUND", 200, name)
     except Exception as e:
         return Response.error("DATABASE_ERROR", f"Internal server error: {str(e)}", 500, name)
 
@@ -124,7 +124,7 @@ def get_month_summary():
     try:
         service = SummaryService(db)
         result = service.get_month_summary()
-        return Response.ok_data(result.model_dump(), "SUMMARY_FOUND", 200, name)
+        return Response.ok_models(result, "SUMMARY_FOUND", 200, name)
     except Exception as e:
         return Response.error("DATABASE_ERROR", f"Internal server error: {str(e)}", 500, name)
 
@@ -139,6 +139,6 @@ def get_year_summary():
     try:
         service = SummaryService(db)
         result = service.get_year_summary()
-        return Response.ok_data(result.model_dump(), "SUMMARY_FOUND", 200, name)
+        return Response.ok_models(result, "SUMMARY_FOUND", 200, name)
     except Exception as e:
         return Response.error("DATABASE_ERROR", f"Internal server error: {str(e)}", 500, name)
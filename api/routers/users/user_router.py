@@ -49,8 +49,8 @@ def create_user():
     try:
         service: ICreateService = _get_create_service(db)
         result = service.create(user_data)
-        return Response.ok_data(
-            result.model_dump(),
+        return Response.ok_models(
+            result,
             _("USER_CREATED"),
             201,
             name
@@ -73,7 +73,7 @@ def get_user(user_id):
         if not result:
             return Response.error(_("USER_NOT_FOUND"), _("USER_NOT_FOUND_DATABASE"), 404, name)
 
-        return Response.ok_data(result.model_dump(), _("USER_FOUND", id=user_id), 200, name)
+        return Response.ok_models(result, _("USER_FOUND", id=user_id), 200, name)
     except Exception as e:
         return Response.error(_("DATABASE_ERROR"), str(e), 500, name)
 
@@ -87,8 +87,8 @@ def list_users():
         service: IReadService = _get_read_service(db)
         results = service.get_all()
 
-        return Response.ok_data(
-            [r.model_dump() for r in results],
+        return Response.ok_models(
+            results,
             _("USER_LIST"),
             200,
             name
@@ -114,7 +114,7 @@ def update_user(user_id):
         if not result:
             return Response.error(_("USER_NOT_FOUND", id=user_id), _("USER_NOT_FOUND_DATABASE", id=user_id), 404, name)
 
-        return Response.ok_data(result.model_dump(), _("USER_UPDATED"), 200, name)
+        return Response.ok_models(result, _("USER_UPDATED"), 200, name)
     except ValueError as e:
         return Response.error(_("INVALID_DATA"), str(e), 409, name)
     except Exception as e:
@@ -0,0 +1,42 @@
+from datetime import date
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class ListFilters(BaseModel):
+    """Filters shared by the list and export endpoints."""
+
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    account_id: Optional[int] = Field(None, gt=0)
+    category_id: Optional[int] = Field(None, gt=0)
+    card_id: Optional[int] = Field(None, gt=0)
+    saving_id: Optional[int] = Field(None, gt=0)
+    ignore_in_analysis: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def check_date_range(self):
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError("date_from must be <= date_to")
+        return self
+
+    def filters(self) -> Dict[str, Any]:
+        """Filters that were actually sent."""
+        return self.model_dump(include=set(ListFilters.model_fields), exclude_none=True)
+
+
+class ListQuery(ListFilters):
+    """Query string of cursor-paginated list endpoints (newest first)."""
+
+    cursor: Optional[str] = None
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+
+
+class ExportQuery(ListFilters):
+    """Query string of export endpoints (oldest first, no paging)."""
+
+    format: Literal["ndjson", "csv"] = "ndjson"
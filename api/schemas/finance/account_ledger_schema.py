@@ -0,0 +1,30 @@
+from typing import List
+from datetime import date as DateType
+from decimal import Decimal
+from pydantic import BaseModel, Field
+
+
+class AccountBalanceRead(BaseModel):
+    """Net of the account's incomes and expenses up to and including a date."""
+    account_id: int = Field(...)
+    date: DateType = Field(...)
+    balance: Decimal = Field(...)
+
+
+class AccountLedgerPoint(BaseModel):
+    """One day with movements: its net delta and the running balance after it."""
+    date: DateType = Field(...)
+    delta: Decimal = Field(...)
+    balance: Decimal = Field(...)
+
+    class Config:
+        from_attributes = True
+
+
+class AccountBalanceHistory(BaseModel):
+    """Balance over a date range: the balance before start_date plus one point per active day."""
+    account_id: int = Field(...)
+    start_date: DateType = Field(...)
+    end_date: DateType = Field(...)
+    opening_balance: Decimal = Field(...)
+    points: List[AccountLedgerPoint] = Field(...)
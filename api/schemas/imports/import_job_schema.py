@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from models.core.enums import ImportJobStatusEnum
+from schemas.core.audit_schema import AuditFields
+
+
+class ImportJobRead(AuditFields):
+    id: int
+    kind: str
+    status: ImportJobStatusEnum
+    user_id: Optional[int] = None
+    total_rows: int
+    processed_rows: int
+    inserted: int
+    duplicates: int
+    uncategorized: int
+    possible_duplicates: int = 0
+    errors: Optional[List[Dict[str, Any]]] = None
+    attempts: int
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
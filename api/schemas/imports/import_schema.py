@@ -38,3 +38,21 @@ class BulkImportRequest(BaseModel):
     incomes: List[IncomeImportCreate] = Field(default_factory=list)
     # Option: auto_categorize transactions if category_id is null
     auto_categorize: bool = Field(default=True)
+    # Option: hold back rows resembling stored ones (see fuzzy_dedup_service)
+    fuzzy_dedup: bool = Field(default=True)
+
+
+class StatementUploadRequest(BaseModel):
+    """Form fields sent along with an uploaded CSV/XLSX statement."""
+    profile_id: int = Field(..., gt=0)
+    account_id: int = Field(..., gt=0)
+    expense_source_id: int = Field(..., gt=0)
+    income_source_id: int = Field(..., gt=0)
+    # Defaults to the authenticated user
+    user_id: Optional[int] = Field(None, gt=0)
+    card_id: Optional[int] = Field(None, gt=0)
+    currency: str = "EUR"
+    auto_categorize: bool = True
+    fuzzy_dedup: bool = True
+    chunk_size: int = Field(500, ge=50, le=5000)
+    encoding: str = "utf-8-sig"
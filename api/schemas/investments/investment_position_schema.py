@@ -0,0 +1,56 @@
+from typing import List, Optional
+from datetime import date as DateType
+
+from decimal import Decimal
+from pydantic import BaseModel, Field
+from models.core.enums import CurrencyEnum
+
+
+class InvestmentPositionPoint(BaseModel):
+    """Position of one investment at the end of a day with logs."""
+
+    date: DateType = Field(...)
+    units: Decimal = Field(...)
+    cost_basis: Decimal = Field(...)
+    realized_pnl: Decimal = Field(...)
+    market_value: Decimal = Field(...)
+    unrealized_pnl: Decimal = Field(...)
+
+
+class InvestmentPositionRead(InvestmentPositionPoint):
+    """Latest position of an investment, for the portfolio view."""
+
+    investment_id: int = Field(...)
+    description: str = Field(...)
+    currency: CurrencyEnum = Field(...)
+    category_id: int = Field(...)
+    account_id: int = Field(...)
+
+
+class PortfolioTotal(BaseModel):
+    """Sum of the positions held in one currency."""
+
+    currency: CurrencyEnum = Field(...)
+    cost_basis: Decimal = Field(...)
+    market_value: Decimal = Field(...)
+    realized_pnl: Decimal = Field(...)
+    unrealized_pnl: Decimal = Field(...)
+
+
+class PortfolioRead(BaseModel):
+    """Every investment's latest position plus totals per currency."""
+
+    as_of: Optional[DateType] = Field(None)
+    cost_method: str = Field(...)
+    positions: List[InvestmentPositionRead] = Field(...)
+    totals: List[PortfolioTotal] = Field(...)
+
+
+class InvestmentValuationRead(BaseModel):
+    """Valuation time series of one investment over a date range."""
+
+    investment_id: int = Field(...)
+    cost_method: str = Field(...)
+    start_date: DateType = Field(...)
+    end_date: DateType = Field(...)
+    points: List[InvestmentPositionPoint] = Field(...)
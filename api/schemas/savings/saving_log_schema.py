@@ -11,6 +11,7 @@ class SavingLogBase(BaseModel):
 
     date: DateType = Field(...)
     amount: Decimal = Field(..., gt=0)
+    # Running total of the saving, computed by SavingLogService (sent values are ignored)
     total_amount: Optional[Decimal] = Field(None, ge=0)
     note: Optional[str] = None
     saving_id: int = Field(..., gt=0, json_schema_extra={"ui_type": "select", "relation": "saving"})
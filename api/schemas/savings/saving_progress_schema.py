@@ -0,0 +1,48 @@
+from typing import List, Literal, Optional
+from datetime import date as DateType
+
+from decimal import Decimal
+from pydantic import BaseModel, Field, model_validator
+from models.core.enums import CurrencyEnum
+
+
+class SavingProgressQuery(BaseModel):
+    """Query string of the savings progress endpoint."""
+
+    interval: Literal["month", "week"] = "month"
+    date_from: Optional[DateType] = None
+    date_to: Optional[DateType] = None
+    saving_id: Optional[int] = Field(None, gt=0)
+
+    @model_validator(mode="after")
+    def check_date_range(self):
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError("date_from must be <= date_to")
+        return self
+
+
+class SavingProgressPoint(BaseModel):
+    """One bucket of a saving's progress."""
+
+    period: DateType = Field(..., description="First day of the month / week (Monday)")
+    deposited: Decimal = Field(...)
+    total_amount: Decimal = Field(...)
+
+
+class SavingProgressSeries(BaseModel):
+    """Progress of one saving, one point per bucket with logs."""
+
+    saving_id: int = Field(...)
+    description: str = Field(...)
+    currency: CurrencyEnum = Field(...)
+    amount: Decimal = Field(...)
+    points: List[SavingProgressPoint] = Field(...)
+
+
+class SavingProgressRead(BaseModel):
+    """Progress series of every saving over a date range."""
+
+    interval: Literal["month", "week"] = Field(...)
+    date_from: Optional[DateType] = Field(None)
+    date_to: Optional[DateType] = Field(None)
+    series: List[SavingProgressSeries] = Field(...)
@@ -0,0 +1,82 @@
+"""
+Database maintenance commands.
+
+    python scripts/maintenance.py rebuild-daily-summary [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+    python scripts/maintenance.py rebuild-account-ledger [--account ID]
+    python scripts/maintenance.py rebuild-investment-positions [--investment ID]
+    python scripts/maintenance.py recompute-saving-totals [--saving ID]
+"""
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+# Path setup — permite importar desde api/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def rebuild_daily_summary(args: argparse.Namespace) -> None:
+    from db.database import get_db_session
+    from services.summaries.daily_summary_service import DailySummaryService
+
+    with get_db_session() as db:
+        written = DailySummaryService(db).rebuild(args.start, args.end)
+    print(f"daily_summary rebuilt: {written} rows")
+
+
+def rebuild_account_ledger(args: argparse.Namespace) -> None:
+    from db.database import get_db_session
+    from services.finance.account_ledger_service import AccountLedgerService
+
+    with get_db_session() as db:
+        written = AccountLedgerService(db).rebuild(args.account)
+    print(f"account_ledger rebuilt: {written} rows")
+
+
+def rebuild_investment_positions(args: argparse.Namespace) -> None:
+    from db.database import get_db_session
+    from services.investments.investment_position_service import InvestmentPositionService
+
+    with get_db_session() as db:
+        written = InvestmentPositionService(db).rebuild(args.investment)
+    print(f"investment_positions rebuilt: {written} rows")
+
+
+def recompute_saving_totals(args: argparse.Namespace) -> None:
+    from db.database import get_db_session
+    from services.savings.saving_analytics_service import SavingAnalyticsService
+
+    with get_db_session() as db:
+        fixed = SavingAnalyticsService(db).recompute_totals(args.saving)
+    print(f"savings_logs totals corrected: {fixed} rows")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-daily-summary", help="Recompute the daily_summary rollup")
+    rebuild.add_argument("--start", type=date.fromisoformat, help="First date to rebuild (inclusive)")
+    rebuild.add_argument("--end", type=date.fromisoformat, help="Last date to rebuild (inclusive)")
+    rebuild.set_defaults(handler=rebuild_daily_summary)
+
+    ledger = commands.add_parser("rebuild-account-ledger", help="Recompute the account running balances")
+    ledger.add_argument("--account", type=int, help="Only rebuild this account id")
+    ledger.set_defaults(handler=rebuild_account_ledger)
+
+    positions = commands.add_parser("rebuild-investment-positions",
+                                    help="Replay the investment logs into the position snapshots")
+    positions.add_argument("--investment", type=int, help="Only rebuild this investment id")
+    positions.set_defaults(handler=rebuild_investment_positions)
+
+    savings = commands.add_parser("recompute-saving-totals",
+                                  help="Correct savings_logs.total_amount from the log amounts")
+    savings.add_argument("--saving", type=int, help="Only recompute this saving id")
+    savings.set_defaults(handler=recompute_saving_totals)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
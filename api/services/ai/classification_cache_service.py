@@ -0,0 +1,135 @@
+"""
+Persistent memo of AI category predictions.
+
+Merchant strings such as "MERCADONA 1234 MADRID" come back every month; once
+the LLM classified one, the prediction is stored under
+(type, description key, category-set version) and reused until it expires
+or the category list of that type changes.
+"""
+
+import hashlib
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List
+
+from sqlalchemy.orm import Session
+
+from repositories.ai.ai_classification_cache_repository import AIClassificationCacheRepository
+from services.logs.logger_service import setup_logger
+
+logger = setup_logger("ai_classification_cache")
+
+AI_CACHE_TTL_DAYS = int(os.getenv("AI_CACHE_TTL_DAYS", "180"))
+AI_CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", "50000"))
+
+_DIGIT_RUN = re.compile(r"\d+")
+_SPACES = re.compile(r"\s+")
+
+
+def description_key(normalized_description: str) -> str:
+    """
+    Cache key of an already normalized description.
+
+    Digit runs (card numbers, store ids, dates) are masked so that
+    "mercadona 1234 madrid" and "mercadona 5678 madrid" share an entry.
+    """
+    key = _DIGIT_RUN.sub("#", normalized_description)
+    return _SPACES.sub(" ", key).strip()[:500]
+
+
+def category_version(categories: Iterable) -> str:
+    """Fingerprint of a category list (ids, names and descriptions)."""
+    parts = sorted(
+        f"{c.id}\x1f{c.name}\x1f{getattr(c, 'description', '') or ''}"
+        for c in categories
+    )
+    return hashlib.sha256("\x1e".join(parts).encode("utf-8")).hexdigest()
+
+
+class ClassificationCacheService:
+    """Reads and writes cached predictions; failures never break classification."""
+
+    def __init__(
+        self,
+        db: Session,
+        ttl_days: int = AI_CACHE_TTL_DAYS,
+        max_entries: int = AI_CACHE_MAX_ENTRIES
+    ):
+        self.db = db
+        self.repository = AIClassificationCacheRepository(db)
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+
+    def lookup(self, type_: str, version: str, keys: Iterable[str], categories: list) -> Dict[str, dict]:
+        """
+        Return cached predictions by description key.
+
+        Predictions use the TransactionAIService shape (id, name, description,
+        suggested_new_category); hits are recorded for LRU eviction.
+        """
+        now = datetime.utcnow()
+        try:
+            entries = self.repository.get_many(type_, version, keys, now - timedelta(days=self.ttl_days))
+            if entries:
+                self.repository.touch([entry.id for entry in entries.values()], now)
+                self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning("AI cache lookup failed for type=%s: %s", type_, e)
+            return {}
+
+        category_by_id = {c.id: c for c in categories}
+        predictions = {}
+        for key, entry in entries.items():
+            if entry.category_id is not None:
+                category = category_by_id.get(entry.category_id)
+                if category is None:
+                    continue
+                predictions[key] = {
+                    "id": category.id,
+                    "name": category.name,
+                    "description": getattr(category, "description", None),
+                    "suggested_new_category": None,
+                }
+            else:
+                predictions[key] = {
+                    "id": None,
+                    "name": None,
+                    "description": None,
+                    "suggested_new_category": entry.suggested_new_category,
+                }
+        return predictions
+
+    def store(self, type_: str, version: str, predictions_by_key: Dict[str, dict]) -> None:
+        """Persist fresh predictions, then drop stale versions and apply TTL/size limits."""
+        now = datetime.utcnow()
+        rows: List[dict] = []
+        for key, prediction in predictions_by_key.items():
+            suggested = prediction.get("suggested_new_category")
+            if not key or (prediction.get("id") is None and not suggested):
+                continue
+            rows.append({
+                "type": type_,
+                "description_key": key,
+                "category_version": version,
+                "category_id": prediction.get("id"),
+                "suggested_new_category": str(suggested)[:100] if suggested else None,
+                "hits": 0,
+                "last_used_at": now,
+            })
+        if not rows:
+            return
+
+        try:
+            self.repository.delete_other_versions(type_, version)
+            self.repository.delete_expired(now - timedelta(days=self.ttl_days))
+            self.repository.bulk_insert_ignore_conflicts(
+                rows,
+                conflict_columns=("type", "description_key", "category_version"),
+            )
+            self.repository.evict_least_recently_used(self.max_entries)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning("AI cache write failed for type=%s: %s", type_, e)
@@ -6,17 +6,39 @@ from models.investments.investment_category_model import InvestmentsCategory
 import urllib.request
 import urllib.error
 import json
+import os
 import re
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from services.ai.classification_cache_service import (
+    ClassificationCacheService,
+    category_version,
+    description_key,
+)
 from services.logs.logger_service import setup_logger
 logger = setup_logger("transaction_ai")
 
+# Must match the llama.cpp server flags (--ctx-size, --parallel)
+AI_SERVICE_URL = os.getenv("AI_SERVICE_URL", "http://ai:8180/v1/chat/completions")
+AI_CTX_SIZE = int(os.getenv("AI_CTX_SIZE", "4096"))
+AI_PARALLEL_SLOTS = int(os.getenv("AI_PARALLEL_SLOTS", "2"))
+AI_TIMEOUT = float(os.getenv("AI_TIMEOUT", "45"))
+
+# Conservative for JSON with Spanish text (real ratio is closer to 3.5-4)
+AI_CHARS_PER_TOKEN = 3
+AI_OUTPUT_TOKENS_PER_TX = 40
+AI_SAFETY_MARGIN_TOKENS = 64
+AI_MAX_TX_PER_CHUNK = 25
+
+SYSTEM_PROMPT = "You are a strict financial classifier. Return only JSON."
+
 
 class TransactionAIService:
 
     def __init__(self, db: Session):
         self.db = db
+        self.cache = ClassificationCacheService(db)
 
     # ─────────────────────────────────────────────
     # ─────────────────────────────────────────────
@@ -55,22 +77,10 @@ class TransactionAIService:
             else:
                 transactions_by_type[type_].append(tx)
 
-        # 3. Segunda pasada: enviamos a la IA las que no matchearon
-        for type_, txs in transactions_by_type.items():
-            if not txs:
-                continue
-
-            categories = categories_by_type[type_]
-            try:
-                ai_predictions = self._classify_batch(type_, txs, categories)
-            except Exception as exc:
-                logger.exception(
-                    "Fallo en clasificación IA para type=%s con %s transacciones.",
-                    type_, len(txs), exc_info=exc,
-                )
-                ai_predictions = {}
-
-            predictions_by_id.update(ai_predictions)
+        # 3. Segunda pasada: las que no matchearon se buscan en la caché
+        # persistente; solo los comercios nuevos van a la IA, una vez por clave,
+        # en lotes que caben en el contexto de un slot y en paralelo
+        predictions_by_id.update(self._classify_with_cache(transactions_by_type, categories_by_type))
 
         return [
             {
@@ -105,23 +115,155 @@ class TransactionAIService:
 
     # ─────────────────────────────────────────────
     # ─────────────────────────────────────────────
-    def _classify_batch(self, type_: str, transactions: list[dict], categories: list) -> dict:
+    def _classify_with_cache(self, transactions_by_type: dict[str, list[dict]], categories_by_type: dict) -> dict:
+        """
+        Resolve transactions from the AI prediction cache, send one
+        representative per unknown description key to the AI and store the
+        new predictions. Returns predictions by transaction id.
+        """
+        versions = {}
+        keys_by_id = {}
+        pending_by_type: dict[str, list[dict]] = {}
+        predictions_by_id = {}
+
+        for type_, txs in transactions_by_type.items():
+            if not txs:
+                continue
+            categories = categories_by_type[type_]
+            versions[type_] = category_version(categories)
+            for tx in txs:
+                keys_by_id[tx.get("id")] = description_key(self._normalize_text(tx.get("description") or ""))
+
+            cached = self.cache.lookup(
+                type_, versions[type_], {keys_by_id[tx.get("id")] for tx in txs}, categories
+            )
+            representatives = {}
+            for tx in txs:
+                key = keys_by_id[tx.get("id")]
+                if key in cached:
+                    predictions_by_id[tx.get("id")] = cached[key]
+                elif key not in representatives:
+                    representatives[key] = tx
+            pending_by_type[type_] = list(representatives.values())
+
+            logger.info(
+                "AI cache type=%s: %s transactions, %s cached, %s sent to AI",
+                type_, len(txs), sum(1 for tx in txs if keys_by_id[tx.get("id")] in cached),
+                len(representatives),
+            )
 
-        categories_payload = [
+        ai_predictions = self._classify_concurrently(pending_by_type, categories_by_type)
+
+        for type_, representatives in pending_by_type.items():
+            new_predictions = {
+                keys_by_id[tx.get("id")]: ai_predictions[tx.get("id")]
+                for tx in representatives
+                if tx.get("id") in ai_predictions
+            }
+            if new_predictions:
+                self.cache.store(type_, versions[type_], new_predictions)
+
+            for tx in transactions_by_type[type_]:
+                key = keys_by_id[tx.get("id")]
+                if tx.get("id") not in predictions_by_id and key in new_predictions:
+                    predictions_by_id[tx.get("id")] = new_predictions[key]
+
+        return predictions_by_id
+
+    def _classify_concurrently(self, transactions_by_type: dict[str, list[dict]], categories_by_type: dict) -> dict:
+        """
+        Split pending transactions into context-sized chunks and send them to
+        the AI server concurrently, one request per server slot at most.
+        A failed chunk only loses its own predictions.
+        """
+        jobs = []
+        for type_, txs in transactions_by_type.items():
+            if not txs:
+                continue
+            categories = categories_by_type[type_]
+            for chunk in self._chunk_transactions(type_, txs, categories):
+                jobs.append((type_, chunk, categories))
+
+        if not jobs:
+            return {}
+
+        predictions = {}
+        workers = max(1, min(AI_PARALLEL_SLOTS, len(jobs)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-classify") as executor:
+            futures = {
+                executor.submit(self._classify_batch, type_, chunk, categories): (type_, chunk)
+                for type_, chunk, categories in jobs
+            }
+            for future in as_completed(futures):
+                type_, chunk = futures[future]
+                try:
+                    predictions.update(future.result())
+                except Exception as exc:
+                    logger.exception(
+                        "Fallo en clasificación IA para type=%s con %s transacciones.",
+                        type_, len(chunk), exc_info=exc,
+                    )
+
+        logger.info("AI classification: %s chunks, %s predictions", len(jobs), len(predictions))
+        return predictions
+
+    # ─────────────────────────────────────────────
+    # TOKEN BUDGET
+    # Each llama.cpp slot gets ctx-size / parallel tokens shared by the
+    # prompt and the completion, so chunks are sized to fit one slot.
+    # ─────────────────────────────────────────────
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        return len(text) // AI_CHARS_PER_TOKEN + 1
+
+    @staticmethod
+    def _tx_payload(tx: dict) -> dict:
+        return {
+            "id": tx.get("id"),
+            "description": tx.get("description"),
+            "amount": tx.get("amount"),
+        }
+
+    @staticmethod
+    def _categories_payload(categories: list) -> list[dict]:
+        return [
             {"name": c.name, "description": getattr(c, "description", "")}
             for c in categories
         ]
 
-        tx_payload = [
-            {
-                "id": tx.get("id"),
-                "description": tx.get("description"),
-                "amount": tx.get("amount"),
-            }
-            for tx in transactions
-        ]
+    def _chunk_transactions(self, type_: str, transactions: list[dict], categories: list) -> list[list[dict]]:
+        slot_tokens = AI_CTX_SIZE // max(1, AI_PARALLEL_SLOTS)
+        base_tokens = self._estimate_tokens(
+            SYSTEM_PROMPT + self._build_prompt(type_, [], self._categories_payload(categories))
+        )
+        budget = slot_tokens - base_tokens - AI_SAFETY_MARGIN_TOKENS
 
-        prompt = f"""
+        if budget < AI_OUTPUT_TOKENS_PER_TX * 2:
+            logger.warning(
+                "AI prompt for type=%s uses %s of %s slot tokens; sending one transaction per request",
+                type_, base_tokens, slot_tokens,
+            )
+            return [[tx] for tx in transactions]
+
+        chunks, current, used = [], [], 0
+        for tx in transactions:
+            cost = (
+                self._estimate_tokens(json.dumps(self._tx_payload(tx), ensure_ascii=False))
+                + AI_OUTPUT_TOKENS_PER_TX
+            )
+            if current and (used + cost > budget or len(current) >= AI_MAX_TX_PER_CHUNK):
+                chunks.append(current)
+                current, used = [], 0
+            current.append(tx)
+            used += cost
+        if current:
+            chunks.append(current)
+        return chunks
+
+    # ─────────────────────────────────────────────
+    # ─────────────────────────────────────────────
+    def _build_prompt(self, type_: str, tx_payload: list[dict], categories_payload: list[dict]) -> str:
+        return f"""
                   You are a financial transaction classifier.
                   Type: {type_}
                   Transactions: {json.dumps(tx_payload, ensure_ascii=False)}
@@ -170,18 +312,26 @@ class TransactionAIService:
                   {{"classifications":[{{"id":"...","category":"..." | null,"suggested_new_category":"..." | null}}]}}
                   """
 
+    def _classify_batch(self, type_: str, transactions: list[dict], categories: list) -> dict:
+        """Classify one chunk; halves and retries it if the slot context overflows."""
+        prompt = self._build_prompt(
+            type_,
+            [self._tx_payload(tx) for tx in transactions],
+            self._categories_payload(categories),
+        )
+
         payload = {
             "messages": [
                 # El rol system define el comportamiento general del modelo
-                {"role": "system", "content": "You are a strict financial classifier. Return only JSON."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             "temperature": 0,
-            "max_tokens": max(120, len(transactions) * 40)
+            "max_tokens": max(120, len(transactions) * AI_OUTPUT_TOKENS_PER_TX)
         }
 
         req = urllib.request.Request(
-            "http://ai:8180/v1/chat/completions",
+            AI_SERVICE_URL,
             data=json.dumps(payload).encode("utf-8"),
             headers={"Content-Type": "application/json"},
             method="POST"
@@ -189,15 +339,33 @@ class TransactionAIService:
 
         # Send request and parse response
         try:
-            with urllib.request.urlopen(req, timeout=45) as response:
+            with urllib.request.urlopen(req, timeout=AI_TIMEOUT) as response:
                 result = json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as exc:
+            # llama.cpp answers 400 when prompt + max_tokens exceed the slot context
+            if exc.code == 400 and len(transactions) > 1:
+                logger.warning("AI rejected a chunk of %s transactions, splitting it", len(transactions))
+                return self._classify_halves(type_, transactions, categories)
+            logger.warning("Servicio de IA no disponible: %s", exc)
+            return {}
         except urllib.error.URLError as exc:
             logger.warning("Servicio de IA no disponible: %s", exc)
             return {}
 
-        # Extract model text response
-        content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        choice = result.get("choices", [{}])[0]
+        if choice.get("finish_reason") == "length" and len(transactions) > 1:
+            logger.warning("AI response truncated for %s transactions, splitting chunk", len(transactions))
+            return self._classify_halves(type_, transactions, categories)
+
+        return self._parse_predictions(choice.get("message", {}).get("content", ""), categories)
+
+    def _classify_halves(self, type_: str, transactions: list[dict], categories: list) -> dict:
+        middle = len(transactions) // 2
+        predictions = self._classify_batch(type_, transactions[:middle], categories)
+        predictions.update(self._classify_batch(type_, transactions[middle:], categories))
+        return predictions
 
+    def _parse_predictions(self, content: str, categories: list) -> dict:
         # Try direct JSON parsing first.
         # Sometimes the AI adds extra text or ```json ... ``` wrappers,
         # so if direct parsing fails, try extracting JSON with regex.
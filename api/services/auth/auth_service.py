@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from flask_jwt_extended import create_access_token, create_refresh_token
 
 from services.core.security_service import hash_password, verify_password
+from services.auth.principal_service import get_principal
 from models import User, UserRoleEnum
 from repositories.users.user_repository import UserRepository
 from schemas.auth.auth_schema import LoginRequest, TokenResponse, RefreshResponse
@@ -52,13 +53,14 @@ class AuthService:
 
     def refresh(self, user_id: str) -> RefreshResponse:
         """Generate a new access token from refresh token identity."""
-        user = self.repository.get_by_id(int(user_id))
-        if not user:
+        # Role and email come from the principal cache, not a fresh User row
+        principal = get_principal(self.db, user_id)
+        if not principal or not principal.active:
             raise ValueError("USER_NOT_FOUND")
 
         access_token = create_access_token(
             identity=user_id,
-            additional_claims={"role": user.role.value, "email": user.email}
+            additional_claims={"role": principal.role.value, "email": principal.email}
         )
 
         return RefreshResponse(access_token=access_token)
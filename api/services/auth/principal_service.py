@@ -0,0 +1,118 @@
+"""
+Cached user principals for authorization checks.
+
+A Principal is the slice of a user that authorization needs: id, role,
+active flag, email and the ids of the accounts the user belongs to. It is
+loaded once per JWT subject and kept in an in-process LRU cache, so the
+global_auth hook can expose g.principal and reject deactivated users without
+a DB round trip per request. UserService and AccountService invalidate the
+cache when a user or an account membership changes.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from models.core.enums import UserRoleEnum
+from repositories.users.user_repository import UserRepository
+from services.logs.logger_service import setup_logger
+
+logger = setup_logger("auth")
+
+# Safety net for multi-process deployments: other workers never see the
+# explicit invalidation, so cached principals also expire after this delay.
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "1024"))
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: int
+    role: UserRoleEnum
+    active: bool
+    email: Optional[str]
+    account_ids: FrozenSet[int]
+
+    def has_role(self, *roles: UserRoleEnum) -> bool:
+        return self.role in roles
+
+
+class PrincipalCache:
+    """Thread-safe LRU cache of Principal by user id, with a TTL per entry."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = PRINCIPAL_CACHE_TTL_SECONDS,
+        max_entries: int = PRINCIPAL_CACHE_MAX_ENTRIES
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[float, Optional[Principal]]]" = OrderedDict()
+        self._generations: Dict[int, int] = {}
+        self._global_generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, loader: Callable[[], Optional[Principal]]) -> Optional[Principal]:
+        """
+        Return the cached principal, calling loader() on a miss.
+
+        Unknown users are cached as None too, so a token of a deleted user
+        does not hit the DB on every request either.
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+                self._entries.move_to_end(user_id)
+                return entry[1]
+            generation = (self._global_generation, self._generations.get(user_id, 0))
+
+        # Load outside the lock; a slow query must not block other users
+        principal = loader()
+
+        with self._lock:
+            # Drop the result if an invalidation happened while loading
+            if (self._global_generation, self._generations.get(user_id, 0)) == generation:
+                self._entries[user_id] = (time.monotonic(), principal)
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Forget one user, or every user when None."""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+                self._generations.clear()
+                self._global_generation += 1
+            else:
+                self._entries.pop(user_id, None)
+                self._generations[user_id] = self._generations.get(user_id, 0) + 1
+        logger.debug("Principal cache invalidated for %s", user_id or "all users")
+
+
+principal_cache = PrincipalCache()
+
+
+def load_principal(db: Session, user_id: int) -> Optional[Principal]:
+    user = UserRepository(db).get_with_account_ids(user_id)
+    if user is None:
+        return None
+    return Principal(
+        id=user.id,
+        role=user.role,
+        active=bool(user.active),
+        email=user.email,
+        account_ids=frozenset(link.account_id for link in user.account_users),
+    )
+
+
+def get_principal(db: Session, user_id) -> Optional[Principal]:
+    """Principal of a JWT subject (str or int); None if the user does not exist."""
+    user_id = int(user_id)
+    return principal_cache.get(user_id, lambda: load_principal(db, user_id))
@@ -0,0 +1,66 @@
+"""
+Minimal Aho-Corasick automaton used by the category rule engine.
+
+Keywords are mapped to integer values (rule ranks). A single left-to-right
+scan of the text returns the values of every keyword it contains, so matching
+cost depends on the text length and the number of hits, not on the number of
+keywords.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class AhoCorasick:
+    """Keyword automaton answering "which keywords occur in this text?"."""
+
+    def __init__(self, keywords: Iterable[Tuple[str, int]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Values of every keyword ending at each node, fail links included
+        self._out: List[Tuple[int, ...]] = [()]
+
+        for word, value in keywords:
+            if word:
+                self._add(word, value)
+        self._build()
+
+    def _add(self, word: str, value: int) -> None:
+        node = 0
+        for char in word:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = next_node
+        self._out[node] += (value,)
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> Set[int]:
+        """Scan text once and return the values of all contained keywords."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        found: Set[int] = set()
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
@@ -12,6 +12,7 @@ from schemas.category_rules.category_rule_schema import (
     CategoryRuleUpdate,
 )
 from services.core.base_service import BaseService
+from services.category_rules.rule_engine import CompiledRuleSet, rule_set_cache
 
 
 class CategoryRuleService(BaseService[CategoryRule, CategoryRuleRead, CategoryRuleCreate, CategoryRuleUpdate]):
@@ -42,13 +43,13 @@ class CategoryRuleService(BaseService[CategoryRule, CategoryRuleRead, CategoryRu
         except ValueError:
             raise ValueError(f"Invalid transaction type: {transaction_type}")
 
-        if enum_type == TransactionEnum.expense:
+        if enum_type == TransactionEnum.EXPENSE:
             from models import ExpensesCategory
             return ExpensesCategory
-        elif enum_type == TransactionEnum.income:
+        elif enum_type == TransactionEnum.INCOME:
             from models import IncomesCategory
             return IncomesCategory
-        elif enum_type == TransactionEnum.investment:
+        elif enum_type == TransactionEnum.INVESTMENT:
             from models import InvestmentsCategory
             return InvestmentsCategory
 
@@ -71,7 +72,9 @@ class CategoryRuleService(BaseService[CategoryRule, CategoryRuleRead, CategoryRu
 
     def create(self, data: CategoryRuleCreate) -> CategoryRuleRead:
         self._validate_category_for_type(data.type, data.category_id)
-        return super().create(data)
+        result = super().create(data)
+        rule_set_cache.invalidate(TransactionEnum(data.type))
+        return result
 
     def update(self, id: int, data: CategoryRuleUpdate) -> Optional[CategoryRuleRead]:
         existing = self.repository.get_by_id(id)
@@ -84,7 +87,21 @@ class CategoryRuleService(BaseService[CategoryRule, CategoryRuleRead, CategoryRu
 
         self._validate_category_for_type(type_to_check, category_id_to_check)
 
-        return super().update(id, data)
+        previous_type = TransactionEnum(existing.type)
+        result = super().update(id, data)
+        rule_set_cache.invalidate(previous_type)
+        rule_set_cache.invalidate(TransactionEnum(type_to_check))
+        return result
+
+    def delete(self, id: int) -> bool:
+        existing = self.repository.get_by_id(id)
+        if not existing:
+            return False
+
+        rule_type = TransactionEnum(existing.type)
+        deleted = super().delete(id)
+        rule_set_cache.invalidate(rule_type)
+        return deleted
 
 
 class CategorizationService:
@@ -92,8 +109,8 @@ class CategorizationService:
     Service for categorizing transactions using rules + AI fallback.
     
     Flow:
-    1. Get active rules for transaction type, ordered by priority DESC
-    2. Apply regex match (case-insensitive) for each rule
+    1. Get the compiled rule set for the transaction type (cached per type)
+    2. Apply pre-compiled regexes (case-insensitive) in priority order
     3. If match → return category_id
     4. If no match → call AI service (fallback is optional)
     5. If AI fails → return None (mark as needs_review)
@@ -111,6 +128,13 @@ class CategorizationService:
         self.rule_repository = CategoryRuleRepository(db)
         self.ai_service = ai_service
 
+    def _get_rule_set(self, transaction_type: TransactionEnum) -> CompiledRuleSet:
+        """Compiled active rules for a type; hits the DB only on a cache miss."""
+        return rule_set_cache.get(
+            transaction_type,
+            lambda: self.rule_repository.get_active_by_type(transaction_type)
+        )
+
     def categorize_transaction(
         self,
         description: str,
@@ -134,13 +158,10 @@ class CategorizationService:
         except ValueError:
             return None
 
-        # Step 1: Get active rules ordered by priority DESC
-        rules = self.rule_repository.get_active_by_type(enum_type)
-        
-        # Step 2: Apply regex matching
-        for rule in rules:
-            if rule.matches(description):
-                return rule.category_id
+        # Step 1-2: Match against the cached, pre-compiled rule set
+        rule = self._get_rule_set(enum_type).match(description)
+        if rule:
+            return rule.category_id
 
         # Step 3: Fallback to AI service if available
         if self.ai_service:
@@ -178,16 +199,13 @@ class CategorizationService:
         except ValueError:
             return {"category_id": None, "ignore_in_analysis": False}
 
-        # Step 1: Get active rules ordered by priority DESC
-        rules = self.rule_repository.get_active_by_type(enum_type)
-        
-        # Step 2: Apply regex matching
-        for rule in rules:
-            if rule.matches(description):
-                return {
-                    "category_id": rule.category_id,
-                    "ignore_in_analysis": bool(rule.ignore_in_analysis)
-                }
+        # Step 1-2: Match against the cached, pre-compiled rule set
+        rule = self._get_rule_set(enum_type).match(description)
+        if rule:
+            return {
+                "category_id": rule.category_id,
+                "ignore_in_analysis": rule.ignore_in_analysis
+            }
 
         # Step 3: Fallback to AI service if available
         if self.ai_service:
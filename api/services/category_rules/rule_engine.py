@@ -0,0 +1,253 @@
+"""
+Compiled rule engine for transaction categorization.
+
+Active rules are loaded once per TransactionEnum, their patterns compiled and
+the resulting CompiledRuleSet kept in an in-process cache. CategoryRuleService
+invalidates the cache whenever a rule is created, updated or deleted, so a
+batch of categorizations costs one DB read per type instead of one per row.
+
+Within a rule set, plain keyword rules (the common "mercadona" case) are
+matched by an Aho-Corasick automaton and true regex rules by one combined
+alternation, so each description is scanned once regardless of rule count.
+Regex rules that contain a required literal (e.g. "amazon" in
+r"amazon\\s+prime") are pre-filtered by the same automaton and only run when
+that literal occurs in the text.
+"""
+
+import re
+from re import _constants as sre_constants, _parser as sre_parse
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from models import CategoryRule, TransactionEnum
+from services.category_rules.aho_corasick import AhoCorasick
+from services.logs.logger_service import setup_logger
+
+logger = setup_logger("category_rules")
+
+# Safety net for multi-process deployments: other workers never see the
+# explicit invalidation, so cached rule sets also expire after this delay.
+RULE_SET_TTL_SECONDS = 300
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+# Constructs that break when a pattern is embedded in a larger alternation:
+# numbered/named backreferences, named groups and global inline flags.
+_UNSAFE_FOR_ALTERNATION = re.compile(r"\\[1-9]|\(\?P[=<]|\(\?[aiLmsux]+\)")
+
+
+# Shorter required literals filter too little to be worth a guard
+_MIN_GUARD_LENGTH = 3
+
+
+def is_literal_pattern(pattern: str) -> bool:
+    """True when a rule pattern has no regex syntax and can be matched as a keyword."""
+    return bool(pattern) and not any(c in _REGEX_METACHARS for c in pattern)
+
+
+def required_literal(pattern: str) -> Optional[str]:
+    """
+    Longest literal run every match of pattern must contain, lowercased.
+
+    Only top-level literal sequences are considered (anything inside groups,
+    alternations, classes or quantifiers breaks the run), which keeps the
+    result conservative: a text without it can never match the pattern.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (re.error, RecursionError):
+        return None
+
+    best, run = "", []
+    for op, value in parsed:
+        if op is sre_constants.LITERAL:
+            run.append(chr(value))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(run) > len(best):
+        best = "".join(run)
+
+    return best.lower() if len(best) >= _MIN_GUARD_LENGTH else None
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """Detached, pre-compiled view of a CategoryRule row."""
+    id: int
+    category_id: int
+    priority: int
+    ignore_in_analysis: bool
+    regex: re.Pattern
+
+    def matches(self, text: str) -> bool:
+        return self.regex.search(text) is not None
+
+
+class CompiledRuleSet:
+    """
+    Immutable set of compiled rules for one transaction type.
+
+    Rules keep the repository order (priority DESC); a rule's index in that
+    order is its rank and the lowest matching rank wins. Matching runs in
+    three stages, each skipped once it cannot beat the best rank found:
+    1. one Aho-Corasick scan over the lowercased text: literal rules match
+       directly, regex rules with a required literal become candidates
+    2. remaining regex rules -> one combined alternation, a named group each
+    3. regex rules that cannot be combined (backreferences, inline flags)
+    Invalid patterns are logged once and skipped.
+    """
+
+    def __init__(self, transaction_type: TransactionEnum, rules: Iterable[CategoryRule]):
+        compiled = []
+        for rule in rules:
+            try:
+                regex = re.compile(rule.pattern, re.IGNORECASE)
+            except re.error as e:
+                logger.warning("Invalid regex pattern in rule %s: %s", rule.id, e)
+                continue
+            compiled.append(CompiledRule(
+                id=rule.id,
+                category_id=rule.category_id,
+                priority=rule.priority,
+                ignore_in_analysis=bool(rule.ignore_in_analysis),
+                regex=regex,
+            ))
+
+        # Stable sort keeps the DB order for equal priorities
+        compiled.sort(key=lambda r: -r.priority)
+        self.transaction_type = transaction_type
+        self.rules: Tuple[CompiledRule, ...] = tuple(compiled)
+        self.loaded_at = time.monotonic()
+
+        keywords = []
+        literal_ranks = set()
+        combinable = []
+        standalone = []
+        for rank, rule in enumerate(self.rules):
+            pattern = rule.regex.pattern
+            if is_literal_pattern(pattern):
+                keywords.append((pattern.lower(), rank))
+                literal_ranks.add(rank)
+                continue
+
+            guard = required_literal(pattern)
+            if guard:
+                keywords.append((guard, rank))
+            elif _UNSAFE_FOR_ALTERNATION.search(pattern):
+                standalone.append((rank, rule))
+            else:
+                combinable.append((rank, rule))
+
+        self._automaton = AhoCorasick(keywords) if keywords else None
+        self._literal_ranks = frozenset(literal_ranks)
+
+        self._combined = None
+        self._group_ranks: Dict[str, int] = {}
+        if combinable:
+            alternation = "|".join(f"(?P<r{rank}>{rule.regex.pattern})" for rank, rule in combinable)
+            try:
+                self._combined = re.compile(alternation, re.IGNORECASE)
+                self._group_ranks = {f"r{rank}": rank for rank, _ in combinable}
+            except re.error as e:
+                logger.warning("Could not combine %s regex rules, matching them one by one: %s",
+                               len(combinable), e)
+                standalone.extend(combinable)
+                standalone.sort(key=lambda item: item[0])
+        self._min_combined_rank = combinable[0][0] if self._combined else None
+        self._standalone: Tuple[Tuple[int, CompiledRule], ...] = tuple(standalone)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _scan_automaton(self, text: str) -> Optional[int]:
+        for rank in sorted(self._automaton.find_all(text.lower())):
+            if rank in self._literal_ranks or self.rules[rank].regex.search(text):
+                return rank
+        return None
+
+    def _scan_combined(self, text: str, best: Optional[int]) -> Optional[int]:
+        # At a given position the alternation tries rules in rank order, so
+        # visiting every position where something matches yields, per
+        # position, the best rule starting there. Usually 0 or 1 iterations.
+        search = self._combined.search
+        pos = 0
+        while pos <= len(text):
+            match = search(text, pos)
+            if match is None:
+                break
+            rank = self._group_ranks.get(match.lastgroup)
+            if rank is None:
+                rank = min(self._group_ranks[name] for name, value in match.groupdict().items()
+                           if value is not None)
+            if best is None or rank < best:
+                best = rank
+                if best == self._min_combined_rank:
+                    break
+            pos = match.start() + 1
+        return best
+
+    def match(self, text: str) -> Optional[CompiledRule]:
+        """Return the highest-priority rule matching text, or None."""
+        if not text:
+            return None
+
+        best = self._scan_automaton(text) if self._automaton else None
+
+        if self._combined is not None and (best is None or self._min_combined_rank < best):
+            best = self._scan_combined(text, best)
+
+        for rank, rule in self._standalone:
+            if best is not None and rank >= best:
+                break
+            if rule.regex.search(text):
+                best = rank
+                break
+
+        return self.rules[best] if best is not None else None
+
+
+class RuleSetCache:
+    """Thread-safe, per-process cache of CompiledRuleSet keyed by TransactionEnum."""
+
+    def __init__(self, ttl_seconds: float = RULE_SET_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._rule_sets: Dict[TransactionEnum, CompiledRuleSet] = {}
+        self._generations: Dict[TransactionEnum, int] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        transaction_type: TransactionEnum,
+        loader: Callable[[], Iterable[CategoryRule]]
+    ) -> CompiledRuleSet:
+        """Return the cached rule set for a type, compiling it with loader() on a miss."""
+        with self._lock:
+            rule_set = self._rule_sets.get(transaction_type)
+            if rule_set is not None and time.monotonic() - rule_set.loaded_at < self.ttl_seconds:
+                return rule_set
+            generation = self._generations.get(transaction_type, 0)
+
+        # Load outside the lock; DB access must not serialize other types
+        rule_set = CompiledRuleSet(transaction_type, loader())
+
+        with self._lock:
+            # Drop the result if an invalidation happened while loading
+            if self._generations.get(transaction_type, 0) == generation:
+                self._rule_sets[transaction_type] = rule_set
+        return rule_set
+
+    def invalidate(self, transaction_type: Optional[TransactionEnum] = None) -> None:
+        """Forget the rule set of one type, or of every type when None."""
+        with self._lock:
+            types = [transaction_type] if transaction_type else list(TransactionEnum)
+            for type_ in types:
+                self._rule_sets.pop(type_, None)
+                self._generations[type_] = self._generations.get(type_, 0) + 1
+        logger.debug("Rule set cache invalidated for %s", transaction_type or "all types")
+
+
+rule_set_cache = RuleSetCache()
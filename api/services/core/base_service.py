@@ -1,6 +1,11 @@
-from typing import Type, Generic, TypeVar, Optional, List, Any
+from typing import Type, Generic, TypeVar, Optional, List, Any, Iterator
 from sqlalchemy.orm import Session
+from schemas.core.pagination_schema import ExportQuery, ListQuery
+from services.core.export_service import EXPORT_BATCH_SIZE, iter_export
 from services.core.interfaces import ICRUDService
+from services.core.pagination_service import Page, decode_cursor, encode_cursor
+from services.finance.account_ledger_service import AccountLedgerService
+from services.summaries.daily_summary_service import DailySummaryService
 
 ModelT = TypeVar("ModelT")
 ReadT = TypeVar("ReadT")
@@ -19,8 +24,13 @@ class BaseService(
     - Converting between ORM models and Pydantic schemas
     - Delegating database operations to repositories
     - Maintaining separation between domain and presentation layers
+    - Keeping the daily_summary rollup and the account_ledger in sync when
+      summary_type is set
     """
 
+    # Transaction services (expense/income/investment) set their TransactionEnum
+    summary_type = None
+
     def __init__(
         self,
         db: Session,
@@ -32,9 +42,24 @@ class BaseService(
         self.model = model
         self.repository = repository
         self.read_schema = read_schema
+        # Only transaction services write to the rollup and the ledger
+        self.daily_summary = DailySummaryService(db) if self.summary_type is not None else None
+        self.account_ledger = AccountLedgerService(db) if self.summary_type is not None else None
+
+    def _record_summary(self, before, after) -> None:
+        """Stage the rollup delta of a write; must run before the write's commit."""
+        if self.summary_type is not None:
+            self.daily_summary.record_change(self.summary_type, before, after)
+
+    def _record_ledger(self, before, after) -> None:
+        """Stage the running-balance delta of a write; must run before the write's commit."""
+        if self.summary_type is not None:
+            self.account_ledger.record_change(self.summary_type, before, after)
 
     def create(self, data: CreateT) -> ReadT:
         obj = self.model(**data.model_dump())
+        self._record_summary(None, DailySummaryService.snapshot(obj))
+        self._record_ledger(None, AccountLedgerService.snapshot(obj))
         obj = self.repository.create(obj)
         return self.read_schema.model_validate(obj)
 
@@ -46,12 +71,45 @@ class BaseService(
         objs = self.repository.get_all(page=page, per_page=per_page)
         return [self.read_schema.model_validate(o) for o in objs]
 
+    def get_page(self, query: ListQuery) -> Page[ReadT]:
+        """Keyset page (date DESC, id DESC); raises ValueError for bad cursors or filters."""
+        objs = self.repository.get_page(
+            filters=query.filters(),
+            after=decode_cursor(query.cursor),
+            limit=query.limit
+        )
+        has_more = len(objs) > query.limit
+        objs = objs[:query.limit]
+        next_cursor = encode_cursor(objs[-1].date, objs[-1].id) if has_more else None
+        return Page(items=[self.read_schema.model_validate(o) for o in objs], next_cursor=next_cursor)
+
+    def export(self, query: ExportQuery) -> Iterator[str]:
+        """Text chunks of every matching row; filters are checked before the first chunk."""
+        objs = self.repository.iter_filtered(query.filters(), batch_size=EXPORT_BATCH_SIZE)
+        return iter_export(objs, self.read_schema, query.format)
+
     def update(self, id: int, data: UpdateT) -> Optional[ReadT]:
         update_data = data.model_dump(exclude_unset=True)
+        if self.summary_type is not None:
+            current = self.repository.get_by_id(id)
+            if current is not None:
+                self._record_summary(
+                    DailySummaryService.snapshot(current),
+                    DailySummaryService.snapshot(current, update_data)
+                )
+                self._record_ledger(
+                    AccountLedgerService.snapshot(current),
+                    AccountLedgerService.snapshot(current, update_data)
+                )
         obj = self.repository.update(id, **update_data)
         return self.read_schema.model_validate(obj) if obj else None
 
     def delete(self, id: int) -> bool:
+        if self.summary_type is not None:
+            current = self.repository.get_by_id(id)
+            if current is not None:
+                self._record_summary(DailySummaryService.snapshot(current), None)
+                self._record_ledger(AccountLedgerService.snapshot(current), None)
         return self.repository.delete(id)
 
     def search(self, **filters) -> List[ReadT]:
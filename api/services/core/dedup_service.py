@@ -1,6 +1,10 @@
 import hashlib
 from decimal import Decimal, ROUND_HALF_UP
 from datetime import date, datetime
+from typing import Iterable, List, Tuple
+
+# (account_id, txn_date, amount, description), as taken by generate_dedup_hash
+DedupKey = Tuple[int | None, date | datetime | str, float | str | Decimal, str | None]
 
 
 def _normalize_description(description: str | None) -> str:
@@ -30,10 +34,14 @@ def generate_dedup_hash(
     account_id: int | None,
     txn_date: date | datetime | str,
     amount: float | str | Decimal,
-    description: str | None,
-    fuzzy_match: bool = False
+    description: str | None
 ) -> str:
-    """Generate deterministic per-account dedup fingerprint for transactions."""
+    """
+    Generate deterministic per-account dedup fingerprint for transactions.
+
+    Only catches exact repeats; near-identical rows are handled at import
+    time by services.imports.fuzzy_dedup_service.
+    """
     if account_id is None:
         raise ValueError("account_id is required for dedup hash")
 
@@ -44,3 +52,35 @@ def generate_dedup_hash(
     payload = f"{account_id}|{normalized_date}|{normalized_amount}|{normalized_description}"
     # keep to fixed-length hash (64 chars)
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def generate_dedup_hashes(rows: Iterable[DedupKey]) -> List[str]:
+    """
+    generate_dedup_hash for a batch of (account_id, txn_date, amount, description).
+
+    Imports repeat the same few hundred dates and amounts thousands of times,
+    so every distinct date and amount is normalized once per batch. The
+    digests are identical to calling generate_dedup_hash row by row.
+    """
+    dates = {}
+    amounts = {}
+    sha256 = hashlib.sha256
+    hashes = []
+    for account_id, txn_date, amount, description in rows:
+        if account_id is None:
+            raise ValueError("account_id is required for dedup hash")
+
+        # keyed by type too: 2.675 == Decimal(2.675) but they round differently
+        date_key = (type(txn_date), txn_date)
+        normalized_date = dates.get(date_key)
+        if normalized_date is None:
+            normalized_date = dates[date_key] = _normalize_date(txn_date)
+
+        amount_key = (type(amount), amount)
+        normalized_amount = amounts.get(amount_key)
+        if normalized_amount is None:
+            normalized_amount = amounts[amount_key] = _normalize_amount(amount)
+
+        payload = f"{account_id}|{normalized_date}|{normalized_amount}|{_normalize_description(description)}"
+        hashes.append(sha256(payload.encode("utf-8")).hexdigest())
+    return hashes
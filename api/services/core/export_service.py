@@ -0,0 +1,59 @@
+"""
+Streaming serializers for export endpoints.
+
+Rows come from BaseRepository.iter_filtered and are written out in small
+text chunks, so an export holds one batch of rows in memory at a time
+whatever the size of the history.
+"""
+import csv
+import io
+from typing import Iterable, Iterator, Type
+
+from pydantic import BaseModel
+
+EXPORT_BATCH_SIZE = 1000
+
+# Rows per yielded chunk; keeps the number of tiny writes to the socket low
+ROWS_PER_CHUNK = 200
+
+EXPORT_MIMETYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def iter_ndjson(objs: Iterable, schema: Type[BaseModel]) -> Iterator[str]:
+    """One JSON document per line."""
+    lines = []
+    for obj in objs:
+        lines.append(schema.model_validate(obj).model_dump_json())
+        if len(lines) >= ROWS_PER_CHUNK:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def iter_csv(objs: Iterable, schema: Type[BaseModel]) -> Iterator[str]:
+    """Header with the schema fields (id first), then one line per row."""
+    fields = sorted(schema.model_fields, key=lambda field: field != "id")
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    rows = 0
+    for obj in objs:
+        values = schema.model_validate(obj).model_dump(mode="json")
+        writer.writerow(["" if values[f] is None else values[f] for f in fields])
+        rows += 1
+        if rows % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_export(objs: Iterable, schema: Type[BaseModel], fmt: str) -> Iterator[str]:
+    if fmt == "csv":
+        return iter_csv(objs, schema)
+    return iter_ndjson(objs, schema)
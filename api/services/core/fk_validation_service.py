@@ -0,0 +1,89 @@
+"""Batched foreign key validation for bulk creates and imports."""
+from typing import Any, Dict, List, Sequence, Type
+
+from models import Account, Card, ExpensesCategory, IncomesCategory, Source, User
+from repositories.core.base_repository import BaseRepository
+
+# field -> referenced model, per transaction kind
+EXPENSE_FOREIGN_KEYS: Dict[str, Type] = {
+    "source_id": Source,
+    "category_id": ExpensesCategory,
+    "account_id": Account,
+    "user_id": User,
+    "card_id": Card,
+}
+
+INCOME_FOREIGN_KEYS: Dict[str, Type] = {
+    "source_id": Source,
+    "category_id": IncomesCategory,
+    "account_id": Account,
+}
+
+# Same codes the per-row validate_foreign_keys methods return
+NOT_FOUND_CODES: Dict[str, str] = {
+    "source_id": "SOURCE_NOT_FOUND",
+    "category_id": "CATEGORY_NOT_FOUND",
+    "account_id": "ACCOUNT_NOT_FOUND",
+    "user_id": "USER_NOT_FOUND",
+    "card_id": "CARD_NOT_FOUND",
+}
+
+
+class ForeignKeyValidationError(ValueError):
+    """
+    Raised when one or more rows of a batch reference missing records.
+
+    errors holds one dict per offending (row, field) with index, field,
+    value, code and msg, so Response.error can report all of them at once.
+    """
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        self.errors = errors
+        super().__init__("; ".join(error["msg"] for error in errors))
+
+
+def find_missing_foreign_keys(
+    repository: BaseRepository,
+    items: Sequence[Any],
+    foreign_keys: Dict[str, Type],
+    label: str = "items"
+) -> List[Dict[str, Any]]:
+    """
+    Check every foreign key of a batch with one IN (...) query per field.
+
+    None values are skipped (e.g. category_id pending categorization).
+    Returns the error dicts, ordered by row index; empty when all exist.
+    """
+    missing_by_field = {}
+    for field, model in foreign_keys.items():
+        values = {getattr(item, field, None) for item in items}
+        values.discard(None)
+        if values:
+            missing_by_field[field] = values - repository.get_existing_ids(model, values)
+
+    errors = []
+    for index, item in enumerate(items):
+        for field, missing in missing_by_field.items():
+            value = getattr(item, field, None)
+            if value in missing:
+                code = NOT_FOUND_CODES.get(field, "FK_NOT_FOUND")
+                errors.append({
+                    "index": index,
+                    "field": field,
+                    "value": value,
+                    "code": code,
+                    "msg": f"{label}[{index}].{field}={value}: {code}",
+                })
+    return errors
+
+
+def validate_foreign_keys_bulk(
+    repository: BaseRepository,
+    items: Sequence[Any],
+    foreign_keys: Dict[str, Type],
+    label: str = "items"
+) -> None:
+    """Raise ForeignKeyValidationError listing every row with a missing reference."""
+    errors = find_missing_foreign_keys(repository, items, foreign_keys, label)
+    if errors:
+        raise ForeignKeyValidationError(errors)
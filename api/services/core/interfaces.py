@@ -1,6 +1,8 @@
 """Segregated service interfaces following ISP - Dependency Inversion Principle."""
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Optional
+from typing import TypeVar, Generic, Iterator, List, Optional
+
+from services.core.pagination_service import Page
 
 
 TRead = TypeVar("TRead")
@@ -18,6 +20,24 @@ class IReadService(ABC, Generic[TRead]):
         pass
 
 
+class IPageService(ABC, Generic[TRead]):
+    """Interface for cursor-paginated list reads."""
+
+    @abstractmethod
+    def get_page(self, query) -> Page[TRead]:
+        """Return one page of items matching a ListQuery."""
+        pass
+
+
+class IExportService(ABC):
+    """Interface for streaming exports."""
+
+    @abstractmethod
+    def export(self, query) -> Iterator[str]:
+        """Return the text chunks of an export matching an ExportQuery."""
+        pass
+
+
 class ISearchService(ABC, Generic[TRead]):
     """Interface for search/filter operations."""
 
@@ -61,6 +81,8 @@ class IDeleteService(ABC):
 
 class ICRUDService(
     IReadService[TRead],
+    IPageService[TRead],
+    IExportService,
     ISearchService[TRead],
     ICreateService[TCreate, TRead],
     IUpdateService[TUpdate, TRead],
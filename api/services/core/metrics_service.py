@@ -0,0 +1,186 @@
+"""
+Request-scoped instrumentation.
+
+Each request gets a RequestMetrics in a context variable. SQLAlchemy cursor
+events add the number and duration of queries to it, and the JSON provider
+adds the time spent decoding the body and encoding the response. When the
+request ends the totals are:
+- sent back in a Server-Timing header (visible in the browser dev tools)
+- folded into a per-endpoint registry exposed (to authenticated users) at
+  /system/metrics in the Prometheus text format
+
+The registry is per process: with several gunicorn workers each one
+reports its own share, as Prometheus expects from multi-process targets.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+
+# Upper bounds (seconds) of the request latency histogram
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestMetrics:
+    """Counters of the request being served."""
+    started: float = field(default_factory=time.perf_counter)
+    query_count: int = 0
+    query_seconds: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+
+
+def start_request() -> RequestMetrics:
+    metrics = RequestMetrics()
+    _current.set(metrics)
+    return metrics
+
+
+def current_request() -> Optional[RequestMetrics]:
+    return _current.get()
+
+
+def end_request() -> Optional[RequestMetrics]:
+    metrics = _current.get()
+    _current.set(None)
+    return metrics
+
+
+@contextmanager
+def track_phase(name: str):
+    """Add the duration of the block to a named phase of the current request."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.add_phase(name, time.perf_counter() - started)
+
+
+def install_query_listeners(engine) -> None:
+    """Count and time every cursor execution that happens inside a request."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # Kept on the execution context: a statement that raises never reaches
+        # after_cursor_execute, and nothing of it must outlive the execution
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.query_count += 1
+            metrics.query_seconds += time.perf_counter() - context._query_start
+
+
+def server_timing_header(metrics: RequestMetrics, total_seconds: float) -> str:
+    parts = [f'db;dur={metrics.query_seconds * 1000:.1f};desc="{metrics.query_count} queries"']
+    parts.extend(f"{name};dur={seconds * 1000:.1f}" for name, seconds in sorted(metrics.phases.items()))
+    parts.append(f"total;dur={total_seconds * 1000:.1f}")
+    return ", ".join(parts)
+
+
+@dataclass
+class _EndpointStats:
+    buckets: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    count: int = 0
+    seconds: float = 0.0
+    queries: int = 0
+    query_seconds: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+
+
+class MetricsRegistry:
+    """Thread-safe per-endpoint aggregates of finished requests."""
+
+    def __init__(self):
+        self._stats: Dict[Tuple[str, str, int], _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, method: str, status: int, metrics: RequestMetrics, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault((endpoint, method, status), _EndpointStats())
+            stats.count += 1
+            stats.seconds += seconds
+            stats.queries += metrics.query_count
+            stats.query_seconds += metrics.query_seconds
+            for name, phase_seconds in metrics.phases.items():
+                stats.phases[name] = stats.phases.get(name, 0.0) + phase_seconds
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats.buckets[index] += 1
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            snapshot = sorted(self._stats.items())
+
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by endpoint.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (endpoint, method, status), stats in snapshot:
+            labels = f'endpoint="{endpoint}",method="{method}",status="{status}"'
+            for bound, bucket_count in zip(LATENCY_BUCKETS, stats.buckets):
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {bucket_count}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {stats.seconds:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {stats.count}")
+
+        counters = (
+            ("db_queries_total", "SQL statements executed by endpoint.", lambda s: s.queries),
+            ("db_query_seconds_total", "Time spent in SQL statements by endpoint.", lambda s: f"{s.query_seconds:.6f}"),
+        )
+        for metric, help_text, value in counters:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for (endpoint, method, status), stats in snapshot:
+                lines.append(
+                    f'{metric}{{endpoint="{endpoint}",method="{method}",status="{status}"}} {value(stats)}'
+                )
+
+        lines.append("# HELP request_phase_seconds_total Time spent in a request phase (json, ...) by endpoint.")
+        lines.append("# TYPE request_phase_seconds_total counter")
+        for (endpoint, method, status), stats in snapshot:
+            for phase, seconds in sorted(stats.phases.items()):
+                lines.append(
+                    f'request_phase_seconds_total{{endpoint="{endpoint}",method="{method}",'
+                    f'status="{status}",phase="{phase}"}} {seconds:.6f}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+metrics_registry = MetricsRegistry()
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider adding body decoding and response encoding to the "json" phase."""
+
+    def dumps(self, obj, **kwargs):
+        with track_phase("json"):
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        with track_phase("json"):
+            return super().loads(s, **kwargs)
@@ -0,0 +1,43 @@
+"""
+Opaque keyset cursors for list endpoints.
+
+Lists are ordered by (date DESC, id DESC); the cursor is the (date, id) of
+the last row of a page, so the next page is read with an index range scan
+instead of an OFFSET that grows with the page number.
+"""
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+CursorKey = Tuple[date, int]
+
+
+class InvalidCursorError(ValueError):
+    """The cursor was not produced by encode_cursor."""
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(row_date: date, row_id: int) -> str:
+    payload = json.dumps([row_date.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[CursorKey]:
+    """Return the (date, id) key of a cursor, None for no cursor."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_date, raw_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return date.fromisoformat(raw_date), int(raw_id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursorError("INVALID_CURSOR") from e
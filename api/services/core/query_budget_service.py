@@ -0,0 +1,142 @@
+"""
+Query budgets: catch N+1 patterns before they reach production.
+
+    with query_budget(max_statements=5, max_repeats=2):
+        ImportService(db).import_transactions_atomic(data)
+
+    @query_budget(max_statements=3)
+    def get_summary(...): ...
+
+One before_cursor_execute listener on every Engine (the app engine from
+db/database.py as well as test engines) is installed once per process; it
+adds each statement to the budgets open in the current context (thread or
+task), kept in a ContextVar. Statements are grouped by shape:
+literals and bind parameters are masked and IN lists collapsed, so the
+same SELECT run once per row shows up as one shape repeated N times.
+"""
+
+import re
+import threading
+from collections import Counter
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from services.logs.logger_service import setup_logger
+
+logger = setup_logger("query_budget")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|:\w+|\?|\$\d+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+# Budgets open in the current context, innermost last
+_active_budgets: ContextVar[Tuple["query_budget", ...]] = ContextVar("query_budgets", default=())
+
+_listener_installed = False
+_listener_lock = threading.Lock()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A block issued more statements, or repeated a shape more often, than allowed."""
+
+
+def statement_shape(statement: str) -> str:
+    """SQL with literals/parameters replaced by ? and IN lists collapsed to (?)."""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _BIND_PARAMETER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("(?)", shape)
+    return _SPACES.sub(" ", shape).strip()
+
+
+def _on_execute(conn, cursor, statement, parameters, context, executemany):
+    for budget in _active_budgets.get():
+        budget.statements.append(statement)
+
+
+def install_query_budget_listener() -> None:
+    """Listen to every Engine once per process; budgets opened later reuse the listener."""
+    global _listener_installed
+    with _listener_lock:
+        if not _listener_installed:
+            event.listen(Engine, "before_cursor_execute", _on_execute)
+            _listener_installed = True
+
+
+class query_budget(ContextDecorator):
+    """
+    Context manager / decorator enforcing a statement budget.
+
+    max_statements caps the total number of statements, max_repeats the
+    executions of any single statement shape. on_exceed is "raise"
+    (QueryBudgetExceeded) or "warn" (log a warning). The recorded
+    statements stay available on the instance after the block. As a
+    decorator, every call gets its own copy of the budget.
+    """
+
+    def __init__(
+        self,
+        max_statements: Optional[int] = None,
+        max_repeats: Optional[int] = None,
+        on_exceed: str = "raise",
+        label: str = "block"
+    ):
+        if on_exceed not in ("raise", "warn"):
+            raise ValueError("on_exceed must be 'raise' or 'warn'")
+        self.max_statements = max_statements
+        self.max_repeats = max_repeats
+        self.on_exceed = on_exceed
+        self.label = label
+        self.statements: List[str] = []
+        self._token = None
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def shapes(self) -> Counter:
+        return Counter(statement_shape(statement) for statement in self.statements)
+
+    def _recreate_cm(self) -> "query_budget":
+        return query_budget(self.max_statements, self.max_repeats, self.on_exceed, self.label)
+
+    def __enter__(self) -> "query_budget":
+        if not _listener_installed:
+            install_query_budget_listener()
+        self.statements = []
+        self._token = _active_budgets.set(_active_budgets.get() + (self,))
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _active_budgets.reset(self._token)
+        self._token = None
+        if exc_type is None:
+            self.check()
+        return False
+
+    def violations(self) -> List[str]:
+        problems = []
+        if self.max_statements is not None and self.count > self.max_statements:
+            problems.append(f"{self.count} statements (budget {self.max_statements})")
+        if self.max_repeats is not None:
+            for shape, repeats in self.shapes().most_common():
+                if repeats <= self.max_repeats:
+                    break
+                problems.append(f"{repeats}x (budget {self.max_repeats}): {shape[:200]}")
+        return problems
+
+    def check(self) -> None:
+        problems = self.violations()
+        if not problems:
+            return
+        message = f"Query budget exceeded in {self.label}: " + "; ".join(problems)
+        if self.on_exceed == "raise":
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
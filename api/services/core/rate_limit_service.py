@@ -0,0 +1,31 @@
+"""
+Request rate limiting (flask-limiter).
+
+The limiter is bound to the app in create_app; its storage comes from
+RATELIMIT_STORAGE_URI (memory:// by default, i.e. per process). Routes opt
+in with @limiter.limit(...); nothing is limited by default.
+
+Keys use request.remote_addr, which is the client address only because
+create_app applies ProxyFix for the PROXY_FIX_HOPS proxies in front of it.
+"""
+
+from flask import current_app, request
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+
+limiter = Limiter(key_func=get_remote_address)
+
+
+def login_ip_limit() -> str:
+    return current_app.config["LOGIN_RATE_LIMIT_IP"]
+
+
+def login_email_limit() -> str:
+    return current_app.config["LOGIN_RATE_LIMIT_EMAIL"]
+
+
+def login_email_key() -> str:
+    """Rate limit key of a login attempt: the normalized email of the body."""
+    payload = request.get_json(silent=True)
+    email = payload.get("email") if isinstance(payload, dict) else None
+    return f"login-email:{str(email or '').strip().lower()}"
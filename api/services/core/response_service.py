@@ -1,12 +1,53 @@
-from flask import jsonify
+import json
+import logging
+from functools import lru_cache
+
+from flask import Response as FlaskResponse, jsonify
 from flask_babel import _
+from pydantic import BaseModel, TypeAdapter
+
+from services.core.metrics_service import track_phase
 # Setup logging
 from services.logs.logger_service import setup_logger
 
+# One logger per source name, configured once instead of on every response
+_logger = lru_cache(maxsize=None)(setup_logger)
+
+
+def _log_response(name: str, message: str, *args) -> None:
+    # Successful responses are only logged at debug level
+    logger = _logger(name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message, *args)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_type: type) -> TypeAdapter:
+    return TypeAdapter(list[model_type])
+
+
+def encode_models(data) -> bytes:
+    """JSON bytes of a Pydantic model or a list of models of the same schema."""
+    if isinstance(data, BaseModel):
+        return data.model_dump_json().encode()
+    if not data:
+        return b"[]"
+    return _list_adapter(type(data[0])).dump_json(data)
+
+
+def _models_response(data, extra: dict | None, details: str, status_code: int) -> FlaskResponse:
+    with track_phase("json"):
+        parts = [b'{"response":', encode_models(data)]
+        for key, value in (extra or {}).items():
+            parts.append(f",{json.dumps(key)}:{json.dumps(value)}".encode())
+        parts += [b',"details":', json.dumps(details).encode(), b"}"]
+    return FlaskResponse(b"".join(parts), status=status_code, mimetype="application/json")
+
+
 class Response:
     @staticmethod
     def error(error: str, details: list, status_code: int, name: str = None):
-        logger = setup_logger(name or "default_error_source")  # Use a default if name is None
+        logger = _logger(name or "default_error_source")  # Use a default if name is None
         logger.error("Error: %s, Details: %s", _(error), details)
         # Extract only the 'msg' from each error in details
         if isinstance(details, list):
@@ -18,8 +59,7 @@ class Response:
 
     @staticmethod
     def ok(response, details: str, status_code: int, name: str = None):
-        logger = setup_logger(name or "default_ok_source")  # Use a default if name is None
-        logger.info("Response: %s", _(details))
+        _log_response(name or "default_ok_source", "Response: %s", details)
         return jsonify({
             "response": response,
             "details": details
@@ -27,17 +67,54 @@ class Response:
 
     @staticmethod
     def ok_data(response:str, details:str, status_code: int, name: str = None):
-        logger = setup_logger(name or "default_data_source")  # Use a default if name is None
-        logger.info("Response: %s", _(details))
+        _log_response(name or "default_data_source", "Response: %s", details)
         return jsonify({
             "response": response,
             "details": details
         }), status_code
 
+    @staticmethod
+    def ok_page(items: list, next_cursor: str, details: str, status_code: int, name: str = None):
+        _log_response(name or "default_data_source", "Response: %s", details)
+        return jsonify({
+            "response": items,
+            "next_cursor": next_cursor,
+            "details": details
+        }), status_code
+
+    @staticmethod
+    def ok_models(data, details: str, status_code: int, name: str = None):
+        """
+        ok_data for Pydantic results: data is a Read model or a list of them.
+
+        The body is encoded by pydantic-core in one pass, without the
+        model_dump() dict copies that jsonify would walk again.
+        """
+        _log_response(name or "default_data_source", "Response: %s", details)
+        return _models_response(data, None, details, status_code)
+
+    @staticmethod
+    def ok_models_page(items: list, next_cursor: str, details: str, status_code: int, name: str = None):
+        """ok_page for a list of Pydantic Read models."""
+        _log_response(name or "default_data_source", "Response: %s", details)
+        return _models_response(items, {"next_cursor": next_cursor}, details, status_code)
+
+    @staticmethod
+    def stream(chunks, mimetype: str, filename: str, name: str = None, on_close=None):
+        """Stream text chunks as a file download; on_close runs once the body is sent (or aborted)."""
+        _logger(name or "default_data_source").info("Streaming export: %s", filename)
+        response = FlaskResponse(
+            chunks,
+            mimetype=mimetype,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+        if on_close is not None:
+            response.call_on_close(on_close)
+        return response
+
     @staticmethod
     def ok_message(details: str, status_code: int, name: str = None):
-        logger = setup_logger(name or "default_message_source")
-        logger.info("Response: %s", _(details))
+        _log_response(name or "default_message_source", "Response: %s", details)
         return jsonify({
             "response": None,
             "details": details
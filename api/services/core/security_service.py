@@ -1,12 +1,63 @@
-"""Security utilities for password hashing and verification."""
+"""
+Security utilities for password hashing and verification.
+
+bcrypt at 12 rounds costs a few hundred milliseconds of CPU. Hashing runs
+in a small process-wide thread pool (bcrypt releases the GIL) so at most
+PASSWORD_HASH_WORKERS cores are spent on it, and at most
+PASSWORD_HASH_QUEUE_LIMIT more requests may wait. Beyond that callers get
+PasswordHashingBusyError right away: a login burst is answered with 503
+instead of pinning every worker while the rest of the API starves.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
 import bcrypt
 
+BCRYPT_ROUNDS = 12
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "16"))
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusyError(RuntimeError):
+    """Every hashing worker and queue slot is taken; retry later."""
+
+
+class _BoundedHasher:
+    """Lazily started thread pool refusing work beyond workers + queue_limit."""
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, queue_limit: int = PASSWORD_HASH_QUEUE_LIMIT):
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(workers + queue_limit)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+            return self._executor
+
+    def run(self, fn: Callable[..., T], *args) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusyError("PASSWORD_HASHING_BUSY")
+        try:
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+
+_hasher = _BoundedHasher()
+
 
 def hash_password(plain_password: str) -> str:
     """Hash a plain text password using bcrypt."""
     password_bytes = plain_password.encode('utf-8')
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password_bytes, salt)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    hashed = _hasher.run(bcrypt.hashpw, password_bytes, salt)
     return hashed.decode('utf-8')
 
 
@@ -14,4 +65,4 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain text password against a bcrypt hash."""
     password_bytes = plain_password.encode('utf-8')
     hashed_bytes = hashed_password.encode('utf-8')
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    return _hasher.run(bcrypt.checkpw, password_bytes, hashed_bytes)
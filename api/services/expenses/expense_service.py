@@ -5,9 +5,10 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from repositories.expenses.expense_repository import ExpenseRepository
 from schemas.expenses.expense_schema import ExpenseCreate, ExpenseRead, ExpenseUpdate
-from models import Expense
+from models import Expense, TransactionEnum
 from services.core.base_service import BaseService
-from services.core.dedup_service import generate_dedup_hash
+from services.core.dedup_service import generate_dedup_hash, generate_dedup_hashes
+from services.core.fk_validation_service import EXPENSE_FOREIGN_KEYS, validate_foreign_keys_bulk
 
 
 class ExpenseService(BaseService[Expense, ExpenseRead, ExpenseCreate, ExpenseUpdate]):
@@ -20,6 +21,8 @@ class ExpenseService(BaseService[Expense, ExpenseRead, ExpenseCreate, ExpenseUpd
     - Transforming between domain and schemas
     """
 
+    summary_type = TransactionEnum.EXPENSE
+
     def __init__(self, db: Session):
         super().__init__(
             db=db,
@@ -47,6 +50,8 @@ class ExpenseService(BaseService[Expense, ExpenseRead, ExpenseCreate, ExpenseUpd
 
         obj = Expense(**data.model_dump(), dedup_hash=dedup_hash)
         try:
+            self._record_summary(None, self.daily_summary.snapshot(obj))
+            self._record_ledger(None, self.account_ledger.snapshot(obj))
             obj = self.repository.create(obj)
         except IntegrityError as e:
             if 'uq_expenses_account_dedup_hash' in str(e.orig):
@@ -64,25 +69,15 @@ class ExpenseService(BaseService[Expense, ExpenseRead, ExpenseCreate, ExpenseUpd
         if not items:
             return []
 
-        for item in items:
-            is_valid, error = self.repository.validate_foreign_keys(
-                source_id=item.source_id,
-                category_id=item.category_id,
-                account_id=item.account_id
-            )
-            if not is_valid:
-                raise ValueError(f"Invalid foreign key: {error}")
+        validate_foreign_keys_bulk(self.repository, items, EXPENSE_FOREIGN_KEYS, "expenses")
 
         batch_seen = set()
         created_objects: List[Expense] = []
 
-        for item in items:
-            dedup_hash = generate_dedup_hash(
-                account_id=item.account_id,
-                txn_date=item.date,
-                amount=item.amount,
-                description=item.description
-            )
+        dedup_hashes = generate_dedup_hashes(
+            (item.account_id, item.date, item.amount, item.description) for item in items
+        )
+        for item, dedup_hash in zip(items, dedup_hashes):
 
             key = (item.account_id, dedup_hash)
             if key in batch_seen:
@@ -96,9 +91,13 @@ class ExpenseService(BaseService[Expense, ExpenseRead, ExpenseCreate, ExpenseUpd
             obj = Expense(**item.model_dump(), dedup_hash=dedup_hash)
 
             try:
+                self._record_summary(None, self.daily_summary.snapshot(obj))
+                self._record_ledger(None, self.account_ledger.snapshot(obj))
                 obj = self.repository.create(obj)
                 created_objects.append(obj)
             except IntegrityError:
+                # The failed commit rolled back this row and its rollup/ledger deltas
+                self.db.rollback()
                 continue
 
         return [ExpenseRead.model_validate(obj) for obj in created_objects]
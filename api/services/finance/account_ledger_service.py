@@ -0,0 +1,105 @@
+"""Incremental maintenance and reads of the account_ledger running balances."""
+from datetime import date
+from decimal import Decimal
+from typing import Any, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from models import TransactionEnum
+from repositories.finance.account_ledger_repository import AccountLedgerRepository, LedgerDeltas
+from schemas.finance.account_ledger_schema import AccountBalanceHistory, AccountBalanceRead, AccountLedgerPoint
+
+# (account_id, date, amount) of a live transaction; None when absent/deleted
+Snapshot = Optional[Tuple[int, date, Decimal]]
+
+# Incomes add to the account balance, expenses subtract; other types do not move it
+LEDGER_SIGNS = {
+    TransactionEnum.INCOME: 1,
+    TransactionEnum.EXPENSE: -1,
+}
+
+
+class AccountLedgerService:
+    """
+    Records running-balance deltas for transaction writes and answers
+    balance queries.
+
+    Like DailySummaryService, the record_* methods only stage changes in the
+    caller's session: call them before the commit of the write they
+    describe, so both land (or roll back) together.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = AccountLedgerRepository(db)
+
+    @staticmethod
+    def snapshot(obj: Any, overrides: Optional[dict] = None) -> Snapshot:
+        """Ledger-relevant values of a transaction (ORM object or schema), with optional overrides."""
+        if obj is None or getattr(obj, "deleted_at", None) is not None:
+            return None
+        values = {
+            "account_id": getattr(obj, "account_id", None),
+            "date": getattr(obj, "date", None),
+            "amount": getattr(obj, "amount", None),
+        }
+        values.update({k: v for k, v in (overrides or {}).items() if k in values})
+        if values["account_id"] is None or values["date"] is None or values["amount"] is None:
+            return None
+        return values["account_id"], values["date"], Decimal(str(values["amount"]))
+
+    def record_change(self, transaction_type, before: Snapshot, after: Snapshot) -> None:
+        """Stage the delta between two states of one transaction (None = not present)."""
+        sign = LEDGER_SIGNS.get(transaction_type)
+        if sign is None:
+            return
+        deltas: LedgerDeltas = {}
+        for state, state_sign in ((before, -1), (after, 1)):
+            if state is None:
+                continue
+            account_id, txn_date, amount = state
+            key = (account_id, txn_date)
+            deltas[key] = deltas.get(key, Decimal("0")) + state_sign * sign * amount
+        self.repository.apply_deltas(deltas)
+
+    def record_rows(self, transaction_type, rows: Iterable[dict]) -> None:
+        """Stage the aggregated delta of freshly inserted rows (dicts with account_id, date, amount)."""
+        sign = LEDGER_SIGNS.get(transaction_type)
+        if sign is None:
+            return
+        deltas: LedgerDeltas = {}
+        for row in rows:
+            key = (row["account_id"], row["date"])
+            deltas[key] = deltas.get(key, Decimal("0")) + sign * Decimal(str(row["amount"]))
+        self.repository.apply_deltas(deltas)
+
+    def get_balance(self, account_id: int, on: date) -> AccountBalanceRead:
+        """Net of every income and expense of the account up to and including `on`."""
+        balance = self.repository.balance_at(account_id, on) or Decimal("0")
+        return AccountBalanceRead(account_id=account_id, date=on, balance=balance)
+
+    def get_history(self, account_id: int, start_date: date, end_date: date) -> AccountBalanceHistory:
+        """Opening balance of the range plus one point per day with movements."""
+        if start_date > end_date:
+            raise ValueError("start_date must be on or before end_date")
+        opening = self.repository.balance_at(account_id, start_date, inclusive=False) or Decimal("0")
+        return AccountBalanceHistory(
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            opening_balance=opening,
+            points=[
+                AccountLedgerPoint.model_validate(row)
+                for row in self.repository.get_range(account_id, start_date, end_date)
+            ],
+        )
+
+    def rebuild(self, account_id: Optional[int] = None) -> int:
+        """Recompute the ledger of one account (all when None) and commit."""
+        try:
+            written = self.repository.rebuild(account_id)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return written
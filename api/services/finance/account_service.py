@@ -4,6 +4,7 @@ from repositories.finance.account_repository import AccountRepository
 from schemas.finance.account_schema import AccountBase, AccountCreate, AccountRead, AccountUpdate
 from models import Account, AccountUser, User
 from services.core.base_service import BaseService
+from services.auth.principal_service import principal_cache
 
 
 class AccountService(BaseService[Account, AccountRead, AccountCreate, AccountUpdate]):
@@ -94,6 +95,8 @@ class AccountService(BaseService[Account, AccountRead, AccountCreate, AccountUpd
             self.db.add(account_user)
         
         self.db.flush()
+        # Members may have been removed as well as added: forget every principal
+        principal_cache.invalidate()
 
     # ISearchService
     def search(self, **filters) -> list[AccountRead]:
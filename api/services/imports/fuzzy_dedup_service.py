@@ -0,0 +1,140 @@
+"""
+Fuzzy duplicate detection for imports.
+
+Exact dedup hashes miss the same bank movement exported twice with a
+different date (booking vs value date) or with a reference number appended
+to the description. Rows that pass the exact check are compared with the
+stored transactions of the same account and amount within
+±FUZZY_DEDUP_WINDOW_DAYS; when the token sets of both descriptions are
+similar enough the row is reported as a possible duplicate instead of being
+inserted. Candidates are fetched with one query per account, served by the
+(account_id, amount, date) index, never one query per row.
+
+Rows of the same batch are compared with each other too, in input order:
+a row resembling an earlier row that is going to be inserted is held back,
+exactly as if that earlier row had been stored by a previous chunk. The
+result therefore does not depend on where chunk boundaries fall.
+"""
+
+import os
+import re
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, FrozenSet, Iterable, List
+
+FUZZY_DEDUP_WINDOW_DAYS = int(os.getenv("FUZZY_DEDUP_WINDOW_DAYS", "3"))
+FUZZY_DEDUP_THRESHOLD = float(os.getenv("FUZZY_DEDUP_THRESHOLD", "0.8"))
+
+# Letters only: reference numbers, card digits and dates never count as tokens
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+def description_tokens(description: str | None) -> FrozenSet[str]:
+    if not description:
+        return frozenset()
+    return frozenset(word for word in _WORD.findall(description.lower()) if len(word) > 1)
+
+
+def token_set_similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard index of two token sets; 0 when either side has no tokens."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _amount_key(amount) -> Decimal:
+    return Decimal(str(amount)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def find_possible_duplicates(
+    repository,
+    rows: List[dict],
+    window_days: int = FUZZY_DEDUP_WINDOW_DAYS,
+    threshold: float = FUZZY_DEDUP_THRESHOLD
+) -> Dict[int, List[int]]:
+    """
+    Match prepared import rows against stored transactions of their account.
+
+    rows need account_id, date (a date), amount and description.
+
+    Returns:
+        {position in rows: ids of stored transactions that look like the same movement}
+    """
+    positions_by_account: Dict[int, List[int]] = defaultdict(list)
+    for position, row in enumerate(rows):
+        positions_by_account[row["account_id"]].append(position)
+
+    window = timedelta(days=window_days)
+    matches: Dict[int, List[int]] = {}
+    for account_id, positions in positions_by_account.items():
+        dates = [rows[p]["date"] for p in positions]
+        candidates_by_amount = defaultdict(list)
+        for candidate in repository.get_fuzzy_candidates(
+            account_id,
+            {_amount_key(rows[p]["amount"]) for p in positions},
+            min(dates) - window,
+            max(dates) + window,
+        ):
+            candidates_by_amount[_amount_key(candidate.amount)].append(
+                (candidate.id, candidate.date, description_tokens(candidate.description))
+            )
+
+        for position in positions:
+            row = rows[position]
+            tokens = description_tokens(row["description"])
+            ids = [
+                candidate_id
+                for candidate_id, candidate_date, candidate_tokens in candidates_by_amount.get(
+                    _amount_key(row["amount"]), ()
+                )
+                if abs((candidate_date - row["date"]).days) <= window_days
+                and token_set_similarity(tokens, candidate_tokens) >= threshold
+            ]
+            if ids:
+                matches[position] = ids
+    return matches
+
+
+def find_batch_duplicates(
+    rows: List[dict],
+    held_back: Iterable[int] = (),
+    window_days: int = FUZZY_DEDUP_WINDOW_DAYS,
+    threshold: float = FUZZY_DEDUP_THRESHOLD
+) -> Dict[int, List[int]]:
+    """
+    Match prepared import rows against the earlier rows of the same batch.
+
+    Rows in held_back (e.g. already matched against stored transactions)
+    are not inserted, so they never count as an earlier match; neither do
+    rows this function holds back.
+
+    Returns:
+        {position in rows: positions of earlier rows that look like the same movement}
+    """
+    held = set(held_back)
+    positions_by_key: Dict[tuple, List[int]] = defaultdict(list)
+    for position, row in enumerate(rows):
+        positions_by_key[(row["account_id"], _amount_key(row["amount"]))].append(position)
+
+    matches: Dict[int, List[int]] = {}
+    for positions in positions_by_key.values():
+        if len(positions) < 2:
+            continue
+        kept: List[int] = []
+        for position in positions:
+            if position in held:
+                continue
+            row = rows[position]
+            tokens = description_tokens(row["description"])
+            earlier = [
+                other
+                for other in kept
+                if abs((rows[other]["date"] - row["date"]).days) <= window_days
+                and token_set_similarity(tokens, description_tokens(rows[other]["description"])) >= threshold
+            ]
+            if earlier:
+                matches[position] = earlier
+            else:
+                kept.append(position)
+    return matches
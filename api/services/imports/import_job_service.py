@@ -0,0 +1,243 @@
+"""
+Background import jobs.
+
+POST handlers store the request in the import_jobs table and return right
+away; a small in-process thread pool claims queued jobs and runs them
+through ImportService chunk by chunk, writing progress back to the job row.
+The table is the queue, so no external broker is needed: every process
+sweeps it at start and then periodically, so jobs left behind by a restart
+are picked up again.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from models.core.enums import ImportJobStatusEnum
+from models.imports import ImportJob
+from repositories.imports.import_job_repository import ImportJobRepository, utc_now
+from schemas.imports.import_job_schema import ImportJobRead
+from schemas.imports.import_schema import BulkImportRequest
+from services.core.fk_validation_service import ForeignKeyValidationError
+from services.imports.import_service import ImportService, STATEMENT_CHUNK_SIZE
+from services.logs.logger_service import setup_logger
+
+logger = setup_logger("import_jobs")
+
+IMPORT_JOB_WORKERS = int(os.getenv("IMPORT_JOB_WORKERS", "2"))
+IMPORT_JOB_CHUNK_SIZE = int(os.getenv("IMPORT_JOB_CHUNK_SIZE", str(STATEMENT_CHUNK_SIZE)))
+
+IMPORT_JOB_SWEEP_SECONDS = float(os.getenv("IMPORT_JOB_SWEEP_SECONDS", "60"))
+
+# Running jobs without a progress update for this long are considered orphaned
+STALE_JOB_SECONDS = 30 * 60
+
+
+class ImportJobInterrupted(Exception):
+    """Raised between chunks when the runner is stopping."""
+
+
+class ImportJobRunner:
+    """
+    Thread pool executing queued import jobs.
+
+    start() is called once per process (app or worker start): it re-queues
+    jobs orphaned by a restart, submits everything still queued and keeps
+    sweeping every IMPORT_JOB_SWEEP_SECONDS, so jobs enqueued by a process
+    that has since exited are not left waiting.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = IMPORT_JOB_WORKERS,
+        session_factory: Optional[Callable[[], Session]] = None,
+        sweep_seconds: float = IMPORT_JOB_SWEEP_SECONDS
+    ):
+        self.max_workers = max_workers
+        self.sweep_seconds = sweep_seconds
+        self._session_factory = session_factory
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._sweeper: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        # Job ids submitted to this process' pool and not finished yet
+        self._submitted: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def _new_session(self) -> Session:
+        if self._session_factory is None:
+            # Imported lazily: creating the engine needs the app configuration
+            from db.database import SessionFactory
+            self._session_factory = SessionFactory
+        return self._session_factory()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="import-job"
+                )
+            return self._executor
+
+    def start(self) -> None:
+        """Start the pool and the periodic sweep; calling it again is a no-op."""
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            self._stopping.clear()
+            self._sweeper = threading.Thread(target=self._sweep_loop, name="import-job-sweeper", daemon=True)
+        self._get_executor()
+        self._sweeper.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop sweeping and shut the pool down.
+
+        Running jobs stop at their next chunk boundary: the open chunk is
+        rolled back and the job goes back to queued, so another process
+        resumes it (rows already committed count as duplicates on resume).
+        With wait, returns once they have done so.
+        """
+        self._stopping.set()
+        with self._lock:
+            executor, self._executor = self._executor, None
+            sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.join()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def submit(self, job_id: int) -> None:
+        """Run a job in the pool unless this process already has it in flight."""
+        with self._lock:
+            if job_id in self._submitted:
+                return
+            self._submitted.add(job_id)
+        try:
+            self._get_executor().submit(self._run_submitted, job_id)
+        except RuntimeError:
+            # Pool shutting down: the job stays queued for the next sweep
+            with self._lock:
+                self._submitted.discard(job_id)
+
+    def _run_submitted(self, job_id: int) -> None:
+        try:
+            self.run(job_id)
+        finally:
+            with self._lock:
+                self._submitted.discard(job_id)
+
+    def _sweep_loop(self) -> None:
+        while not self._stopping.is_set():
+            self.resume_pending()
+            self._stopping.wait(self.sweep_seconds)
+
+    def resume_pending(self) -> None:
+        """Re-queue orphaned jobs and submit everything still queued."""
+        db = self._new_session()
+        try:
+            repository = ImportJobRepository(db)
+            requeued = repository.requeue_stale(utc_now() - timedelta(seconds=STALE_JOB_SECONDS))
+            db.commit()
+            if requeued:
+                logger.warning("Re-queued %s stale import jobs", requeued)
+            for job_id in repository.get_queued_ids():
+                self.submit(job_id)
+        except Exception as e:
+            db.rollback()
+            logger.error("Could not resume pending import jobs: %s", e)
+        finally:
+            db.close()
+
+    def run(self, job_id: int) -> None:
+        """Claim and execute one job; a job claimed elsewhere is skipped."""
+        db = self._new_session()
+        repository = ImportJobRepository(db)
+        try:
+            if not repository.claim(job_id):
+                db.rollback()
+                return
+            db.commit()
+
+            job = repository.get_by_id(job_id)
+            data = BulkImportRequest.model_validate(job.payload)
+
+            def progress(result: Dict[str, Any]) -> None:
+                if self._stopping.is_set():
+                    # Roll this chunk back and hand the job to another process
+                    raise ImportJobInterrupted()
+                repository.update_progress(
+                    job_id,
+                    processed_rows=result["total"],
+                    inserted=result["inserted"],
+                    duplicates=result["duplicates"],
+                    uncategorized=result["uncategorized"],
+                    possible_duplicates=len(result["possible_duplicates"]),
+                )
+
+            ImportService(db).import_transactions_in_chunks(
+                data, chunk_size=IMPORT_JOB_CHUNK_SIZE, progress=progress
+            )
+            repository.update_progress(
+                job_id,
+                status=ImportJobStatusEnum.COMPLETED,
+                payload=None,
+                finished_at=utc_now(),
+            )
+            db.commit()
+            logger.info("Import job %s completed", job_id)
+        except ImportJobInterrupted:
+            db.rollback()
+            repository.update_progress(job_id, status=ImportJobStatusEnum.QUEUED)
+            db.commit()
+            logger.info("Import job %s interrupted by shutdown, re-queued", job_id)
+        except Exception as e:
+            db.rollback()
+            if isinstance(e, ForeignKeyValidationError):
+                errors = e.errors
+            else:
+                logger.exception("Import job %s failed: %s", job_id, e)
+                errors = [{"msg": str(e)}]
+            repository.update_progress(
+                job_id,
+                status=ImportJobStatusEnum.FAILED,
+                payload=None,
+                errors=errors,
+                finished_at=utc_now(),
+            )
+            db.commit()
+        finally:
+            db.close()
+
+
+import_job_runner = ImportJobRunner()
+
+
+class ImportJobService:
+    """Creates import jobs and reports their status."""
+
+    def __init__(self, db: Session, runner: ImportJobRunner = import_job_runner):
+        self.db = db
+        self.repository = ImportJobRepository(db)
+        self.runner = runner
+
+    def enqueue(self, data: BulkImportRequest, user_id: Optional[int] = None) -> ImportJobRead:
+        """Persist a bulk import as a queued job and hand it to the worker pool."""
+        job = ImportJob(
+            kind="bulk",
+            status=ImportJobStatusEnum.QUEUED,
+            user_id=user_id,
+            payload=data.model_dump(mode="json"),
+            total_rows=len(data.expenses) + len(data.incomes),
+        )
+        job = self.repository.create(job)
+        self.runner.submit(job.id)
+        return ImportJobRead.model_validate(job)
+
+    def get(self, job_id: int) -> Optional[ImportJobRead]:
+        job = self.repository.get_by_id(job_id)
+        return ImportJobRead.model_validate(job) if job else None
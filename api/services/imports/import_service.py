@@ -1,14 +1,31 @@
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from typing import IO, Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from repositories.expenses.expense_repository import ExpenseRepository
 from repositories.incomes.income_repository import IncomeRepository
-from models import Expense, Income
+from models import TransactionEnum
 from services.category_rules.categorization_service import CategorizationService
-from services.core.dedup_service import generate_dedup_hash
-from schemas.imports.import_schema import BulkImportRequest
+from services.core.dedup_service import generate_dedup_hashes
+from services.core.fk_validation_service import (
+    EXPENSE_FOREIGN_KEYS,
+    INCOME_FOREIGN_KEYS,
+    ForeignKeyValidationError,
+    find_missing_foreign_keys,
+)
+from models.imports import ImportProfile
+from schemas.imports.import_schema import BulkImportRequest, ExpenseImportCreate, IncomeImportCreate
+from services.imports.fuzzy_dedup_service import find_batch_duplicates, find_possible_duplicates
+from services.finance.account_ledger_service import AccountLedgerService
+from services.imports.statement_reader import StatementRow, read_statement
+from services.summaries.daily_summary_service import DailySummaryService
+
+# Rows per categorize → dedup → insert round of an uploaded statement
+STATEMENT_CHUNK_SIZE = 500
+
+# Receives the running totals after each chunk (see import_transactions_in_chunks)
+ProgressCallback = Callable[[Dict[str, Any]], None]
 
 
 class ImportService:
@@ -16,10 +33,13 @@ class ImportService:
     Service handling bulk import orchestration across domains.
     
     Features:
-    - Atomic database transaction (all or nothing)
+    - Atomic database transaction (all or nothing, one commit per import)
+    - Set-based dedup and multi-row inserts (constant round trips per chunk)
+    - Fuzzy dedup: rows resembling stored ones are reported, not inserted
     - Automatic categorization if category_id is null
     - Validation of foreign keys
     - Fallback to AI service for categorization
+    - Streaming CSV/XLSX statement import driven by ImportProfile mappings
     """
 
     def __init__(self, db: Session):
@@ -27,6 +47,8 @@ class ImportService:
         self.expense_repo = ExpenseRepository(db)
         self.income_repo = IncomeRepository(db)
         self.categorization_service = CategorizationService(db)
+        self.daily_summary = DailySummaryService(db)
+        self.account_ledger = AccountLedgerService(db)
 
     def import_transactions_atomic(self, data: BulkImportRequest) -> Dict[str, Any]:
         """
@@ -34,20 +56,38 @@ class ImportService:
         
         Behavior:
         - If category_id is null and auto_categorize=True → apply rules + AI
-        - If categorization fails → category_id remains null
-        - If any FK validation fails → raise ValueError (transaction rolls back)
+        - If categorization fails → category_id remains null and the row is
+          not stored (category_id is NOT NULL); it is counted under
+          uncategorized, not duplicates
+        - If any FK validation fails → raise ForeignKeyValidationError listing
+          every offending row (nothing is written)
+        - If fuzzy_dedup=True, rows resembling a stored transaction (same
+          account and amount, close date, similar description) are skipped
+          and listed in possible_duplicates; resend them with
+          fuzzy_dedup=False to store them anyway
         - All transactions must pass validation or entire import fails
         
         Args:
             data: BulkImportRequest with expenses and incomes
             
         Returns:
-            Dict with counts of created resources
+            Dict with inserted, duplicates, uncategorized and total counts
+            plus the possible_duplicates list
             
         Raises:
-            ValueError: If any foreign key validation fails
+            ForeignKeyValidationError: If any foreign key validation fails
         """
-        
+        try:
+            result = self._import_batch(data)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return result
+
+    def _import_batch(self, data: BulkImportRequest) -> Dict[str, Any]:
+        """Categorize, validate, dedup and insert one batch without committing."""
+
         # Step 1: Auto-categorize transactions if needed
         if data.auto_categorize:
             for expense in data.expenses:
@@ -64,123 +104,333 @@ class ImportService:
                         transaction_type="income"
                     )
 
-        # Step 2: Validate foreign keys for all expenses
-        for item in data.expenses:
-            # category_id can be None now (needs_review)
-            is_valid, error = self.expense_repo.validate_foreign_keys(
-                user_id=item.user_id,
-                source_id=item.source_id,
-                category_id=item.category_id,  # Can be None
-                account_id=item.account_id
-            )
-            if not is_valid:
-                raise ValueError(f"Expense FK error: {error}")
-
-        # Step 3: Validate foreign keys for all incomes
-        for item in data.incomes:
-            # category_id can be None now (needs_review)
-            is_valid, error = self.income_repo.validate_foreign_keys(
-                source_id=item.source_id,
-                category_id=item.category_id,  # Can be None
-                account_id=item.account_id
-            )
-            if not is_valid:
-                raise ValueError(f"Income FK error: {error}")
+        # Step 2-3: Validate foreign keys of the whole batch (one IN query per field)
+        errors = find_missing_foreign_keys(
+            self.expense_repo, data.expenses, EXPENSE_FOREIGN_KEYS, "expenses"
+        ) + find_missing_foreign_keys(
+            self.income_repo, data.incomes, INCOME_FOREIGN_KEYS, "incomes"
+        )
+        if errors:
+            raise ForeignKeyValidationError(errors)
 
-        # Step 4: Deduplicate and insert
-        inserted_expenses = 0
-        inserted_incomes = 0
-        duplicates = 0
-        batch_expense_keys = set()
-        batch_income_keys = set()
-
-        for item in data.expenses:
-            date = item.date
-            if isinstance(date, str):
-                date = datetime.fromisoformat(date)
-
-            dedup_hash = generate_dedup_hash(
-                account_id=item.account_id,
-                txn_date=date,
-                amount=item.amount,
-                description=item.description
+        # Step 4: Deduplicate and insert (set-based, single transaction)
+        expense_rows = [
+            {
+                "name": item.name,
+                "description": item.description,
+                "amount": item.amount,
+                "date": date,
+                "currency": item.currency,
+                "user_id": item.user_id,
+                "source_id": item.source_id,
+                "category_id": item.category_id,
+                "account_id": item.account_id,
+                "card_id": item.card_id,
+                "ignore_in_analysis": bool(item.ignore_in_analysis),
+            }
+            for item, date in ((item, self._parse_date(item.date)) for item in data.expenses)
+        ]
+
+        income_rows = [
+            {
+                "description": item.description,
+                "amount": item.amount,
+                "date": date,
+                "currency": item.currency,
+                "source_id": item.source_id,
+                "category_id": item.category_id,
+                "account_id": item.account_id,
+                "ignore_in_analysis": bool(item.ignore_in_analysis),
+            }
+            for item, date in ((item, self._parse_date(item.date)) for item in data.incomes)
+        ]
+        for rows in (expense_rows, income_rows):
+            hashes = generate_dedup_hashes(
+                (row["account_id"], row["date"], row["amount"], row["description"]) for row in rows
             )
+            for row, dedup_hash in zip(rows, hashes):
+                row["dedup_hash"] = dedup_hash
 
-            key = (item.account_id, dedup_hash)
-            if key in batch_expense_keys:
-                duplicates += 1
-                continue
-            batch_expense_keys.add(key)
+        inserted_expenses, expense_duplicates, expense_uncategorized, expense_possible = self._ingest(
+            self.expense_repo, expense_rows, TransactionEnum.EXPENSE, data.fuzzy_dedup
+        )
+        inserted_incomes, income_duplicates, income_uncategorized, income_possible = self._ingest(
+            self.income_repo, income_rows, TransactionEnum.INCOME, data.fuzzy_dedup
+        )
 
-            if self.expense_repo.exists_by_dedup(item.account_id, dedup_hash):
-                duplicates += 1
-                continue
+        duplicates = expense_duplicates + income_duplicates
+        uncategorized = expense_uncategorized + income_uncategorized
 
-            obj = Expense(
-                name=item.name,
-                description=item.description,
-                amount=item.amount,
-                date=date,
-                currency=item.currency,
-                user_id=item.user_id,
-                source_id=item.source_id,
-                category_id=item.category_id,
-                account_id=item.account_id,
-                card_id=item.card_id,
-                ignore_in_analysis=bool(item.ignore_in_analysis),
-                dedup_hash=dedup_hash
-            )
+        total = len(data.expenses) + len(data.incomes)
 
-            try:
-                self.expense_repo.create(obj)
-                inserted_expenses += 1
-            except IntegrityError:
-                duplicates += 1
+        return {
+            "inserted": inserted_expenses + inserted_incomes,
+            "duplicates": duplicates,
+            "uncategorized": uncategorized,
+            "possible_duplicates": expense_possible + income_possible,
+            "total": total
+        }
 
-        for item in data.incomes:
-            date = item.date
-            if isinstance(date, str):
-                date = datetime.fromisoformat(date)
+    def import_statement(
+        self,
+        stream: IO[bytes],
+        filename: str,
+        profile: ImportProfile,
+        account_id: int,
+        user_id: int,
+        expense_source_id: int,
+        income_source_id: int,
+        card_id: Optional[int] = None,
+        currency: str = "EUR",
+        auto_categorize: bool = True,
+        chunk_size: int = STATEMENT_CHUNK_SIZE,
+        encoding: str = "utf-8-sig",
+        progress: Optional[ProgressCallback] = None,
+        fuzzy_dedup: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Import an uploaded CSV/XLSX statement using an ImportProfile mapping.
 
-            dedup_hash = generate_dedup_hash(
-                account_id=item.account_id,
-                txn_date=date,
-                amount=item.amount,
-                description=item.description
-            )
+        The file is read row by row and fed to the regular pipeline
+        (categorize → validate → dedup → insert) in chunks of chunk_size, so
+        memory stays flat regardless of the statement length. Each chunk is
+        committed on its own: re-uploading after a failure is safe because
+        rows already stored are reported as duplicates.
 
-            key = (item.account_id, dedup_hash)
-            if key in batch_income_keys:
-                duplicates += 1
-                continue
-            batch_income_keys.add(key)
+        Negative amounts become expenses, positive ones incomes (like the
+        web client). With a card, card expenses are ignored in analysis.
+
+        Returns:
+            Dict with per-chunk counts plus inserted, duplicates,
+            uncategorized, possible_duplicates, skipped (unreadable line
+            numbers) and total
+
+        Raises:
+            StatementFormatError: If the file or its columns cannot be read
+            ForeignKeyValidationError: If account/user/source/card do not exist
+        """
+        skipped_lines: List[int] = []
+        rows = read_statement(
+            stream,
+            filename,
+            columns=profile.columns,
+            header_row=profile.header_row_guess or 1,
+            encoding=encoding,
+            skipped=skipped_lines,
+        )
+
+        result = self._new_chunked_result()
+        chunk: List[StatementRow] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                self._import_statement_chunk(chunk, result, account_id, user_id, expense_source_id,
+                                             income_source_id, card_id, currency, auto_categorize, fuzzy_dedup,
+                                             progress)
+                chunk = []
+        if chunk:
+            self._import_statement_chunk(chunk, result, account_id, user_id, expense_source_id,
+                                         income_source_id, card_id, currency, auto_categorize, fuzzy_dedup,
+                                         progress)
 
-            if self.income_repo.exists_by_dedup(item.account_id, dedup_hash):
+        result["skipped"] = skipped_lines
+        return result
+
+    def _import_statement_chunk(
+        self,
+        chunk: List[StatementRow],
+        result: Dict[str, Any],
+        account_id: int,
+        user_id: int,
+        expense_source_id: int,
+        income_source_id: int,
+        card_id: Optional[int],
+        currency: str,
+        auto_categorize: bool,
+        fuzzy_dedup: bool,
+        progress: Optional[ProgressCallback]
+    ) -> None:
+        expenses = []
+        incomes = []
+        for row in chunk:
+            fields = {
+                "name": row.description[:255] or "-",
+                "description": row.description[:500] or None,
+                "amount": float(abs(row.amount)),
+                "date": row.date.isoformat(),
+                "currency": currency,
+                "account_id": account_id,
+            }
+            if row.amount < 0:
+                expenses.append(ExpenseImportCreate(
+                    **fields,
+                    user_id=user_id,
+                    source_id=expense_source_id,
+                    card_id=card_id,
+                    ignore_in_analysis=card_id is not None,
+                ))
+            else:
+                incomes.append(IncomeImportCreate(**fields, source_id=income_source_id))
+
+        batch = BulkImportRequest(
+            expenses=expenses, incomes=incomes, auto_categorize=auto_categorize, fuzzy_dedup=fuzzy_dedup
+        )
+        self._commit_chunk(batch, result, progress, first_line=chunk[0].line, last_line=chunk[-1].line)
+
+    def import_transactions_in_chunks(
+        self,
+        data: BulkImportRequest,
+        chunk_size: int = STATEMENT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Import a BulkImportRequest chunk by chunk, committing each chunk.
+
+        Used by background import jobs: progress(result) is called with the
+        running totals inside each chunk's transaction, so a job row updated
+        from it never reports rows that were rolled back.
+
+        Foreign keys of the whole payload are checked before the first
+        chunk, so errors carry absolute row indexes and nothing is written.
+
+        Returns:
+            Same shape as import_statement (without skipped)
+        """
+        errors = find_missing_foreign_keys(
+            self.expense_repo, data.expenses, EXPENSE_FOREIGN_KEYS, "expenses"
+        ) + find_missing_foreign_keys(
+            self.income_repo, data.incomes, INCOME_FOREIGN_KEYS, "incomes"
+        )
+        if errors:
+            raise ForeignKeyValidationError(errors)
+
+        result = self._new_chunked_result()
+        for items, field in ((data.expenses, "expenses"), (data.incomes, "incomes")):
+            for start in range(0, len(items), chunk_size):
+                batch = BulkImportRequest.model_construct(
+                    expenses=items[start:start + chunk_size] if field == "expenses" else [],
+                    incomes=items[start:start + chunk_size] if field == "incomes" else [],
+                    auto_categorize=data.auto_categorize,
+                    fuzzy_dedup=data.fuzzy_dedup,
+                )
+                self._commit_chunk(batch, result, progress, field=field, first_index=start)
+        return result
+
+    @staticmethod
+    def _new_chunked_result() -> Dict[str, Any]:
+        return {"chunks": [], "inserted": 0, "duplicates": 0, "uncategorized": 0, "possible_duplicates": [], "total": 0}
+
+    def _commit_chunk(
+        self,
+        batch: BulkImportRequest,
+        result: Dict[str, Any],
+        progress: Optional[ProgressCallback],
+        **chunk_info
+    ) -> None:
+        try:
+            counts = self._import_batch(batch)
+            result["chunks"].append({"chunk": len(result["chunks"]) + 1, **chunk_info, **counts})
+            for key in ("inserted", "duplicates", "uncategorized", "possible_duplicates", "total"):
+                result[key] += counts[key]
+            if progress:
+                progress(result)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    @staticmethod
+    def _parse_date(value):
+        if isinstance(value, str):
+            return datetime.fromisoformat(value).date()
+        if isinstance(value, datetime):
+            return value.date()
+        return value
+
+    def _ingest(
+        self,
+        repository,
+        rows: List[dict],
+        transaction_type: TransactionEnum,
+        fuzzy_dedup: bool = True
+    ) -> Tuple[int, int, int, List[dict]]:
+        """
+        Deduplicate and insert prepared rows for one table without committing.
+
+        - repeated (account_id, dedup_hash) keys inside the batch are duplicates
+        - one chunked SELECT per account finds hashes already stored
+        - remaining rows go through a multi-row INSERT ... ON CONFLICT DO NOTHING,
+          so rows raced in by a concurrent import are counted as duplicates too
+        - rows still without category cannot be stored (category_id is NOT NULL)
+          and are reported as uncategorized
+        - with fuzzy_dedup, rows resembling stored transactions or an earlier
+          row of the batch are held back and reported as possible duplicates
+          (one query per account), so chunk boundaries do not change the result
+        - the daily_summary rollup and the account_ledger get the aggregated
+          delta of the rows that were actually inserted (taken from RETURNING)
+
+        Returns: (inserted, duplicates, uncategorized, possible_duplicates)
+        """
+        duplicates = 0
+        seen = set()
+        unique_rows = []
+        for row in rows:
+            key = (row["account_id"], row["dedup_hash"])
+            if key in seen:
                 duplicates += 1
                 continue
+            seen.add(key)
+            unique_rows.append(row)
+
+        hashes_by_account: Dict[int, List[str]] = defaultdict(list)
+        for row in unique_rows:
+            hashes_by_account[row["account_id"]].append(row["dedup_hash"])
 
-            obj = Income(
-                description=item.description,
-                amount=item.amount,
-                date=date,
-                currency=item.currency,
-                source_id=item.source_id,
-                category_id=item.category_id,
-                account_id=item.account_id,
-                ignore_in_analysis=bool(item.ignore_in_analysis),
-                dedup_hash=dedup_hash
+        existing = set()
+        for account_id, hashes in hashes_by_account.items():
+            existing.update(
+                (account_id, dedup_hash)
+                for dedup_hash in repository.get_existing_dedup_hashes(account_id, hashes)
             )
 
-            try:
-                self.income_repo.create(obj)
-                inserted_incomes += 1
-            except IntegrityError:
-                duplicates += 1
+        pending = [row for row in unique_rows if (row["account_id"], row["dedup_hash"]) not in existing]
+        duplicates += len(unique_rows) - len(pending)
 
-        total = len(data.expenses) + len(data.incomes)
+        insertable = [row for row in pending if row["category_id"] is not None]
+        uncategorized = len(pending) - len(insertable)
 
-        return {
-            "inserted": inserted_expenses + inserted_incomes,
-            "duplicates": duplicates,
-            "total": total
-        }
+        matches: Dict[int, List[int]] = {}
+        batch_matches: Dict[int, List[int]] = {}
+        if fuzzy_dedup and insertable:
+            matches = find_possible_duplicates(repository, insertable)
+            batch_matches = find_batch_duplicates(insertable, held_back=matches)
+        held_back = matches.keys() | batch_matches.keys()
+        candidates = insertable
+        insertable = [row for position, row in enumerate(candidates) if position not in held_back]
+
+        inserted = repository.bulk_insert_ignore_conflicts(
+            insertable, returning=("id", "account_id", "date", "category_id", "amount", "dedup_hash")
+        )
+        self.daily_summary.record_rows(transaction_type, (row._mapping for row in inserted))
+        self.account_ledger.record_rows(transaction_type, (row._mapping for row in inserted))
+
+        # Rows resembling an earlier row of this batch point at its new id
+        inserted_ids = {(row.account_id, row.dedup_hash): row.id for row in inserted}
+        possible_duplicates = []
+        for position in sorted(held_back):
+            row = candidates[position]
+            earlier_ids = (
+                inserted_ids.get((candidates[earlier]["account_id"], candidates[earlier]["dedup_hash"]))
+                for earlier in batch_matches.get(position, ())
+            )
+            possible_duplicates.append({
+                "type": transaction_type.value,
+                "account_id": row["account_id"],
+                "date": row["date"].isoformat(),
+                "amount": row["amount"],
+                "description": row["description"],
+                "matches": matches.get(position, []) + [i for i in earlier_ids if i is not None],
+            })
+        duplicates += len(insertable) - len(inserted)
+
+        return len(inserted), duplicates, uncategorized, possible_duplicates
@@ -0,0 +1,199 @@
+"""
+Row-by-row reader for uploaded bank statements (CSV / XLSX).
+
+Headers are matched against ImportProfile.columns aliases the same way the
+web client does (accent-insensitive "header contains alias"), and rows are
+yielded one at a time so memory does not grow with the statement size.
+"""
+
+import csv
+import io
+import re
+import unicodedata
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+from services.logs.logger_service import setup_logger
+
+logger = setup_logger("statement_reader")
+
+REQUIRED_COLUMNS = ("date", "description", "amount")
+
+CSV_EXTENSIONS = (".csv", ".txt")
+XLSX_EXTENSIONS = (".xlsx", ".xlsm")
+
+_DATE_FORMATS = ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y", "%d/%m/%y", "%d.%m.%Y")
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]")
+
+
+class StatementFormatError(ValueError):
+    """The uploaded file cannot be read with the selected import profile."""
+
+
+@dataclass(frozen=True)
+class StatementRow:
+    """One statement line; amount keeps its sign (negative = expense)."""
+    line: int
+    date: date
+    description: str
+    amount: Decimal
+
+
+def normalize_header(text: Any) -> str:
+    """Lowercase, strip accents and symbols (mirrors the client's normalize)."""
+    text = unicodedata.normalize("NFD", str(text).lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return _NON_ALNUM.sub("", text).strip()
+
+
+def parse_amount(value: Any) -> Optional[Decimal]:
+    """Parse "1.501,70", "1,501.70", "-12 €" or numeric cells; None if empty/invalid."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return Decimal(str(value))
+
+    text = re.sub(r"[€\s]", "", str(value)).replace("−", "-")
+    last_dot, last_comma = text.rfind("."), text.rfind(",")
+    if last_comma > last_dot:
+        # European format: 1.501,70
+        text = text.replace(".", "").replace(",", ".")
+    elif last_dot > last_comma:
+        # English format: 1,501.70
+        text = text.replace(",", "")
+    try:
+        return Decimal(text)
+    except InvalidOperation:
+        return None
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """Parse date cells (datetime, dd/mm/yyyy, ISO...); None if unparseable."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if value is None:
+        return None
+    text = str(value).strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        return None
+
+
+def find_column_index(headers: List[str], aliases: List[str]) -> int:
+    """Index of the first header containing any alias, or -1."""
+    normalized_aliases = [normalize_header(alias) for alias in aliases]
+    for index, header in enumerate(headers):
+        if header and any(alias and alias in header for alias in normalized_aliases):
+            return index
+    return -1
+
+
+def _iter_csv(stream: IO[bytes], encoding: str) -> Iterator[List[Any]]:
+    text = io.TextIOWrapper(stream, encoding=encoding, errors="replace", newline="")
+    sample = text.read(8192)
+    text.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=";,\t|")
+    except csv.Error:
+        dialect = csv.excel
+    yield from csv.reader(text, dialect)
+
+
+def _iter_xlsx(stream: IO[bytes]) -> Iterator[List[Any]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError as e:
+        raise StatementFormatError("XLSX_SUPPORT_NOT_INSTALLED") from e
+
+    # read_only streams the sheet XML instead of building the whole workbook
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        for row in workbook.worksheets[0].iter_rows(values_only=True):
+            yield list(row)
+    finally:
+        workbook.close()
+
+
+def iter_raw_rows(stream: IO[bytes], filename: str, encoding: str = "utf-8-sig") -> Iterator[List[Any]]:
+    """Yield the cells of every row of the first sheet / CSV body."""
+    lowered = (filename or "").lower()
+    if lowered.endswith(XLSX_EXTENSIONS):
+        return _iter_xlsx(stream)
+    if lowered.endswith(CSV_EXTENSIONS):
+        return _iter_csv(stream, encoding)
+    raise StatementFormatError("UNSUPPORTED_FILE_TYPE")
+
+
+def read_statement(
+    stream: IO[bytes],
+    filename: str,
+    columns: Dict[str, List[str]],
+    header_row: int = 1,
+    encoding: str = "utf-8-sig",
+    skipped: Optional[List[int]] = None
+) -> Iterator[StatementRow]:
+    """
+    Stream StatementRow objects from an uploaded statement.
+
+    header_row is 1-based (ImportProfile.header_row_guess). Rows without an
+    amount (or with 0) are dropped like the web client does; rows with an
+    unparseable date or amount have their line number appended to skipped.
+    Raises StatementFormatError when a required column cannot be found.
+    """
+    missing = [name for name in REQUIRED_COLUMNS if not columns.get(name)]
+    if missing:
+        raise StatementFormatError(f"PROFILE_COLUMNS_MISSING: {', '.join(missing)}")
+
+    rows = iter_raw_rows(stream, filename, encoding)
+    header_index = max((header_row or 1) - 1, 0)
+
+    headers = None
+    for line, cells in enumerate(rows, start=1):
+        if line <= header_index:
+            continue
+        if headers is None:
+            headers = [normalize_header(c) if c is not None else "" for c in cells]
+            indexes = {name: find_column_index(headers, columns[name]) for name in REQUIRED_COLUMNS}
+            not_found = [name for name, index in indexes.items() if index == -1]
+            if not_found:
+                logger.warning("Column detection failed for %s: %s", filename, headers)
+                raise StatementFormatError(f"COLUMNS_NOT_FOUND: {', '.join(not_found)}")
+            width = max(indexes.values()) + 1
+            continue
+
+        if len(cells) < width or not any(c not in (None, "") for c in cells):
+            continue
+
+        raw_amount = cells[indexes["amount"]]
+        amount = parse_amount(raw_amount)
+        if amount is None or amount == 0:
+            if raw_amount not in (None, "") and amount is None and skipped is not None:
+                skipped.append(line)
+            continue
+
+        txn_date = parse_date(cells[indexes["date"]])
+        if txn_date is None:
+            if skipped is not None:
+                skipped.append(line)
+            continue
+
+        description = cells[indexes["description"]]
+        yield StatementRow(
+            line=line,
+            date=txn_date,
+            description=str(description).strip() if description is not None else "",
+            amount=amount,
+        )
+
+    if headers is None:
+        raise StatementFormatError("HEADER_ROW_NOT_FOUND")
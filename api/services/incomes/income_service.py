@@ -4,14 +4,17 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from repositories.incomes.income_repository import IncomeRepository
 from schemas.incomes.income_schema import IncomeCreate, IncomeRead, IncomeUpdate
-from models import Income
+from models import Income, TransactionEnum
 from services.core.base_service import BaseService
-from services.core.dedup_service import generate_dedup_hash
+from services.core.dedup_service import generate_dedup_hash, generate_dedup_hashes
+from services.core.fk_validation_service import INCOME_FOREIGN_KEYS, validate_foreign_keys_bulk
 
 
 class IncomeService(BaseService[Income, IncomeRead, IncomeCreate, IncomeUpdate]):
     """Service for Income domain logic."""
 
+    summary_type = TransactionEnum.INCOME
+
     def __init__(self, db: Session):
         super().__init__(
             db=db,
@@ -49,6 +52,8 @@ class IncomeService(BaseService[Income, IncomeRead, IncomeCreate, IncomeUpdate])
         obj = Income(**self._to_income_model_kwargs(data), dedup_hash=dedup_hash)
 
         try:
+            self._record_summary(None, self.daily_summary.snapshot(obj))
+            self._record_ledger(None, self.account_ledger.snapshot(obj))
             obj = self.repository.create(obj)
         except IntegrityError as e:
             if 'uq_incomes_account_dedup_hash' in str(e.orig):
@@ -62,25 +67,15 @@ class IncomeService(BaseService[Income, IncomeRead, IncomeCreate, IncomeUpdate])
         if not items:
             return []
 
-        for item in items:
-            is_valid, error = self.repository.validate_foreign_keys(
-                source_id=item.source_id,
-                category_id=item.category_id,
-                account_id=item.account_id,
-            )
-            if not is_valid:
-                raise ValueError(f"Invalid foreign key: {error}")
+        validate_foreign_keys_bulk(self.repository, items, INCOME_FOREIGN_KEYS, "incomes")
 
         batch_seen = set()
         created_objects: List[Income] = []
 
-        for item in items:
-            dedup_hash = generate_dedup_hash(
-                account_id=item.account_id,
-                txn_date=item.date,
-                amount=item.amount,
-                description=item.description,
-            )
+        dedup_hashes = generate_dedup_hashes(
+            (item.account_id, item.date, item.amount, item.description) for item in items
+        )
+        for item, dedup_hash in zip(items, dedup_hashes):
             key = (item.account_id, dedup_hash)
             if key in batch_seen:
                 continue
@@ -92,9 +87,13 @@ class IncomeService(BaseService[Income, IncomeRead, IncomeCreate, IncomeUpdate])
             obj = Income(**self._to_income_model_kwargs(item), dedup_hash=dedup_hash)
 
             try:
+                self._record_summary(None, self.daily_summary.snapshot(obj))
+                self._record_ledger(None, self.account_ledger.snapshot(obj))
                 obj = self.repository.create(obj)
                 created_objects.append(obj)
             except IntegrityError:
+                # The failed commit rolled back this row and its rollup/ledger deltas
+                self.db.rollback()
                 continue
 
         return [IncomeRead.model_validate(obj) for obj in created_objects]
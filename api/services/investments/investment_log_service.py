@@ -1,13 +1,20 @@
 """Service for InvestmentLog implementing CRUD operations."""
+from typing import Optional
 from sqlalchemy.orm import Session
 from repositories.investments.investment_log_repository import InvestmentLogRepository
 from schemas.investments.investment_log_schema import InvestmentLogCreate, InvestmentLogRead, InvestmentLogUpdate
 from models import InvestmentLog
 from services.core.base_service import BaseService
+from services.investments.investment_position_service import InvestmentPositionService
 
 
 class InvestmentLogService(BaseService[InvestmentLog, InvestmentLogRead, InvestmentLogCreate, InvestmentLogUpdate]):
-    """Service for InvestmentLog domain logic."""
+    """
+    Service for InvestmentLog domain logic.
+
+    Every write stages the investment_positions snapshots it affects before
+    its commit, so positions and logs change together.
+    """
 
     def __init__(self, db: Session):
         super().__init__(
@@ -16,3 +23,23 @@ class InvestmentLogService(BaseService[InvestmentLog, InvestmentLogRead, Investm
             repository=InvestmentLogRepository(db),
             read_schema=InvestmentLogRead
         )
+        self.positions = InvestmentPositionService(db)
+
+    def create(self, data: InvestmentLogCreate) -> InvestmentLogRead:
+        self.positions.record_change(None, self.positions.snapshot(data))
+        return super().create(data)
+
+    def update(self, id: int, data: InvestmentLogUpdate) -> Optional[InvestmentLogRead]:
+        current = self.repository.get_by_id(id)
+        if current is not None:
+            self.positions.record_change(
+                self.positions.snapshot(current),
+                self.positions.snapshot(current, data.model_dump(exclude_unset=True))
+            )
+        return super().update(id, data)
+
+    def delete(self, id: int) -> bool:
+        current = self.repository.get_by_id(id)
+        if current is not None:
+            self.positions.record_change(self.positions.snapshot(current), None)
+        return super().delete(id)
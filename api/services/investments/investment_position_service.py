@@ -0,0 +1,272 @@
+"""
+Investment positions and valuation from investments_logs.
+
+How logs are read:
+- BUY / DEPOSIT with units_bought and price_per_unit open a lot
+  (units += units_bought, cost += units_bought * price_per_unit).
+- SELL / WITHDRAW with units_bought and price_per_unit close units
+  (capped at the units held); realized P&L is the proceeds minus the cost
+  of the closed units, taken FIFO from the open lots or at the average
+  cost, per INVESTMENT_COST_METHOD.
+- Every log marks the position: current_value is its market value after
+  the log. Logs without units/price (and TRANSFER / HOLD) only mark it.
+
+Positions are snapshotted per (investment, day) in investment_positions.
+A log write replays the logs from its date on, resuming from the snapshot
+before it, so recent writes replay a handful of logs. Changing
+INVESTMENT_COST_METHOD requires a rebuild.
+"""
+import math
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from itertools import groupby
+from typing import Any, List, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from models import ActionEnum, InvestmentPosition
+from repositories.investments.investment_position_repository import InvestmentPositionRepository
+from schemas.investments.investment_position_schema import (
+    InvestmentPositionPoint,
+    InvestmentPositionRead,
+    InvestmentValuationRead,
+    PortfolioRead,
+    PortfolioTotal,
+)
+
+INVESTMENT_COST_METHOD = os.getenv("INVESTMENT_COST_METHOD", "fifo").lower()
+COST_METHODS = ("fifo", "average")
+
+OPEN_ACTIONS = {ActionEnum.BUY, ActionEnum.DEPOSIT}
+CLOSE_ACTIONS = {ActionEnum.SELL, ActionEnum.WITHDRAW}
+
+ZERO = Decimal("0")
+
+
+class LogState(NamedTuple):
+    """Position-relevant values of one investment log (id is None until inserted)."""
+    id: Optional[int]
+    investment_id: int
+    date: date
+    action: ActionEnum
+    units: Optional[Decimal]
+    price: Optional[Decimal]
+    value: Decimal
+
+
+@dataclass
+class Position:
+    """Running state of one investment while its logs are replayed."""
+    units: Decimal = ZERO
+    cost_basis: Decimal = ZERO
+    realized_pnl: Decimal = ZERO
+    market_value: Decimal = ZERO
+    # Open lots [units, price] (FIFO only)
+    lots: List[List[Decimal]] = field(default_factory=list)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Optional[InvestmentPosition]) -> "Position":
+        if snapshot is None:
+            return cls()
+        return cls(
+            units=Decimal(snapshot.units),
+            cost_basis=Decimal(snapshot.cost_basis),
+            realized_pnl=Decimal(snapshot.realized_pnl),
+            market_value=Decimal(snapshot.market_value),
+            lots=[[Decimal(units), Decimal(price)] for units, price in snapshot.lots or []],
+        )
+
+    def to_snapshot(self, investment_id: int, day: date) -> InvestmentPosition:
+        return InvestmentPosition(
+            investment_id=investment_id,
+            date=day,
+            units=self.units,
+            cost_basis=self.cost_basis,
+            realized_pnl=self.realized_pnl,
+            market_value=self.market_value,
+            lots=[[str(units), str(price)] for units, price in self.lots],
+        )
+
+
+def apply_log(position: Position, log: LogState, cost_method: str = INVESTMENT_COST_METHOD) -> None:
+    """Advance a position by one log (see the module docstring for the rules)."""
+    if log.units and log.price:
+        if log.action in OPEN_ACTIONS:
+            position.units += log.units
+            position.cost_basis += log.units * log.price
+            if cost_method == "fifo":
+                position.lots.append([log.units, log.price])
+        elif log.action in CLOSE_ACTIONS and position.units > 0:
+            units = min(log.units, position.units)
+            if cost_method == "fifo":
+                closed_cost = _close_fifo(position.lots, units)
+            else:
+                closed_cost = position.cost_basis * units / position.units
+            position.units -= units
+            position.cost_basis = position.cost_basis - closed_cost if position.units else ZERO
+            position.realized_pnl += units * log.price - closed_cost
+    position.market_value = log.value
+
+
+def _close_fifo(lots: List[List[Decimal]], units: Decimal) -> Decimal:
+    """Take units from the oldest lots; returns their cost."""
+    cost = ZERO
+    while units > 0 and lots:
+        lot_units, lot_price = lots[0]
+        taken = min(units, lot_units)
+        cost += taken * lot_price
+        units -= taken
+        if taken == lot_units:
+            lots.pop(0)
+        else:
+            lots[0][0] = lot_units - taken
+    return cost
+
+
+def _point(snapshot: InvestmentPosition) -> dict:
+    return {
+        "date": snapshot.date,
+        "units": snapshot.units,
+        "cost_basis": snapshot.cost_basis,
+        "realized_pnl": snapshot.realized_pnl,
+        "market_value": snapshot.market_value,
+        "unrealized_pnl": Decimal(snapshot.market_value) - Decimal(snapshot.cost_basis),
+    }
+
+
+class InvestmentPositionService:
+    """
+    Maintains the investment_positions snapshots and reads portfolio
+    valuations from them.
+
+    record_change only stages changes in the caller's session: call it
+    before the commit of the log write it describes.
+    """
+
+    def __init__(self, db: Session, cost_method: str = INVESTMENT_COST_METHOD):
+        if cost_method not in COST_METHODS:
+            raise ValueError(f"Invalid INVESTMENT_COST_METHOD: {cost_method}")
+        self.db = db
+        self.cost_method = cost_method
+        self.repository = InvestmentPositionRepository(db)
+
+    @staticmethod
+    def snapshot(obj: Any, overrides: Optional[dict] = None) -> Optional[LogState]:
+        """Position-relevant values of a log (ORM object or schema), with optional overrides."""
+        if obj is None or getattr(obj, "deleted_at", None) is not None:
+            return None
+        values = {
+            "investment_id": getattr(obj, "investment_id", None),
+            "date": getattr(obj, "date", None),
+            "action": getattr(obj, "action", None),
+            "units_bought": getattr(obj, "units_bought", None),
+            "price_per_unit": getattr(obj, "price_per_unit", None),
+            "current_value": getattr(obj, "current_value", None),
+        }
+        values.update({k: v for k, v in (overrides or {}).items() if k in values})
+        if values["investment_id"] is None or values["date"] is None or values["current_value"] is None:
+            return None
+        units, price = values["units_bought"], values["price_per_unit"]
+        return LogState(
+            id=getattr(obj, "id", None),
+            investment_id=values["investment_id"],
+            date=values["date"],
+            action=ActionEnum(values["action"]),
+            units=Decimal(str(units)) if units is not None else None,
+            price=Decimal(str(price)) if price is not None else None,
+            value=Decimal(str(values["current_value"])),
+        )
+
+    def record_change(self, before: Optional[LogState], after: Optional[LogState]) -> None:
+        """Stage the snapshots affected by one log going from before to after (None = not present)."""
+        start_days = {}
+        for state in (before, after):
+            if state is not None:
+                current = start_days.get(state.investment_id)
+                start_days[state.investment_id] = state.date if current is None else min(current, state.date)
+        for investment_id in sorted(start_days):
+            self._replay(investment_id, start_days[investment_id], before, after)
+
+    def _replay(self, investment_id: int, start_day: Optional[date],
+                before: Optional[LogState] = None, after: Optional[LogState] = None) -> int:
+        """Rewrite the snapshots of an investment from start_day on (all when None)."""
+        previous = self.repository.get_before(investment_id, start_day) if start_day is not None else None
+        position = Position.from_snapshot(previous)
+
+        logs = [
+            state for state in map(self.snapshot, self.repository.get_logs_from(investment_id, start_day))
+            if state is not None and (before is None or state.id != before.id)
+        ]
+        if after is not None and after.investment_id == investment_id:
+            logs.append(after)
+        # Logs not inserted yet go last on their day
+        logs.sort(key=lambda log: (log.date, log.id if log.id is not None else math.inf))
+
+        self.repository.delete_from(investment_id, start_day)
+        snapshots = []
+        for day, day_logs in groupby(logs, key=lambda log: log.date):
+            for log in day_logs:
+                apply_log(position, log, self.cost_method)
+            snapshots.append(position.to_snapshot(investment_id, day))
+        self.repository.add_all(snapshots)
+        return len(snapshots)
+
+    def rebuild(self, investment_id: Optional[int] = None) -> int:
+        """Replay every log of one investment (all when None) and commit."""
+        try:
+            if investment_id is None:
+                self.repository.delete_from(None)
+                investment_ids = self.repository.get_investment_ids_with_logs()
+            else:
+                investment_ids = [investment_id]
+            written = sum(self._replay(i, None) for i in investment_ids)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return written
+
+    def get_portfolio(self, as_of: Optional[date] = None) -> PortfolioRead:
+        """Latest position of every investment (on or before as_of) and totals per currency."""
+        positions = [
+            InvestmentPositionRead(
+                **_point(snapshot),
+                investment_id=investment.id,
+                description=investment.description,
+                currency=investment.currency,
+                category_id=investment.category_id,
+                account_id=investment.account_id,
+            )
+            for snapshot, investment in self.repository.get_latest(as_of)
+        ]
+
+        totals = defaultdict(lambda: defaultdict(lambda: ZERO))
+        for position in positions:
+            total = totals[position.currency]
+            for key in ("cost_basis", "market_value", "realized_pnl", "unrealized_pnl"):
+                total[key] += getattr(position, key)
+
+        return PortfolioRead(
+            as_of=as_of,
+            cost_method=self.cost_method,
+            positions=positions,
+            totals=[PortfolioTotal(currency=currency, **values) for currency, values in totals.items()],
+        )
+
+    def get_valuation(self, investment_id: int, start_date: date, end_date: date) -> InvestmentValuationRead:
+        """Snapshots of one investment over a date range (one point per day with logs)."""
+        if start_date > end_date:
+            raise ValueError("start_date must be on or before end_date")
+        return InvestmentValuationRead(
+            investment_id=investment_id,
+            cost_method=self.cost_method,
+            start_date=start_date,
+            end_date=end_date,
+            points=[
+                InvestmentPositionPoint(**_point(snapshot))
+                for snapshot in self.repository.get_range(investment_id, start_date, end_date)
+            ],
+        )
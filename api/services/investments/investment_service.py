@@ -3,7 +3,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from repositories.investments.investment_repository import InvestmentRepository
 from schemas.investments.investment_schema import InvestmentCreate, InvestmentRead, InvestmentUpdate
-from models import Investment
+from models import Investment, TransactionEnum
 from services.core.base_service import BaseService
 from services.core.dedup_service import generate_dedup_hash
 
@@ -11,6 +11,8 @@ from services.core.dedup_service import generate_dedup_hash
 class InvestmentService(BaseService[Investment, InvestmentRead, InvestmentCreate, InvestmentUpdate]):
     """Service for Investment domain logic."""
 
+    summary_type = TransactionEnum.INVESTMENT
+
     def __init__(self, db: Session):
         super().__init__(
             db=db,
@@ -30,6 +32,7 @@ class InvestmentService(BaseService[Investment, InvestmentRead, InvestmentCreate
         obj = Investment(**data.model_dump(), dedup_hash=dedup_hash)
 
         try:
+            self._record_summary(None, self.daily_summary.snapshot(obj))
             obj = self.repository.create(obj)
         except IntegrityError as e:
             if 'uq_investments_account_dedup_hash' in str(e.orig):
@@ -0,0 +1,103 @@
+"""Running savings totals and progress series over savings_logs."""
+from datetime import date
+from decimal import Decimal
+from itertools import groupby
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from repositories.savings.saving_log_repository import SavingLogRepository
+from schemas.savings.saving_progress_schema import (
+    SavingProgressPoint,
+    SavingProgressQuery,
+    SavingProgressRead,
+    SavingProgressSeries,
+)
+
+
+class SavingLogState(NamedTuple):
+    """Total-relevant values of one saving log (id is None until inserted)."""
+    id: Optional[int]
+    saving_id: int
+    date: date
+    amount: Decimal
+
+
+class SavingAnalyticsService:
+    """
+    Keeps SavingLog.total_amount as the running total of each saving and
+    reads progress series from it.
+
+    record_change only stages changes in the caller's session: call it
+    before the commit of the log write it describes.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = SavingLogRepository(db)
+
+    @staticmethod
+    def snapshot(obj: Any, overrides: Optional[dict] = None) -> Optional[SavingLogState]:
+        """Total-relevant values of a log (ORM object or schema), with optional overrides."""
+        if obj is None or getattr(obj, "deleted_at", None) is not None:
+            return None
+        values = {
+            "saving_id": getattr(obj, "saving_id", None),
+            "date": getattr(obj, "date", None),
+            "amount": getattr(obj, "amount", None),
+        }
+        values.update({k: v for k, v in (overrides or {}).items() if k in values})
+        if values["saving_id"] is None or values["date"] is None or values["amount"] is None:
+            return None
+        return SavingLogState(
+            id=getattr(obj, "id", None),
+            saving_id=values["saving_id"],
+            date=values["date"],
+            amount=Decimal(str(values["amount"])),
+        )
+
+    def record_change(self, before: Optional[SavingLogState],
+                      after: Optional[SavingLogState]) -> Optional[Decimal]:
+        """
+        Shift the totals of the later logs for one log going from before to
+        after (None = not present). Returns the total_amount of after.
+        """
+        if before is not None:
+            self.repository.shift_totals(before.saving_id, before.date, before.id, -before.amount)
+        if after is None:
+            return None
+        total = self.repository.total_before(after.saving_id, after.date, after.id) + after.amount
+        self.repository.shift_totals(after.saving_id, after.date, after.id, after.amount)
+        return total
+
+    def recompute_totals(self, saving_id: Optional[int] = None) -> int:
+        """Correct drifted totals of one saving (all when None) and commit; returns rows fixed."""
+        try:
+            fixed = self.repository.recompute_totals(saving_id)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return fixed
+
+    def get_progress(self, query: SavingProgressQuery) -> SavingProgressRead:
+        """Deposits and end-of-bucket totals per saving, from one grouped query."""
+        rows = self.repository.get_progress(query.interval, query.date_from, query.date_to, query.saving_id)
+        series = []
+        for (saving_id, description, currency, amount), saving_rows in groupby(rows, key=lambda row: row[:4]):
+            series.append(SavingProgressSeries(
+                saving_id=saving_id,
+                description=description,
+                currency=currency,
+                amount=amount,
+                points=[
+                    SavingProgressPoint(period=period, deposited=deposited, total_amount=total)
+                    for *_, period, deposited, total in saving_rows
+                ],
+            ))
+        return SavingProgressRead(
+            interval=query.interval,
+            date_from=query.date_from,
+            date_to=query.date_to,
+            series=series,
+        )
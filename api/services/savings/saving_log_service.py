@@ -1,13 +1,21 @@
 """Service for SavingLog implementing CRUD operations."""
+from typing import Optional
 from sqlalchemy.orm import Session
 from repositories.savings.saving_log_repository import SavingLogRepository
 from schemas.savings.saving_log_schema import SavingLogCreate, SavingLogRead, SavingLogUpdate
 from models import SavingLog
 from services.core.base_service import BaseService
+from services.savings.saving_analytics_service import SavingAnalyticsService
 
 
 class SavingLogService(BaseService[SavingLog, SavingLogRead, SavingLogCreate, SavingLogUpdate]):
-    """Service for SavingLog domain logic."""
+    """
+    Service for SavingLog domain logic.
+
+    total_amount is computed here (the saving's running total) and any
+    client value is overwritten; every write also shifts the totals of the
+    later logs before its commit.
+    """
 
     def __init__(self, db: Session):
         super().__init__(
@@ -16,3 +24,28 @@ class SavingLogService(BaseService[SavingLog, SavingLogRead, SavingLogCreate, Sa
             repository=SavingLogRepository(db),
             read_schema=SavingLogRead
         )
+        self.analytics = SavingAnalyticsService(db)
+
+    def create(self, data: SavingLogCreate) -> SavingLogRead:
+        obj = self.model(**data.model_dump())
+        obj.total_amount = self.analytics.record_change(None, self.analytics.snapshot(obj))
+        obj = self.repository.create(obj)
+        return self.read_schema.model_validate(obj)
+
+    def update(self, id: int, data: SavingLogUpdate) -> Optional[SavingLogRead]:
+        update_data = data.model_dump(exclude_unset=True)
+        update_data.pop("total_amount", None)
+        current = self.repository.get_by_id(id)
+        if current is not None:
+            update_data["total_amount"] = self.analytics.record_change(
+                self.analytics.snapshot(current),
+                self.analytics.snapshot(current, update_data)
+            )
+        obj = self.repository.update(id, **update_data)
+        return self.read_schema.model_validate(obj) if obj else None
+
+    def delete(self, id: int) -> bool:
+        current = self.repository.get_by_id(id)
+        if current is not None:
+            self.analytics.record_change(self.analytics.snapshot(current), None)
+        return self.repository.delete(id)
@@ -0,0 +1,87 @@
+"""Incremental maintenance of the daily_summary rollup."""
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from models import TransactionEnum
+from repositories.summaries.daily_summary_repository import DailySummaryRepository, SummaryDeltas
+
+# (date, category_id, amount) of a live transaction; None when absent/deleted
+Snapshot = Optional[Tuple[date, int, Decimal]]
+
+
+def _as_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).date()
+    return value
+
+
+def _type_value(transaction_type) -> str:
+    return transaction_type.value if isinstance(transaction_type, TransactionEnum) else str(transaction_type)
+
+
+class DailySummaryService:
+    """
+    Records rollup deltas for transaction writes.
+
+    Every method only stages an upsert in the caller's session: call it
+    before the commit of the write it describes, so both land (or roll back)
+    together.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = DailySummaryRepository(db)
+
+    @staticmethod
+    def snapshot(obj: Any, overrides: Optional[dict] = None) -> Snapshot:
+        """Rollup-relevant values of a transaction (ORM object or schema), with optional overrides."""
+        if obj is None or getattr(obj, "deleted_at", None) is not None:
+            return None
+        values = {
+            "date": getattr(obj, "date", None),
+            "category_id": getattr(obj, "category_id", None),
+            "amount": getattr(obj, "amount", None),
+        }
+        values.update({k: v for k, v in (overrides or {}).items() if k in values})
+        if values["date"] is None or values["category_id"] is None or values["amount"] is None:
+            return None
+        return _as_date(values["date"]), values["category_id"], Decimal(str(values["amount"]))
+
+    def record_change(self, transaction_type, before: Snapshot, after: Snapshot) -> None:
+        """Stage the delta between two states of one transaction (None = not present)."""
+        type_ = _type_value(transaction_type)
+        deltas: SummaryDeltas = {}
+        for state, sign in ((before, -1), (after, 1)):
+            if state is None:
+                continue
+            txn_date, category_id, amount = state
+            key = (txn_date, type_, category_id)
+            total, count = deltas.get(key, (Decimal("0"), 0))
+            deltas[key] = (total + sign * amount, count + sign)
+        self.repository.apply_deltas(deltas)
+
+    def record_rows(self, transaction_type, rows: Iterable[dict]) -> None:
+        """Stage the aggregated delta of freshly inserted rows (dicts with date, category_id, amount)."""
+        type_ = _type_value(transaction_type)
+        totals = defaultdict(lambda: [Decimal("0"), 0])
+        for row in rows:
+            key = (_as_date(row["date"]), type_, row["category_id"])
+            totals[key][0] += Decimal(str(row["amount"]))
+            totals[key][1] += 1
+        self.repository.apply_deltas({key: (total, count) for key, (total, count) in totals.items()})
+
+    def rebuild(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> int:
+        """Recompute the rollup from the transaction tables and commit."""
+        try:
+            written = self.repository.rebuild(start_date, end_date)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return written
@@ -1,4 +1,5 @@
 """Summary service for aggregation business logic."""
+import os
 from datetime import date, timedelta
 from sqlalchemy.orm import Session
 from repositories.summaries.summary_repository import SummaryRepository
@@ -9,13 +10,17 @@ from schemas.summaries.summary_schema import (
     IncomeVsExpense
 )
 
+# Read summaries from the daily_summary rollup instead of the raw tables
+SUMMARY_USE_ROLLUP = os.getenv("SUMMARY_USE_ROLLUP", "true").lower() == "true"
+
 
 class SummaryService:
     """Service for summary aggregation logic."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, use_rollup: bool = SUMMARY_USE_ROLLUP):
         self.db = db
         self.repository = SummaryRepository(db)
+        self.use_rollup = use_rollup
 
     def get_summary(
         self,
@@ -37,11 +42,12 @@ class SummaryService:
             raise ValueError("start_date must be <= end_date")
 
         # Fetch aggregated data
-        totals_by_category_raw = self.repository.get_totals_by_category(start_date, end_date)
-        totals_over_time_raw = self.repository.get_totals_over_time(start_date, end_date)
-        total_income, total_expense, tx_count = self.repository.get_income_vs_expense(
-            start_date, end_date
-        )
+        if self.use_rollup:
+            aggregates = self.repository.get_summary_from_rollup(start_date, end_date)
+        else:
+            aggregates = self.repository.get_summary(start_date, end_date)
+        totals_by_category_raw, totals_over_time_raw, income_vs_expense_raw = aggregates
+        total_income, total_expense, tx_count = income_vs_expense_raw
 
         # Build response objects
         totals_by_category = [
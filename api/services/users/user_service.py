@@ -6,6 +6,7 @@ from schemas.users.user_schema import UserCreate, UserRead, UserUpdate
 from models import User
 from services.core.base_service import BaseService
 from services.core.security_service import hash_password
+from services.auth.principal_service import principal_cache
 
 class UserService(BaseService[User, UserRead, UserCreate, UserUpdate]):
     """Service for User domain logic with custom DNI validation."""
@@ -39,4 +40,13 @@ class UserService(BaseService[User, UserRead, UserCreate, UserUpdate]):
                 raise ValueError("Another user with this DNI already exists")
         if data.password:
             data.password = hash_password(data.password)
-        return super().update(id, data)
+        updated = super().update(id, data)
+        # Role / active flag may have changed
+        principal_cache.invalidate(id)
+        return updated
+
+    def delete(self, id: int) -> bool:
+        """Soft delete a user; its cached principal goes with it."""
+        deleted = super().delete(id)
+        principal_cache.invalidate(id)
+        return deleted
@@ -0,0 +1,63 @@
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+# config.py reads these at import time; app tests run on a throwaway SQLite file
+os.environ.setdefault("DB_ENGINE", "sqlite")
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.gettempdir(), "economy-tests.db"))
+os.environ.setdefault("APP_CONFIG", "testing")
+
+from models import Base  # noqa: E402
+from services.category_rules.rule_engine import rule_set_cache  # noqa: E402
+from services.core.query_budget_service import query_budget as _query_budget  # noqa: E402
+
+# JSONB-only table that SQLite cannot create
+_SQLITE_UNSUPPORTED_TABLES = {"import_profiles"}
+
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with the schema and one account/source/user/category per type."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[
+        table for name, table in Base.metadata.tables.items() if name not in _SQLITE_UNSUPPORTED_TABLES
+    ])
+    session = sessionmaker(bind=engine)()
+    for statement in (
+        "INSERT INTO banks (id, name, active) VALUES (1, 'bank', 1)",
+        "INSERT INTO accounts (id, name, iban, currency, active, balance, bank_id) "
+        "VALUES (1, 'account', 'ES00', 'EUR', 1, 0, 1)",
+        "INSERT INTO sources (id, name, active, type) VALUES (1, 'source', 1, 'EXPENSE')",
+        # Enum columns store the member name (UserRoleEnum.ADMIN), not its value
+        "INSERT INTO users (id, name, surname1, dni, password, active, role) "
+        "VALUES (1, 'user', 'test', '00000000T', 'x', 1, 'ADMIN')",
+        "INSERT INTO expenses_categories (id, name, active) VALUES (1, 'food', 1)",
+        "INSERT INTO incomes_categories (id, name, active) VALUES (1, 'salary', 1)",
+    ):
+        session.execute(text(statement))
+    session.commit()
+    rule_set_cache.invalidate()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+        rule_set_cache.invalidate()
+
+
+@pytest.fixture
+def query_budget():
+    """Factory for query budgets: with query_budget(max_statements=5, max_repeats=1): ..."""
+    return _query_budget
+
+
+@pytest.fixture
+def client():
+    """Flask test client of an app built with TestingConfig."""
+    from app import create_app
+    from config import TestingConfig
+
+    return create_app(TestingConfig).test_client()
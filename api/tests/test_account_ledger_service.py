@@ -0,0 +1,89 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy.orm import sessionmaker
+
+from schemas.expenses.expense_schema import ExpenseCreate, ExpenseUpdate
+from schemas.imports.import_schema import BulkImportRequest
+from services.expenses.expense_service import ExpenseService
+from services.finance.account_ledger_service import AccountLedgerService
+from services.imports.import_service import ImportService
+
+
+def _expense(day: str, amount: str, name: str = "shop") -> ExpenseCreate:
+    return ExpenseCreate(name=name, description=f"{name} {day} {amount}", amount=Decimal(amount), date=day,
+                         currency="EUR", source_id=1, category_id=1, account_id=1, user_id=1)
+
+
+def _ledger(db_session):
+    history = AccountLedgerService(db_session).get_history(1, date(2025, 1, 1), date(2025, 12, 31))
+    return [(point.date.isoformat(), point.delta, point.balance) for point in history.points]
+
+
+def test_writes_keep_running_balance_in_sync(db_session):
+    service = ExpenseService(db_session)
+    service.create(_expense("2025-01-10", "10"))
+    late = service.create(_expense("2025-01-20", "5"))
+    # Backdated write shifts every later balance
+    early = service.create(_expense("2025-01-05", "2"))
+
+    assert _ledger(db_session) == [
+        ("2025-01-05", Decimal("-2"), Decimal("-2")),
+        ("2025-01-10", Decimal("-10"), Decimal("-12")),
+        ("2025-01-20", Decimal("-5"), Decimal("-17")),
+    ]
+
+    service.update(late.id, ExpenseUpdate(amount=Decimal("8"), date=date(2025, 1, 15)))
+    service.delete(early.id)
+
+    assert _ledger(db_session) == [
+        ("2025-01-10", Decimal("-10"), Decimal("-10")),
+        ("2025-01-15", Decimal("-8"), Decimal("-18")),
+    ]
+    ledger = AccountLedgerService(db_session)
+    assert ledger.get_balance(1, date(2025, 1, 12)).balance == Decimal("-10")
+    assert ledger.get_balance(1, date(2024, 12, 31)).balance == Decimal("0")
+
+
+def test_bulk_import_matches_rebuild(db_session):
+    ImportService(db_session).import_transactions_atomic(BulkImportRequest(
+        auto_categorize=False,
+        expenses=[
+            {"name": f"e{i}", "description": f"shop {i}", "amount": 1 + i, "date": f"2025-02-{1 + i % 5:02d}",
+             "currency": "EUR", "user_id": 1, "source_id": 1, "category_id": 1, "account_id": 1}
+            for i in range(20)
+        ],
+        incomes=[
+            {"name": "pay", "description": "salary", "amount": 1000, "date": "2025-02-03",
+             "currency": "EUR", "source_id": 1, "category_id": 1, "account_id": 1}
+        ],
+    ))
+    incremental = _ledger(db_session)
+
+    AccountLedgerService(db_session).rebuild(1)
+
+    assert incremental == _ledger(db_session)
+    assert incremental[-1][2] == Decimal("1000") - sum(Decimal(1 + i) for i in range(20))
+
+
+def test_expenses_and_incomes_of_one_day_share_a_row_without_autoflush(db_session):
+    # Built like db.database.SessionFactory: the import stages expenses and
+    # then incomes in one transaction with no implicit flush in between
+    session = sessionmaker(bind=db_session.get_bind(), autocommit=False, autoflush=False)()
+    try:
+        result = ImportService(session).import_transactions_atomic(BulkImportRequest(
+            auto_categorize=False,
+            expenses=[
+                {"name": "e", "description": "shop", "amount": 30, "date": "2025-03-01",
+                 "currency": "EUR", "user_id": 1, "source_id": 1, "category_id": 1, "account_id": 1}
+            ],
+            incomes=[
+                {"name": "pay", "description": "salary", "amount": 100, "date": "2025-03-01",
+                 "currency": "EUR", "source_id": 1, "category_id": 1, "account_id": 1}
+            ],
+        ))
+    finally:
+        session.close()
+
+    assert result["inserted"] == 2
+    assert _ledger(db_session) == [("2025-03-01", Decimal("70"), Decimal("70"))]
@@ -0,0 +1,45 @@
+import os
+import runpy
+from pathlib import Path
+
+import pytest
+
+from config import CONFIGS, DevelopmentConfig, ProductionConfig, TestingConfig, get_config
+
+GUNICORN_CONF = Path(__file__).resolve().parents[1] / "gunicorn.conf.py"
+
+
+def test_get_config_by_name_and_environment(monkeypatch):
+    assert get_config("testing") is TestingConfig
+    monkeypatch.setenv("APP_CONFIG", "development")
+    assert get_config() is DevelopmentConfig
+    with pytest.raises(ValueError, match="APP_CONFIG"):
+        get_config("staging")
+
+
+def test_production_config_requires_a_jwt_secret(monkeypatch):
+    monkeypatch.setattr(ProductionConfig, "JWT_SECRET_KEY", None)
+    with pytest.raises(ValueError, match="JWT_SECRET_KEY"):
+        get_config("production")
+
+
+@pytest.mark.parametrize("name", sorted(CONFIGS))
+def test_every_selectable_config_has_what_create_app_reads(name):
+    config_class = CONFIGS[name]
+    for key in ("PREFIX", "CORS", "LANGUAGES"):
+        assert getattr(config_class, key, None), f"{name} lacks {key}"
+
+
+def test_gunicorn_sizes_the_pool_from_threads_and_import_workers(monkeypatch):
+    monkeypatch.delenv("DB_POOL_SIZE", raising=False)
+    monkeypatch.delenv("DB_MAX_OVERFLOW", raising=False)
+    monkeypatch.delenv("GUNICORN_MAX_REQUESTS", raising=False)
+    monkeypatch.setenv("GUNICORN_THREADS", "6")
+    monkeypatch.setenv("IMPORT_JOB_WORKERS", "3")
+
+    settings = runpy.run_path(str(GUNICORN_CONF))
+
+    assert settings["threads"] == 6
+    assert settings["max_requests"] == 0
+    assert os.environ["DB_POOL_SIZE"] == "9"
+    assert os.environ["DB_MAX_OVERFLOW"] == "2"
@@ -0,0 +1,57 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from models import DailySummary
+from schemas.expenses.expense_schema import ExpenseCreate, ExpenseUpdate
+from schemas.incomes.income_schema import IncomeCreate
+from services.expenses.expense_category_service import ExpensesCategoryService
+from services.expenses.expense_service import ExpenseService
+from services.incomes.income_service import IncomeService
+from services.summaries.daily_summary_service import DailySummaryService
+
+
+def _expense(day: str, amount: str, name: str = "shop") -> ExpenseCreate:
+    return ExpenseCreate(name=name, description=f"{name} {day} {amount}", amount=Decimal(amount), date=day,
+                         currency="EUR", source_id=1, category_id=1, account_id=1, user_id=1)
+
+
+def _rollup(db_session):
+    db_session.expire_all()
+    rows = db_session.execute(
+        select(DailySummary.date, DailySummary.type, DailySummary.category_id, DailySummary.total, DailySummary.count)
+        .where(DailySummary.count != 0)
+        .order_by(DailySummary.date, DailySummary.type, DailySummary.category_id)
+    )
+    return [(day, type_, category_id, Decimal(str(total)), count) for day, type_, category_id, total, count in rows]
+
+
+def test_writes_keep_rollup_in_sync_with_a_rebuild(db_session):
+    expenses = ExpenseService(db_session)
+    expenses.create(_expense("2025-03-01", "10"))
+    moved = expenses.create(_expense("2025-03-01", "4"))
+    removed = expenses.create(_expense("2025-03-02", "7"))
+    IncomeService(db_session).create(IncomeCreate(
+        description="salary", amount=Decimal("1000"), date="2025-03-01", currency="EUR",
+        dedup_hash="0" * 64, source_id=1, category_id=1, account_id=1
+    ))
+
+    expenses.update(moved.id, ExpenseUpdate(amount=Decimal("6"), date=date(2025, 3, 3)))
+    expenses.delete(removed.id)
+
+    incremental = _rollup(db_session)
+    assert incremental == [
+        (date(2025, 3, 1), "expense", 1, Decimal("10"), 1),
+        (date(2025, 3, 1), "income", 1, Decimal("1000"), 1),
+        (date(2025, 3, 3), "expense", 1, Decimal("6"), 1),
+    ]
+
+    DailySummaryService(db_session).rebuild()
+
+    assert _rollup(db_session) == incremental
+
+
+def test_non_transaction_services_do_not_build_rollup_services(db_session):
+    assert ExpensesCategoryService(db_session).daily_summary is None
+    assert ExpenseService(db_session).daily_summary is not None
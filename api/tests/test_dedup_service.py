@@ -1,4 +1,9 @@
-from services.core.dedup_service import generate_dedup_hash
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from services.core.dedup_service import generate_dedup_hash, generate_dedup_hashes
 
 
 def test_generate_dedup_hash_normalization_equivalence():
@@ -44,6 +49,26 @@ def test_duplicate_detection_via_set():
     assert len(seen) == 2
 
 
+def test_generate_dedup_hashes_matches_row_by_row():
+    rows = [
+        (1, '2026-03-30', '100.0', '  Compra  cafés '),
+        (1, date(2026, 3, 30), 100, 'compra cafés'),
+        (2, datetime(2026, 3, 30, 12, 5), Decimal('0.125'), None),
+        (2, '2026-03-30T08:00:00', 0.125, 'Test'),
+        # equal as dict keys, but str() differs and so does the rounding
+        (3, '2026-01-01', 2.675, 'x'),
+        (3, '2026-01-01', Decimal(2.675), 'x'),
+        (3, '2026-01-01', 2.675, 'x'),
+    ]
+
+    assert generate_dedup_hashes(rows) == [generate_dedup_hash(*row) for row in rows]
+
+
+def test_generate_dedup_hashes_requires_account():
+    with pytest.raises(ValueError):
+        generate_dedup_hashes([(None, '2026-03-30', 1, 'x')])
+
+
 def test_normalize_iban_before_unique_check():
     from services.finance.account_service import AccountService
 
@@ -0,0 +1,45 @@
+import csv
+import io
+import json
+from datetime import date, date as DateType
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from services.core import export_service
+from services.core.export_service import iter_csv, iter_ndjson
+
+
+class _Row(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    date: DateType
+    amount: Decimal
+    note: Optional[str] = None
+    id: int
+
+
+def _rows(n):
+    return (SimpleNamespace(id=i, date=date(2025, 1, 1), amount=Decimal("1.50"), note="a, \"b\"" if i else None)
+            for i in range(n))
+
+
+def test_ndjson_is_chunked_and_one_document_per_line(monkeypatch):
+    monkeypatch.setattr(export_service, "ROWS_PER_CHUNK", 2)
+
+    chunks = list(iter_ndjson(_rows(5), _Row))
+
+    assert len(chunks) == 3
+    lines = "".join(chunks).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [0, 1, 2, 3, 4]
+
+
+def test_csv_quotes_values_and_leaves_none_empty():
+    body = "".join(iter_csv(_rows(2), _Row))
+
+    rows = list(csv.reader(io.StringIO(body)))
+    assert rows[0] == ["id", "date", "amount", "note"]
+    assert rows[1] == ["0", "2025-01-01", "1.50", ""]
+    assert rows[2][3] == 'a, "b"'
@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+import pytest
+
+from models import Account, Source
+from services.core.fk_validation_service import (
+    ForeignKeyValidationError,
+    validate_foreign_keys_bulk,
+)
+
+
+class _Repository:
+    def __init__(self, existing):
+        self.existing = existing
+        self.queries = 0
+
+    def get_existing_ids(self, model, ids):
+        self.queries += 1
+        return set(ids) & self.existing[model]
+
+
+def test_bulk_validation_reports_every_offending_row_with_one_query_per_field():
+    repository = _Repository({Source: {1, 2}, Account: {10}})
+    items = [
+        SimpleNamespace(source_id=1, account_id=10),
+        SimpleNamespace(source_id=3, account_id=10),
+        SimpleNamespace(source_id=2, account_id=11),
+        SimpleNamespace(source_id=3, account_id=None),
+    ]
+
+    with pytest.raises(ForeignKeyValidationError) as exc_info:
+        validate_foreign_keys_bulk(
+            repository, items, {"source_id": Source, "account_id": Account}, "expenses"
+        )
+
+    assert repository.queries == 2
+    assert [(e["index"], e["field"], e["code"]) for e in exc_info.value.errors] == [
+        (1, "source_id", "SOURCE_NOT_FOUND"),
+        (2, "account_id", "ACCOUNT_NOT_FOUND"),
+        (3, "source_id", "SOURCE_NOT_FOUND"),
+    ]
+    assert exc_info.value.errors[0]["msg"] == "expenses[1].source_id=3: SOURCE_NOT_FOUND"
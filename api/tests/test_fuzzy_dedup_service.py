@@ -0,0 +1,72 @@
+from sqlalchemy import text
+
+from schemas.imports.import_schema import BulkImportRequest
+from services.imports.fuzzy_dedup_service import description_tokens, token_set_similarity
+from services.imports.import_service import ImportService
+
+
+def _expense(description, date, amount=42.5):
+    return {"name": "expense", "description": description, "amount": amount, "date": date,
+            "currency": "EUR", "user_id": 1, "source_id": 1, "category_id": 1, "account_id": 1}
+
+
+def test_reference_numbers_do_not_count_as_tokens():
+    a = description_tokens("COMPRA TARJ MERCADONA MADRID 1234")
+    b = description_tokens("Compra tarj. Mercadona  Madrid REF 998877 17/03")
+
+    assert a == {"compra", "tarj", "mercadona", "madrid"}
+    assert token_set_similarity(a, b) == 0.8
+    assert token_set_similarity(a, frozenset()) == 0.0
+
+
+def test_near_identical_rows_are_flagged_not_inserted(db_session):
+    service = ImportService(db_session)
+    service.import_transactions_atomic(BulkImportRequest(
+        auto_categorize=False, expenses=[_expense("COMPRA TARJ MERCADONA MADRID 1234", "2025-03-15")]
+    ))
+
+    result = service.import_transactions_atomic(BulkImportRequest(auto_categorize=False, expenses=[
+        # value date two days later, reference appended
+        _expense("COMPRA TARJ MERCADONA MADRID REF 998877", "2025-03-17"),
+        # same description, different amount
+        _expense("COMPRA TARJ MERCADONA MADRID 1234", "2025-03-15", amount=42.6),
+        # outside the date window
+        _expense("COMPRA TARJ MERCADONA MADRID 1234", "2025-03-25"),
+    ]))
+
+    assert result["inserted"] == 2
+    assert result["duplicates"] == 0
+    assert len(result["possible_duplicates"]) == 1
+    flagged = result["possible_duplicates"][0]
+    assert flagged["date"] == "2025-03-17"
+    assert flagged["matches"] == [1]
+
+    forced = service.import_transactions_atomic(BulkImportRequest(
+        auto_categorize=False, fuzzy_dedup=False,
+        expenses=[_expense("COMPRA TARJ MERCADONA MADRID REF 998877", "2025-03-17")],
+    ))
+    assert forced["inserted"] == 1
+    assert forced["possible_duplicates"] == []
+
+
+def test_chunk_boundaries_do_not_change_what_is_held_back(db_session):
+    db_session.execute(text(
+        "INSERT INTO accounts (id, name, iban, currency, active, balance, bank_id) "
+        "VALUES (2, 'other', 'ES01', 'EUR', 1, 0, 1)"
+    ))
+    db_session.commit()
+    service = ImportService(db_session)
+
+    def recurring(account_id):
+        # Same charge three days running, then a different shop
+        rows = [_expense("NETFLIX.COM SUBSCRIPTION", f"2025-04-{day:02d}") for day in (1, 2, 3)]
+        rows.append(_expense("SPOTIFY SUBSCRIPTION", "2025-04-02"))
+        return BulkImportRequest(auto_categorize=False, expenses=[{**row, "account_id": account_id} for row in rows])
+
+    one_chunk = service.import_transactions_in_chunks(recurring(1), chunk_size=10)
+    per_row = service.import_transactions_in_chunks(recurring(2), chunk_size=1)
+
+    for result in (one_chunk, per_row):
+        assert result["inserted"] == 2
+        assert [row["date"] for row in result["possible_duplicates"]] == ["2025-04-02", "2025-04-03"]
+    assert all(row["matches"] for row in one_chunk["possible_duplicates"])
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from models import ImportJobStatusEnum
+from models.imports import ImportJob
+from repositories.imports import import_job_repository
+from repositories.imports.import_job_repository import ImportJobRepository, utc_now
+from schemas.imports.import_schema import BulkImportRequest
+from services.imports import import_job_service
+from services.imports.import_job_service import ImportJobRunner, ImportJobService
+
+
+class _RecordingRunner(ImportJobRunner):
+    """Runs nothing in the background: submitted ids are only recorded."""
+
+    def __init__(self, db_session):
+        super().__init__(session_factory=lambda: Session(bind=db_session.get_bind()))
+        self.submitted = []
+
+    def submit(self, job_id):
+        self.submitted.append(job_id)
+
+
+def _request(account_id=1, rows=5):
+    return BulkImportRequest(auto_categorize=False, fuzzy_dedup=False, expenses=[
+        {"name": f"e{i}", "description": f"shop {i}", "amount": 1 + i, "date": "2025-01-02",
+         "currency": "EUR", "user_id": 1, "source_id": 1, "category_id": 1, "account_id": account_id}
+        for i in range(rows)
+    ])
+
+
+def _job(db_session, job_id):
+    db_session.expire_all()
+    return db_session.get(ImportJob, job_id)
+
+
+def test_job_is_claimed_once_and_reports_progress_per_chunk(db_session, monkeypatch):
+    monkeypatch.setattr(import_job_service, "IMPORT_JOB_CHUNK_SIZE", 2)
+    progress = []
+    update_progress = ImportJobRepository.update_progress
+
+    def recording_update_progress(self, job_id, **values):
+        progress.append(values.get("processed_rows"))
+        update_progress(self, job_id, **values)
+
+    monkeypatch.setattr(ImportJobRepository, "update_progress", recording_update_progress)
+    runner = _RecordingRunner(db_session)
+    job = ImportJobService(db_session, runner=runner).enqueue(_request(), user_id=1)
+    assert runner.submitted == [job.id]
+
+    runner.run(job.id)
+    # Already claimed: a second run is a no-op
+    runner.run(job.id)
+
+    stored = _job(db_session, job.id)
+    assert stored.status == ImportJobStatusEnum.COMPLETED
+    assert stored.attempts == 1
+    assert (stored.processed_rows, stored.inserted) == (5, 5)
+    assert stored.payload is None
+    assert progress == [2, 4, 5, None]
+
+
+def test_foreign_key_errors_fail_the_job(db_session):
+    runner = _RecordingRunner(db_session)
+    job = ImportJobService(db_session, runner=runner).enqueue(_request(account_id=99), user_id=1)
+
+    runner.run(job.id)
+
+    stored = _job(db_session, job.id)
+    assert stored.status == ImportJobStatusEnum.FAILED
+    assert stored.inserted == 0
+    assert stored.payload is None
+    assert stored.errors and all(error["field"] == "account_id" for error in stored.errors)
+
+
+def test_stale_running_jobs_are_requeued_and_resubmitted(db_session):
+    runner = _RecordingRunner(db_session)
+    service = ImportJobService(db_session, runner=runner)
+    stale = service.enqueue(_request(), user_id=1)
+    fresh = service.enqueue(_request(), user_id=1)
+    queued = service.enqueue(_request(), user_id=1)
+    repository = ImportJobRepository(db_session)
+    assert repository.claim(stale.id) and repository.claim(fresh.id)
+    db_session.execute(
+        update(ImportJob).where(ImportJob.id == stale.id)
+        .values(updated_at=utc_now() - timedelta(seconds=import_job_service.STALE_JOB_SECONDS + 60))
+    )
+    db_session.commit()
+    runner.submitted.clear()
+
+    runner.resume_pending()
+
+    assert runner.submitted == [stale.id, queued.id]
+    assert _job(db_session, stale.id).status == ImportJobStatusEnum.QUEUED
+    assert _job(db_session, fresh.id).status == ImportJobStatusEnum.RUNNING
+
+
+def test_stopping_runner_hands_the_running_job_back_to_the_queue(db_session):
+    runner = _RecordingRunner(db_session)
+    job = ImportJobService(db_session, runner=runner).enqueue(_request(), user_id=1)
+    runner._stopping.set()
+
+    runner.run(job.id)
+
+    stored = _job(db_session, job.id)
+    assert stored.status == ImportJobStatusEnum.QUEUED
+    assert stored.inserted == 0
+    assert stored.payload is not None
+
+
+def test_claim_stamps_the_job_with_the_queue_clock(db_session, monkeypatch):
+    # The stale cutoff is on utc_now(); a claim stamped by the database
+    # clock (its local time) could look stale right away
+    claimed_at = datetime(2025, 6, 1, 12, 0, 0)
+    runner = _RecordingRunner(db_session)
+    job = ImportJobService(db_session, runner=runner).enqueue(_request(), user_id=1)
+    monkeypatch.setattr(import_job_repository, "utc_now", lambda: claimed_at)
+
+    assert ImportJobRepository(db_session).claim(job.id)
+    db_session.commit()
+
+    stored = _job(db_session, job.id)
+    assert stored.started_at == stored.updated_at == claimed_at
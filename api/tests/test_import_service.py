@@ -0,0 +1,68 @@
+from datetime import date
+
+from sqlalchemy import func, select
+
+from models import Expense
+from repositories.expenses.expense_repository import ExpenseRepository
+from schemas.imports.import_schema import BulkImportRequest
+from services.core.dedup_service import generate_dedup_hash
+from services.imports.import_service import ImportService
+
+
+def _expense(description, amount=10, category_id=1):
+    return {"name": "expense", "description": description, "amount": amount, "date": "2025-01-02",
+            "currency": "EUR", "user_id": 1, "source_id": 1, "category_id": category_id, "account_id": 1}
+
+
+def _expense_row(description, amount=10):
+    return {"name": "expense", "description": description, "amount": amount, "date": date(2025, 1, 2),
+            "currency": "EUR", "user_id": 1, "source_id": 1, "category_id": 1, "account_id": 1,
+            "ignore_in_analysis": False, "dedup_hash": generate_dedup_hash(1, "2025-01-02", amount, description)}
+
+
+def _stored_expenses(db_session):
+    return db_session.execute(select(func.count()).select_from(Expense)).scalar_one()
+
+
+def test_bulk_insert_ignore_conflicts_skips_existing_keys(db_session):
+    repository = ExpenseRepository(db_session)
+    first = repository.bulk_insert_ignore_conflicts([_expense_row("coffee"), _expense_row("bread", 3)])
+    assert len(first) == 2
+
+    again = repository.bulk_insert_ignore_conflicts(
+        [_expense_row("coffee"), _expense_row("milk", 2)], returning=("id", "description")
+    )
+
+    assert [row.description for row in again] == ["milk"]
+    assert _stored_expenses(db_session) == 3
+
+
+def test_duplicates_are_counted_in_batch_and_against_stored_rows(db_session):
+    service = ImportService(db_session)
+    service.import_transactions_atomic(BulkImportRequest(
+        auto_categorize=False, fuzzy_dedup=False, expenses=[_expense("coffee")]
+    ))
+
+    result = service.import_transactions_atomic(BulkImportRequest(
+        auto_categorize=False, fuzzy_dedup=False,
+        # stored already, repeated in the batch (normalized description), new
+        expenses=[_expense("coffee"), _expense("bread", 3), _expense("  BREAD ", 3), _expense("milk", 2)],
+    ))
+
+    assert result["inserted"] == 2
+    assert result["duplicates"] == 2
+    assert result["uncategorized"] == 0
+    assert result["total"] == 4
+    assert _stored_expenses(db_session) == 3
+
+
+def test_rows_without_category_are_skipped_as_uncategorized(db_session):
+    result = ImportService(db_session).import_transactions_atomic(BulkImportRequest(
+        auto_categorize=False, fuzzy_dedup=False,
+        expenses=[_expense("coffee"), _expense("unknown", category_id=None)],
+    ))
+
+    assert result["inserted"] == 1
+    assert result["duplicates"] == 0
+    assert result["uncategorized"] == 1
+    assert _stored_expenses(db_session) == 1
@@ -0,0 +1,80 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import text
+
+from models import ActionEnum
+from schemas.investments.investment_log_schema import InvestmentLogCreate, InvestmentLogUpdate
+from services.investments.investment_log_service import InvestmentLogService
+from services.investments.investment_position_service import (
+    InvestmentPositionService,
+    LogState,
+    Position,
+    apply_log,
+)
+
+
+def _log(day: int, action: ActionEnum, units=None, price=None, value="100") -> LogState:
+    return LogState(None, 1, date(2025, 1, day), action,
+                    Decimal(units) if units else None, Decimal(price) if price else None, Decimal(value))
+
+
+def test_fifo_and_average_cost_of_a_partial_sell():
+    logs = [
+        _log(1, ActionEnum.BUY, "10", "10"),
+        _log(2, ActionEnum.BUY, "10", "20"),
+        _log(3, ActionEnum.SELL, "15", "30", value="150"),
+        _log(4, ActionEnum.HOLD, value="170"),
+    ]
+    fifo, average = Position(), Position()
+    for log in logs:
+        apply_log(fifo, log, "fifo")
+        apply_log(average, log, "average")
+
+    # FIFO sells the 10 @ 10 lot and 5 of the 10 @ 20 lot
+    assert (fifo.units, fifo.cost_basis, fifo.realized_pnl) == (Decimal("5"), Decimal("100"), Decimal("250"))
+    assert fifo.lots == [[Decimal("5"), Decimal("20")]]
+    assert (average.units, average.cost_basis, average.realized_pnl) == (Decimal("5"), Decimal("75"), Decimal("225"))
+    assert fifo.market_value == average.market_value == Decimal("170")
+
+
+def test_log_writes_keep_positions_in_sync_with_a_rebuild(db_session):
+    db_session.execute(text("INSERT INTO investments_categories (id, name, active) VALUES (1, 'funds', 1)"))
+    db_session.execute(text(
+        "INSERT INTO investments (id, description, date, currency, amount, dedup_hash, account_id, category_id) "
+        "VALUES (1, 'index fund', '2025-01-01', 'EUR', 100, 'h', 1, 1)"
+    ))
+    db_session.commit()
+
+    service = InvestmentLogService(db_session)
+
+    def create(day, action, units=None, price=None, value="100"):
+        return service.create(InvestmentLogCreate(
+            date=date(2025, 1, day), action=action, units_bought=units, price_per_unit=price,
+            current_value=Decimal(value), investment_id=1,
+        ))
+
+    create(10, ActionEnum.BUY, Decimal("10"), Decimal("10"), "100")
+    sell = create(20, ActionEnum.SELL, Decimal("4"), Decimal("15"), "90")
+    # Backdated buy replays the later sell
+    backdated = create(5, ActionEnum.BUY, Decimal("2"), Decimal("5"), "10")
+    service.update(sell.id, InvestmentLogUpdate(units_bought=Decimal("6")))
+    service.delete(backdated.id)
+    create(25, ActionEnum.HOLD, value="80")
+
+    positions = InvestmentPositionService(db_session, "fifo")
+    incremental = positions.get_valuation(1, date(2025, 1, 1), date(2025, 1, 31)).points
+    positions.rebuild(1)
+    rebuilt = positions.get_valuation(1, date(2025, 1, 1), date(2025, 1, 31)).points
+
+    assert incremental == rebuilt
+    assert [(p.date.day, p.units, p.realized_pnl) for p in rebuilt] == [
+        (10, Decimal("10"), Decimal("0")),
+        (20, Decimal("4"), Decimal("30")),
+        (25, Decimal("4"), Decimal("30")),
+    ]
+
+    portfolio = positions.get_portfolio()
+    assert [(p.investment_id, p.market_value, p.unrealized_pnl) for p in portfolio.positions] == \
+        [(1, Decimal("80"), Decimal("40"))]
+    assert portfolio.totals[0].market_value == Decimal("80")
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from services.core.metrics_service import (
+    MetricsRegistry,
+    end_request,
+    install_query_listeners,
+    server_timing_header,
+    start_request,
+    track_phase,
+)
+
+
+def test_queries_are_counted_only_inside_a_request():
+    engine = create_engine("sqlite://")
+    install_query_listeners(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        metrics = start_request()
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+        with track_phase("json"):
+            pass
+        assert end_request() is metrics
+        conn.execute(text("SELECT 3"))
+
+    assert metrics.query_count == 2
+    assert "json" in metrics.phases
+    assert server_timing_header(metrics, 0.01).startswith('db;dur=')
+
+
+def test_failed_statements_leave_nothing_behind_on_the_connection():
+    engine = create_engine("sqlite://")
+    install_query_listeners(engine)
+
+    with engine.connect() as conn:
+        metrics = start_request()
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+        end_request()
+
+        assert metrics.query_count == 1
+        assert metrics.query_seconds < 1
+        assert not conn.info
+
+
+def test_registry_renders_cumulative_histogram():
+    registry = MetricsRegistry()
+    for seconds in (0.003, 0.2, 20):
+        metrics = start_request()
+        metrics.query_count = 3
+        registry.record("expenses.list_expenses", "GET", 200, end_request(), seconds)
+
+    body = registry.render()
+    labels = 'endpoint="expenses.list_expenses",method="GET",status="200"'
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.005"}} 1' in body
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.25"}} 2' in body
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in body
+    assert f"db_queries_total{{{labels}}} 9" in body
@@ -0,0 +1,43 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import SavingLog
+from repositories.savings.saving_log_repository import SavingLogRepository
+from services.core.pagination_service import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    cursor = encode_cursor(date(2025, 3, 1), 42)
+
+    assert decode_cursor(cursor) == (date(2025, 3, 1), 42)
+    assert decode_cursor(None) is None
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+
+def test_keyset_pages_cover_every_row_once_in_date_id_order():
+    engine = create_engine("sqlite://")
+    SavingLog.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    for i in range(7):
+        # Two rows per day to exercise the id tie-breaker
+        db.add(SavingLog(date=date(2025, 1, 1) + timedelta(days=i // 2), amount=i, saving_id=1 + i % 2, source_id=1))
+    db.commit()
+    repository = SavingLogRepository(db)
+
+    seen, after = [], None
+    while True:
+        rows = repository.get_page(after=after, limit=3)
+        seen.extend(row.id for row in rows[:3])
+        if len(rows) <= 3:
+            break
+        after = (rows[2].date, rows[2].id)
+
+    expected = [r.id for r in sorted(db.query(SavingLog).all(), key=lambda r: (r.date, r.id), reverse=True)]
+    assert seen == expected
+    assert [r.saving_id for r in repository.get_page({"saving_id": 2}, limit=10)] == [2, 2, 2]
+    with pytest.raises(ValueError):
+        repository.get_page({"card_id": 1})
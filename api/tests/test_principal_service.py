@@ -0,0 +1,48 @@
+import pytest
+
+from models.core.enums import UserRoleEnum
+from schemas.users.user_schema import UserUpdate
+from services.auth.principal_service import Principal, PrincipalCache, get_principal, principal_cache
+from services.users.user_service import UserService
+
+
+@pytest.fixture(autouse=True)
+def _empty_principal_cache():
+    principal_cache.invalidate()
+    yield
+    principal_cache.invalidate()
+
+
+def test_principal_is_loaded_once(db_session, query_budget):
+    principal = get_principal(db_session, "1")
+    assert principal.role == UserRoleEnum.ADMIN
+    assert principal.active
+
+    with query_budget(max_statements=0):
+        assert get_principal(db_session, 1) is principal
+
+
+def test_user_update_invalidates_principal(db_session):
+    assert get_principal(db_session, 1).active
+
+    UserService(db_session).update(1, UserUpdate(active=False, role=UserRoleEnum.USER))
+
+    principal = get_principal(db_session, 1)
+    assert not principal.active
+    assert principal.role == UserRoleEnum.USER
+
+
+def test_cache_is_bounded_and_drops_loads_raced_by_invalidation():
+    cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+    for user_id in (1, 2, 3):
+        cache.get(user_id, lambda user_id=user_id: Principal(user_id, UserRoleEnum.USER, True, None, frozenset()))
+    calls = []
+    cache.get(1, lambda: calls.append(1))
+    assert calls == [1]
+
+    def stale_loader():
+        cache.invalidate(4)
+        return Principal(4, UserRoleEnum.ADMIN, True, None, frozenset())
+
+    cache.get(4, stale_loader)
+    assert cache.get(4, lambda: None) is None
@@ -0,0 +1,82 @@
+import threading
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from schemas.imports.import_schema import BulkImportRequest
+from services.core.query_budget_service import QueryBudgetExceeded, statement_shape
+from services.imports.import_service import ImportService
+from services.summaries.summary_service import SummaryService
+
+
+def test_statement_shape_masks_literals_and_in_lists():
+    assert statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?) AND name = 'x'") == \
+        "SELECT * FROM t WHERE id IN (?) AND name = ?"
+    assert statement_shape("SELECT id FROM t1 WHERE a = %(a_1)s LIMIT 10") == \
+        "SELECT id FROM t1 WHERE a = ? LIMIT ?"
+
+
+def test_repeated_shape_is_reported(db_session, query_budget):
+    with pytest.raises(QueryBudgetExceeded, match="3x"):
+        with query_budget(max_repeats=2):
+            for account_id in (1, 2, 3):
+                db_session.execute(text("SELECT id FROM accounts WHERE id = :id"), {"id": account_id})
+
+
+def test_bulk_import_query_count_does_not_grow_with_rows(db_session, query_budget):
+    # One row per day: a statement per (account, day) in the rollup or the
+    # ledger would repeat its shape hundreds of times
+    first_day = date(2025, 1, 1)
+    data = BulkImportRequest(
+        auto_categorize=False,
+        expenses=[
+            {"name": f"e{i}", "description": f"shop {i}", "amount": 1 + i,
+             "date": (first_day + timedelta(days=i)).isoformat(),
+             "currency": "EUR", "user_id": 1, "source_id": 1, "category_id": 1, "account_id": 1}
+            for i in range(300)
+        ],
+        incomes=[
+            {"name": f"i{i}", "description": f"pay {i}", "amount": 10 + i,
+             "date": (first_day + timedelta(days=3 * i)).isoformat(),
+             "currency": "EUR", "source_id": 1, "category_id": 1, "account_id": 1}
+            for i in range(100)
+        ],
+    )
+
+    with query_budget(max_statements=20, max_repeats=2) as budget:
+        result = ImportService(db_session).import_transactions_atomic(data)
+
+    assert result["inserted"] == 400
+    assert budget.count <= 20
+
+
+def test_summary_is_a_single_statement(db_session, query_budget):
+    for use_rollup in (True, False):
+        with query_budget(max_statements=1):
+            SummaryService(db_session, use_rollup=use_rollup).get_summary(date(2025, 1, 1), date(2025, 1, 31))
+
+
+def _query_elsewhere():
+    with create_engine("sqlite://").connect() as conn:
+        for _ in range(3):
+            conn.execute(text("SELECT 1"))
+
+
+def test_budgets_only_count_their_own_thread(db_session, query_budget):
+    other_thread = threading.Thread(target=_query_elsewhere)
+    with query_budget(max_statements=1) as budget:
+        other_thread.start()
+        other_thread.join()
+        db_session.execute(text("SELECT 1"))
+
+    assert budget.count == 1
+
+
+def test_decorated_function_gets_a_fresh_budget_per_call(db_session, query_budget):
+    @query_budget(max_statements=1)
+    def one_statement():
+        db_session.execute(text("SELECT 1"))
+
+    one_statement()
+    one_statement()
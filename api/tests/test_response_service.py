@@ -0,0 +1,43 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+from flask import Flask
+from pydantic import BaseModel
+
+from services.core.response_service import Response, encode_models
+
+
+class _Row(BaseModel):
+    id: int
+    amount: Decimal
+    date: date
+
+
+def test_encode_models_single_list_and_empty():
+    rows = [
+        _Row(id=1, amount=Decimal("10.50"), date=date(2025, 1, 31)),
+        _Row(id=2, amount=Decimal("3"), date=date(2025, 2, 1)),
+    ]
+
+    assert json.loads(encode_models(rows)) == [
+        {"id": 1, "amount": "10.50", "date": "2025-01-31"},
+        {"id": 2, "amount": "3", "date": "2025-02-01"},
+    ]
+    assert json.loads(encode_models(rows[0]))["id"] == 1
+    assert encode_models([]) == b"[]"
+
+
+def test_ok_models_keeps_the_response_envelope():
+    row = _Row(id=1, amount=Decimal("1"), date=date(2025, 1, 1))
+    with Flask(__name__).app_context():
+        data = Response.ok_models([row], "Listed", 200, "test")
+        single = Response.ok_models(row, "Found", 201, "test")
+        page = Response.ok_models_page([row], "abc", "Listed", 200, "test")
+
+    assert data.status_code == 200 and data.mimetype == "application/json"
+    assert data.get_json() == {"response": [{"id": 1, "amount": "1", "date": "2025-01-01"}], "details": "Listed"}
+    assert page.get_json()["next_cursor"] == "abc"
+    # Single-item reads and creates share the list format (ISO dates)
+    assert single.status_code == 201
+    assert single.get_json() == {"response": {"id": 1, "amount": "1", "date": "2025-01-01"}, "details": "Found"}
@@ -0,0 +1,21 @@
+import pytest
+from flask import Flask
+
+from routers import disabled_router_groups, register_blueprints
+
+
+def test_disabled_groups_are_not_registered():
+    full, core = Flask(__name__), Flask(__name__)
+    register_blueprints(full)
+    register_blueprints(core, disabled_groups=disabled_router_groups(" ai, imports "))
+
+    assert set(full.blueprints) - set(core.blueprints) == {
+        "transactions_ai", "imports", "import_origins", "import_profiles"
+    }
+
+
+def test_unknown_or_core_groups_are_rejected():
+    with pytest.raises(ValueError, match="core"):
+        disabled_router_groups("core")
+    with pytest.raises(ValueError, match="reports"):
+        disabled_router_groups("ai,reports")
@@ -0,0 +1,93 @@
+from models import CategoryRule, TransactionEnum
+from services.category_rules.rule_engine import CompiledRuleSet, RuleSetCache
+
+
+def _rule(id, pattern, priority, category_id, ignore=False):
+    return CategoryRule(
+        id=id,
+        name=f"rule {id}",
+        pattern=pattern,
+        type=TransactionEnum.EXPENSE,
+        priority=priority,
+        is_active=True,
+        ignore_in_analysis=ignore,
+        category_id=category_id,
+    )
+
+
+def test_rule_set_returns_highest_priority_match():
+    rule_set = CompiledRuleSet(TransactionEnum.EXPENSE, [
+        _rule(1, "amazon", 10, 100),
+        _rule(2, r"amazon\s+prime", 50, 200, ignore=True),
+        _rule(3, "[invalid", 90, 300),
+    ])
+
+    assert len(rule_set) == 2
+    match = rule_set.match("AMAZON Prime Video")
+    assert match.category_id == 200
+    assert match.ignore_in_analysis is True
+    assert rule_set.match("Amazon EU").category_id == 100
+    assert rule_set.match("mercadona") is None
+
+
+def test_rule_set_cache_loads_once_until_invalidated():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [_rule(1, "mercadona", 10, 5)]
+
+    cache = RuleSetCache(ttl_seconds=60)
+    first = cache.get(TransactionEnum.EXPENSE, loader)
+    second = cache.get(TransactionEnum.EXPENSE, loader)
+    assert first is second
+    assert len(calls) == 1
+
+    cache.invalidate(TransactionEnum.INCOME)
+    cache.get(TransactionEnum.EXPENSE, loader)
+    assert len(calls) == 1
+
+    cache.invalidate(TransactionEnum.EXPENSE)
+    cache.get(TransactionEnum.EXPENSE, loader)
+    assert len(calls) == 2
+
+
+def test_aho_corasick_finds_overlapping_keywords():
+    from services.category_rules.aho_corasick import AhoCorasick
+
+    automaton = AhoCorasick([("he", 3), ("she", 5), ("hers", 1), ("his", 2)])
+
+    assert automaton.find_all("ushers") == {1, 3, 5}
+    assert automaton.find_all("xyz") == set()
+
+
+def test_required_literal_is_conservative():
+    from services.category_rules.rule_engine import required_literal
+
+    assert required_literal(r"amazon\s+prime") == "amazon"
+    assert required_literal(r"^RECIBO\s+(luz|agua)") == "recibo"
+    assert required_literal(r"amazon|ebay") is None
+    assert required_literal(r"ab?c") is None
+
+
+def test_rule_set_matches_like_sequential_rule_loop():
+    rules = [
+        _rule(1, "mercadona", 100, 1),
+        _rule(2, "super", 90, 2),
+        _rule(3, r"^bizum\b", 80, 3),
+        _rule(4, r"(a)mazon.*\1", 70, 4),
+        _rule(5, r"recibo\s+\w+", 60, 5),
+        _rule(6, "amazon", 50, 6),
+        _rule(7, r"\d{4}", 40, 7),
+    ]
+    rule_set = CompiledRuleSet(TransactionEnum.EXPENSE, rules)
+    descriptions = [
+        "MERCADONA 1234 MADRID", "Supermercado DIA", "Bizum de Ana", "pago bizum",
+        "AMAZON marketplace", "amazon prime a", "Recibo LUZ enero", "TPV 9876",
+        "nada que ver", "", "recibo  agua super",
+    ]
+
+    for description in descriptions:
+        expected = next((r.category_id for r in rules if description and r.matches(description)), None)
+        match = rule_set.match(description)
+        assert (match.category_id if match else None) == expected, description
@@ -0,0 +1,100 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import text
+
+from schemas.savings.saving_log_schema import SavingLogCreate, SavingLogUpdate
+from schemas.savings.saving_progress_schema import SavingProgressQuery
+from services.savings.saving_analytics_service import SavingAnalyticsService
+from services.savings.saving_log_service import SavingLogService
+
+
+def _seed_saving(db_session):
+    db_session.execute(text(
+        "INSERT INTO savings (id, description, amount, date, currency, account_id) "
+        "VALUES (1, 'holidays', 1000, '2025-01-01', 'EUR', 1)"
+    ))
+    db_session.commit()
+
+
+def _totals(db_session):
+    rows = db_session.execute(text(
+        "SELECT date, amount, total_amount FROM savings_logs WHERE deleted_at IS NULL ORDER BY date, id"
+    ))
+    return [(day, Decimal(str(amount)), Decimal(str(total))) for day, amount, total in rows]
+
+
+def test_log_writes_keep_running_totals_and_recompute_fixes_drift(db_session):
+    _seed_saving(db_session)
+    service = SavingLogService(db_session)
+
+    def create(day, amount, total=None):
+        return service.create(SavingLogCreate(date=day, amount=Decimal(amount), total_amount=total,
+                                              saving_id=1, source_id=1))
+
+    first = create("2025-01-10", "100", total=Decimal("999"))
+    later = create("2025-02-10", "50")
+    # Backdated log shifts the later totals
+    backdated = create("2025-01-05", "20")
+    assert first.total_amount == Decimal("100")
+
+    service.update(later.id, SavingLogUpdate(date=date(2025, 1, 7), amount=Decimal("30")))
+    service.delete(backdated.id)
+    create("2025-03-01", "10")
+
+    assert _totals(db_session) == [
+        ("2025-01-07", Decimal("30"), Decimal("30")),
+        ("2025-01-10", Decimal("100"), Decimal("130")),
+        ("2025-03-01", Decimal("10"), Decimal("140")),
+    ]
+
+    analytics = SavingAnalyticsService(db_session)
+    assert analytics.recompute_totals() == 0
+    db_session.execute(text("UPDATE savings_logs SET total_amount = 1 WHERE id = :id"), {"id": first.id})
+    db_session.commit()
+    assert analytics.recompute_totals(1) == 1
+    assert _totals(db_session)[1][2] == Decimal("130")
+
+
+def test_moving_a_log_forward_does_not_count_its_old_total(db_session):
+    _seed_saving(db_session)
+    service = SavingLogService(db_session)
+    logs = [
+        service.create(SavingLogCreate(date=day, amount=Decimal(amount), saving_id=1, source_id=1))
+        for day, amount in (("2025-01-01", "10"), ("2025-01-05", "5"), ("2025-01-10", "20"))
+    ]
+
+    moved = service.update(logs[1].id, SavingLogUpdate(date=date(2025, 1, 7)))
+
+    assert moved.total_amount == Decimal("15")
+    assert _totals(db_session) == [
+        ("2025-01-01", Decimal("10"), Decimal("10")),
+        ("2025-01-07", Decimal("5"), Decimal("15")),
+        ("2025-01-10", Decimal("20"), Decimal("35")),
+    ]
+    # Past the last log as well
+    service.update(logs[1].id, SavingLogUpdate(date=date(2025, 1, 20)))
+    assert _totals(db_session)[-1] == ("2025-01-20", Decimal("5"), Decimal("35"))
+    assert SavingAnalyticsService(db_session).recompute_totals() == 0
+
+
+def test_progress_buckets_by_month_and_week(db_session):
+    _seed_saving(db_session)
+    service = SavingLogService(db_session)
+    for day, amount in (("2025-01-06", "10"), ("2025-01-12", "20"), ("2025-01-13", "5"), ("2025-02-03", "15")):
+        service.create(SavingLogCreate(date=day, amount=Decimal(amount), saving_id=1, source_id=1))
+
+    analytics = SavingAnalyticsService(db_session)
+    monthly = analytics.get_progress(SavingProgressQuery()).series
+    assert [(p.period, p.deposited, p.total_amount) for p in monthly[0].points] == [
+        (date(2025, 1, 1), Decimal("35"), Decimal("35")),
+        (date(2025, 2, 1), Decimal("15"), Decimal("50")),
+    ]
+
+    weekly = analytics.get_progress(SavingProgressQuery(interval="week", date_from=date(2025, 1, 7))).series
+    assert weekly[0].description == "holidays"
+    assert [(p.period, p.deposited, p.total_amount) for p in weekly[0].points] == [
+        (date(2025, 1, 6), Decimal("20"), Decimal("30")),
+        (date(2025, 1, 13), Decimal("5"), Decimal("35")),
+        (date(2025, 2, 3), Decimal("15"), Decimal("50")),
+    ]
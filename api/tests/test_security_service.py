@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+from flask import Flask
+
+from app import create_app
+from config import TestingConfig
+from services.core.rate_limit_service import login_email_key
+from services.core.security_service import (
+    PasswordHashingBusyError,
+    _BoundedHasher,
+    hash_password,
+    verify_password,
+)
+
+
+def test_hash_and_verify_round_trip():
+    hashed = hash_password("s3cret")
+
+    assert verify_password("s3cret", hashed)
+    assert not verify_password("other", hashed)
+
+
+def test_hasher_rejects_work_beyond_workers_and_queue():
+    hasher = _BoundedHasher(workers=1, queue_limit=0)
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return True
+
+    worker = threading.Thread(target=hasher.run, args=(slow,))
+    worker.start()
+    started.wait(5)
+    try:
+        with pytest.raises(PasswordHashingBusyError):
+            hasher.run(lambda: True)
+    finally:
+        release.set()
+        worker.join()
+    assert hasher.run(lambda: "free again") == "free again"
+
+
+def test_login_email_key_is_normalized():
+    app = Flask(__name__)
+    with app.test_request_context(json={"email": "  User@Example.com "}):
+        assert login_email_key() == "login-email:user@example.com"
+    with app.test_request_context(data="not json"):
+        assert login_email_key() == "login-email:"
+
+
+class _LimitedConfig(TestingConfig):
+    RATELIMIT_ENABLED = True
+    LOGIN_RATE_LIMIT_IP = "2 per minute"
+    LOGIN_RATE_LIMIT_EMAIL = "100 per minute"
+    PROXY_FIX_HOPS = 1
+
+
+def test_login_ip_limit_counts_each_forwarded_client():
+    client = create_app(_LimitedConfig).test_client()
+
+    def login(ip, attempt):
+        # Invalid body: answered with 400 before any DB access, but still counted
+        return client.post("/api/auth/login", json={"email": f"{ip}-{attempt}@example.com"},
+                           headers={"X-Forwarded-For": ip}).status_code
+
+    assert [login("203.0.113.1", i) for i in range(3)] == [400, 400, 429]
+    assert login("203.0.113.2", 0) == 400
@@ -0,0 +1,68 @@
+import io
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from services.imports.statement_reader import (
+    StatementFormatError,
+    parse_amount,
+    read_statement,
+)
+
+COLUMNS = {
+    "date": ["fecha operacion", "fecha"],
+    "description": ["concepto"],
+    "amount": ["importe"],
+}
+
+
+def test_parse_amount_handles_european_and_english_formats():
+    assert parse_amount("1.501,70") == Decimal("1501.70")
+    assert parse_amount("1,501.70") == Decimal("1501.70")
+    assert parse_amount("-12,5 €") == Decimal("-12.5")
+    assert parse_amount("") is None
+    assert parse_amount("n/a") is None
+
+
+def test_read_statement_maps_profile_aliases_after_header_row():
+    content = (
+        "Extracto cuenta;;\n"
+        "Fecha Operación;Concepto;Importe (€)\n"
+        "30/03/2026;MERCADONA MADRID;-45,20\n"
+        "31/03/2026;Nómina;1.500,00\n"
+        "31/03/2026;Sin importe;\n"
+        "fecha mala;Otro;-1,00\n"
+    ).encode("utf-8")
+    skipped = []
+
+    rows = list(read_statement(io.BytesIO(content), "statement.csv", COLUMNS,
+                               header_row=2, skipped=skipped))
+
+    assert [(r.date, r.description, r.amount) for r in rows] == [
+        (date(2026, 3, 30), "MERCADONA MADRID", Decimal("-45.20")),
+        (date(2026, 3, 31), "Nómina", Decimal("1500.00")),
+    ]
+    assert skipped == [6]
+
+
+def test_read_statement_reads_xlsx():
+    openpyxl = pytest.importorskip("openpyxl")
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Fecha", "Concepto", "Importe"])
+    sheet.append([date(2026, 1, 2), "Bizum", -10.5])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+
+    rows = list(read_statement(buffer, "statement.xlsx", COLUMNS))
+
+    assert [(r.date, r.amount) for r in rows] == [(date(2026, 1, 2), Decimal("-10.5"))]
+
+
+def test_read_statement_rejects_unmapped_columns():
+    content = io.BytesIO(b"Date,Text,Value\n2026-01-01,x,1\n")
+
+    with pytest.raises(StatementFormatError):
+        list(read_statement(content, "statement.csv", COLUMNS))
@@ -0,0 +1,55 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import text
+
+from models import TransactionEnum
+from schemas.imports.import_schema import BulkImportRequest
+from services.expenses.expense_service import ExpenseService
+from services.imports.import_service import ImportService
+from services.summaries.daily_summary_service import DailySummaryService
+from services.summaries.summary_service import SummaryService
+
+
+def test_union_all_summary_matches_the_rollup(db_session):
+    db_session.execute(text("INSERT INTO expenses_categories (id, name, active) VALUES (2, 'rent', 1)"))
+    db_session.execute(text("INSERT INTO investments_categories (id, name, active) VALUES (1, 'funds', 1)"))
+    db_session.commit()
+    ImportService(db_session).import_transactions_atomic(BulkImportRequest(
+        auto_categorize=False, fuzzy_dedup=False,
+        expenses=[
+            {"name": f"e{i}", "description": f"shop {i}", "amount": 5 + i, "date": f"2025-04-{1 + i % 3:02d}",
+             "currency": "EUR", "user_id": 1, "source_id": 1, "category_id": 1 + i % 2, "account_id": 1}
+            for i in range(8)
+        ] + [
+            # outside the range on both ends
+            {"name": "old", "description": "old", "amount": 50, "date": "2025-03-31",
+             "currency": "EUR", "user_id": 1, "source_id": 1, "category_id": 1, "account_id": 1},
+            {"name": "new", "description": "new", "amount": 50, "date": "2025-05-01",
+             "currency": "EUR", "user_id": 1, "source_id": 1, "category_id": 1, "account_id": 1},
+        ],
+        incomes=[
+            {"name": "pay", "description": "salary", "amount": 1500, "date": "2025-04-02",
+             "currency": "EUR", "source_id": 1, "category_id": 1, "account_id": 1}
+        ],
+    ))
+    db_session.execute(text(
+        "INSERT INTO investments (id, description, date, currency, amount, dedup_hash, account_id, category_id) "
+        "VALUES (1, 'index fund', '2025-04-03', 'EUR', 300, 'h', 1, 1)"
+    ))
+    DailySummaryService(db_session).record_change(
+        TransactionEnum.INVESTMENT, None, (date(2025, 4, 3), 1, Decimal("300"))
+    )
+    db_session.commit()
+    # Soft-deleted rows count in neither path
+    ExpenseService(db_session).delete(1)
+
+    start, end = date(2025, 4, 1), date(2025, 4, 30)
+    union_all = SummaryService(db_session, use_rollup=False).get_summary(start, end)
+    rollup = SummaryService(db_session, use_rollup=True).get_summary(start, end)
+
+    assert union_all == rollup
+    assert union_all.income_vs_expense.count_transactions == 9
+    assert {(row.type, row.category_id) for row in union_all.totals_by_category} == {
+        ("expense", 1), ("expense", 2), ("income", 1), ("investment", 1)
+    }
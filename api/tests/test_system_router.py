@@ -0,0 +1,9 @@
+def test_readiness_is_public(client):
+    response = client.get("/api/system/ready")
+
+    assert response.status_code == 200
+    assert response.get_json()["response"]["status"] == "ready"
+
+
+def test_metrics_require_a_token(client):
+    assert client.get("/api/system/metrics").status_code == 401
@@ -0,0 +1,57 @@
+import json
+from types import SimpleNamespace
+
+import services.ai.transaction_ai_service as ai
+
+
+def test_chunks_fit_one_server_slot_and_keep_every_transaction():
+    service = ai.TransactionAIService(db=None)
+    categories = [SimpleNamespace(name=f"Category {i}", description="") for i in range(10)]
+    transactions = [
+        {"id": i, "type": "expense", "description": f"COMPRA TARJETA COMERCIO {i}", "amount": -i}
+        for i in range(300)
+    ]
+
+    chunks = service._chunk_transactions("expense", transactions, categories)
+
+    slot_tokens = ai.AI_CTX_SIZE // ai.AI_PARALLEL_SLOTS
+    for chunk in chunks:
+        prompt = ai.SYSTEM_PROMPT + service._build_prompt(
+            "expense",
+            [service._tx_payload(tx) for tx in chunk],
+            service._categories_payload(categories),
+        )
+        completion = max(120, len(chunk) * ai.AI_OUTPUT_TOKENS_PER_TX)
+        assert service._estimate_tokens(prompt) + completion <= slot_tokens
+    assert [tx["id"] for chunk in chunks for tx in chunk] == list(range(300))
+
+
+def test_failed_chunk_does_not_drop_other_predictions(monkeypatch):
+    service = ai.TransactionAIService(db=None)
+    monkeypatch.setattr(ai, "AI_MAX_TX_PER_CHUNK", 2)
+
+    def classify_batch(type_, transactions, categories):
+        if transactions[0]["id"] == 0:
+            raise RuntimeError("slot crashed")
+        return {tx["id"]: {"id": 1} for tx in transactions}
+
+    monkeypatch.setattr(service, "_classify_batch", classify_batch)
+    categories = [SimpleNamespace(id=1, name="Food", description="")]
+    transactions = [{"id": i, "description": json.dumps(i), "amount": 1} for i in range(6)]
+
+    predictions = service._classify_concurrently({"expense": transactions}, {"expense": categories})
+
+    assert sorted(predictions) == [2, 3, 4, 5]
+
+
+def test_cache_key_masks_digits_and_version_tracks_categories():
+    from services.ai.classification_cache_service import category_version, description_key
+
+    service = ai.TransactionAIService(db=None)
+    first = description_key(service._normalize_text("MERCADONA 1234  Madrid"))
+    second = description_key(service._normalize_text("Mercadona 98 MADRID"))
+    assert first == second == "mercadona # madrid"
+
+    categories = [SimpleNamespace(id=1, name="Food", description=""), SimpleNamespace(id=2, name="Car", description="")]
+    assert category_version(categories) == category_version(list(reversed(categories)))
+    assert category_version(categories) != category_version(categories[:1])
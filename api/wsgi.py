@@ -0,0 +1,12 @@
+"""
+WSGI entry point for production servers.
+
+    gunicorn --config gunicorn.conf.py wsgi:app
+
+Uses ProductionConfig unless APP_CONFIG says otherwise.
+"""
+import os
+
+os.environ.setdefault("APP_CONFIG", "production")
+
+from app import app  # noqa: E402,F401